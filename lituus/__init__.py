@@ -20,7 +20,14 @@ Contains:
  pack.py super class for a set of cards
  mtgdeck.py defines a constructed MTG deck
  edhdeck.py defiens a constructed EDH deck
- mtgcard.py defines the MTGCard class - a wrapper around a card dict
+ deckindex.py MinHash/LSH index for finding similar decks
+ cedhdb.py bulk loader for the cEDH decklist database
+ benchmark.py import time budget & pipeline benchmarks
+ synth.py synthetic scaling corpora recombined from real oracle lines
+ export.py sharded JSONL export of tagged oracle text and trees w/ manifest
+ bundle.py single-file bundle of checksummed, (optionally) compressed sections
+ download.py conditional, resumable downloads verified by checksum
+ mtgcard.py defines the MTGCard class - a compact representation of a card dict
  multiverse.py MTGCard generator for all cEDH legal cards in the multiverse
  scrape.py scraper for online decks
 
@@ -57,6 +64,7 @@ EPARAM   =  5 # Parameter Error
 EDATA    =  6 # Data Error
 EATTR    =  7 # Attribute Error
 EIMPL    =  8 # ImplementationError
+ETIMEOUT =  9 # Timed out
 # MTGL RELATED
 EMTGL    = 10 # Generic MTGL Error
 ETAG     = 11 # MTGL Tag Error
@@ -0,0 +1,467 @@
+#!/usr/bin/env python
+""" benchmark.py
+Copyright (C) 2019  Temporal Inept (temporalinept@mail.com)
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+Benchmarks for lituus.
+ 1. imports: tracks the cold start import time of the lituus modules (using
+  python -X importtime) against a budget and checks that modules do not pull in
+  the heavy (networking, html parsing, tagging & graphing) modules they do not
+  need
+ 2. pipeline: times each stage of the pipeline (tagging, tokenizing, untagging,
+  list matching, graphing, tree loading & decoding (vs networkx unpickling),
+  tree queries, pack histograms and deck loading) over a corpus of a few
+  thousand cards saving the results as json and comparing them to a saved
+  baseline. The corpus is the checked in bench_corpus.json in resources, the
+  seed cards (bench_cards.json covering keyword, modal, saga, level up, split
+  and vote cards and the bench deck) filled up with a sample of AllCards.json
+  or if AllCards.json has not been downloaded with synthetic cards recombined
+  from the seed cards' lines (see make_corpus)
+Run as
+ python -m lituus.benchmark [imports] [n runs]
+ python -m lituus.benchmark pipeline [n runs] [save]
+ python -m lituus.benchmark corpus [n cards]
+where save makes the results the new baseline and corpus rebuilds
+bench_corpus.json (baselines of the previous corpus are no longer comparable)
+"""
+
+#__name__ = 'benchmark'
+__license__ = 'GPLv3'
+__version__ = '0.0.1'
+__date__ = 'August 2020'
+__author__ = 'Temporal Inept'
+__maintainer__ = 'Temporal Inept'
+__email__ = 'temporalinept@mail.com'
+__status__ = 'Development'
+
+import os
+import sys
+import json
+import time
+import pickle
+import platform
+import subprocess
+import regex as re
+import lituus as lts
+import lituus.mtg as mtg
+
+# file paths
+pth_seed = os.path.join(mtg.pth_resources,'bench_cards.json')
+pth_corpus = os.path.join(mtg.pth_resources,'bench_corpus.json')
+pth_deck = os.path.join(mtg.pth_resources,'bench_deck.dec')
+pth_results = os.path.join(mtg.pth_sto,'benchmark.json')
+pth_baseline = os.path.join(mtg.pth_sto,'benchmark_baseline.json')
+
+# commanders of the bench deck
+deck_cmdrs = "Thrasios, Triton Hero/Tymna the Weaver"
+
+# number of cards in the corpus
+corpus_size = 3000
+
+# a stage is a regression if slower than the baseline by more than tolerance
+tolerance = 0.25
+
+# module -> cumulative import time budget (ms) of a cold start
+import_budgets = {
+    'lituus.mtgcard':40,
+    'lituus.pack':40,
+    'lituus.mtgdeck':40,
+    'lituus.edhdeck':40,
+    'lituus.deckindex':40,
+    'lituus.cedhdb':60,
+    'lituus.multiverse':60,
+    'lituus.mtgl.tagger':60,
+}
+
+# heavy modules only loaded when their features are used
+heavy = [
+    'bs4','requests','http.server','concurrent.futures','networkx',
+    'lituus.mtgl.tagger','lituus.mtgl.grapher'
+]
+
+# module -> heavy modules the module may import
+import_allowed = {
+    'lituus.mtgl.tagger':['lituus.mtgl.tagger'],
+    'lituus.cedhdb':['concurrent.futures'], # loads the decks in parallel
+}
+
+def import_time(mod,n=5):
+    """
+     measures the cold start import of mod in a new interpreter
+    :param mod: the module name i.e. 'lituus.pack'
+    :param n: number of runs, the fastest is kept
+    :return: tuple t = (ms,imports) where ms is the cumulative import time of mod
+     and imports is a dict module name -> cumulative import time (ms) of each
+     module imported
+    """
+    env = dict(os.environ)
+    pth = os.path.dirname(os.path.dirname(os.path.abspath(lts.__file__)))
+    env['PYTHONPATH'] = os.pathsep.join(
+        [pth] + ([env['PYTHONPATH']] if env.get('PYTHONPATH') else [])
+    )
+    best = None
+    for _ in range(n):
+        p = subprocess.run(
+            [sys.executable,'-X','importtime','-c','import {}'.format(mod)],
+            env=env,stdout=subprocess.PIPE,stderr=subprocess.PIPE,
+            universal_newlines=True
+        )
+        if p.returncode:
+            raise lts.LituusException(
+                lts.EIMPL,"Failed importing {}\n{}".format(mod,p.stderr)
+            )
+        imports = _parse_importtime_(p.stderr)
+        if mod not in imports:
+            raise lts.LituusException(lts.EDATA,"No import time for {}".format(mod))
+        if best is None or imports[mod] < best[0]: best = (imports[mod],imports)
+    return best
+
+def check_imports(budgets=None,n=5):
+    """
+     checks the cold start import of each module in budgets
+    :param budgets: dict module -> budget (ms) (default import_budgets)
+    :param n: number of runs per module
+    :return: list of tuples t = (module,ms,budget,heavy modules imported) and
+     the list of modules that are over budget or import a heavy module they
+     should not
+    """
+    budgets = budgets if budgets else import_budgets
+    rs,fails = [],[]
+    for mod in budgets:
+        ms,imports = import_time(mod,n)
+        hs = [
+            h for h in heavy
+            if h in imports and h not in import_allowed.get(mod,[])
+        ]
+        rs.append((mod,ms,budgets[mod],hs))
+        if ms > budgets[mod] or hs: fails.append(mod)
+    return rs,fails
+
+####
+# PIPELINE
+####
+
+# card category -> predicate of the json card (see sample_corpus)
+categories = {
+    'keyword':lambda jc: bool(jc.get('text')) and '\n' not in jc['text'] and
+                         '.' not in jc['text'],
+    'modal':lambda jc: '•' in jc.get('text',""),
+    'saga':lambda jc: 'Saga' in jc.get('subtypes',[]),
+    'level-up':lambda jc: jc.get('layout') == 'leveler',
+    'split':lambda jc: jc.get('layout') in ['split','aftermath','adventure'],
+    'vote':lambda jc: 'vote' in jc.get('text',""),
+}
+
+def make_corpus(n=corpus_size,fout=None):
+    """
+     builds the benchmark corpus of n cards, sampling AllCards.json (see
+     sample_corpus) or if it has not been downloaded, synthesizing the cards
+     beyond the seed cards from the seed cards' lines (see synth.synthesize,
+     seeded)
+    :param n: number of cards in the corpus
+    :param fout: path to write the corpus to (default is bench_corpus.json)
+    :return: the corpus dict name -> json card
+    """
+    import lituus.multiverse as multiverse
+    if os.path.exists(multiverse.jpath): return sample_corpus(n=n,fout=fout)
+    import lituus.synth as synth
+    jv = _read_corpus_(pth_seed)
+    fill = synth.synthesize(jv,max(0,n-len(jv)))
+    for cname in fill: jv.setdefault(cname,fill[cname])
+    _write_corpus_(jv,fout if fout else pth_corpus)
+    return jv
+
+def sample_corpus(f=None,n=corpus_size,fout=None,k=100):
+    """
+     samples the legal cards of AllCards.json for the benchmark corpus, taking
+     the seed cards (bench_cards.json), up to k cards of each category (with
+     both halves of split cards) and filling the sample up to n cards with
+     every ith remaining card. The sample only depends on AllCards.json and n,k
+    :param f: path to AllCards.json (default is the one in resources)
+    :param n: number of cards in the sample
+    :param fout: path to write the sample to (default is bench_corpus.json)
+    :param k: number of cards per category
+    :return: the sampled dict name -> json card
+    """
+    import lituus.multiverse as multiverse
+    fin = None
+    try:
+        fin = open(f if f else multiverse.jpath)
+        jv = json.load(fin)
+        fin.close()
+    except IOError:
+        raise lts.LituusException(lts.EIOIN,"Error reading AllCards.json")
+    finally:
+        if fin: fin.close()
+
+    legal = [
+        c for c in sorted(jv)
+        if jv[c].get('legalities',{}).get('commander') == 'Legal'
+    ]
+    sample = {c:jv[c] for c in _read_corpus_(pth_seed) if c in jv}
+    for cat in categories:
+        for cname in [c for c in legal if categories[cat](jv[c])][:k]:
+            for c in jv[cname].get('names',[cname]):
+                if c in jv: sample[c] = jv[c]
+    rest = [c for c in legal if c not in sample]
+    step = max(1,len(rest) // max(1,n-len(sample)))
+    for cname in rest[::step]:
+        if len(sample) >= n: break
+        sample[cname] = jv[cname]
+
+    _write_corpus_(sample,fout if fout else pth_corpus)
+    return sample
+
+def load_corpus(f=None):
+    """
+     loads the benchmark corpus
+    :param f: path of the corpus (default is bench_corpus.json)
+    :return: dict name -> json card
+    """
+    import lituus.multiverse as multiverse
+    return multiverse._hack_cards_(_read_corpus_(f if f else pth_corpus))
+
+def pipeline(jv=None,n=5):
+    """
+     times the stages of the pipeline over the corpus jv. Each stage is run n
+     times over the entire corpus keeping the fastest
+    :param jv: dict name -> json card (default is the benchmark corpus)
+    :param n: number of runs per stage
+    :return: dict stage -> {'n':items,'s':seconds,'us':microseconds per item}
+    """
+    from hashlib import md5
+    import lituus.multiverse as multiverse
+    import lituus.mtgcard as mtgcard
+    import lituus.pack as pack
+    import lituus.edhdeck as edhdeck
+    import lituus.mtgl.lexer as lexer
+    import lituus.mtgl.mtgltag as mtgltag
+    import lituus.mtgl.list_util as ll
+    import lituus.mtgl.tagger as tagger
+    import lituus.mtgl.grapher as grapher
+    import lituus.mtgl.mtgt as mtgt
+
+    jv = jv if jv else load_corpus()
+    ctx = tagger.TaggerContext({c:md5(c.encode()).hexdigest() for c in jv})
+    dcards = {c:multiverse.harvest(c,jv[c]) for c in jv}
+    rs = {}
+
+    # tag & tokenize
+    tags = _time_(
+        rs,'tag',n,len(dcards),
+        lambda: {c:tagger.tag(c,dcards[c]['oracle'],ctx) for c in dcards}
+    )
+    for c in dcards: dcards[c]['tag'] = tags[c]
+    lines = _time_(
+        rs,'tokenize',n,len(tags),
+        lambda: [l for c in tags for l in lexer.tokenize(tags[c])]
+    )
+
+    # untag each tag token and match token patterns in each line
+    tkns = [t for l in lines for t in l if mtgltag.is_tag(t)]
+    _time_(rs,'untag',n,len(tkns),lambda: [mtgltag.untag(t) for t in tkns])
+    ptrns = [
+        ['xq<target>'],
+        [re.compile(r"^xq<"),re.compile(r"^(?:ob|xp|xo)<")],
+        [re.compile(r"^[kx]a<"),re.compile(r"^xq<")],
+        [re.compile(r"^ob<"),',','or',re.compile(r"^ob<")],
+    ]
+    _time_(
+        rs,'matchl',n,len(lines)*len(ptrns),
+        lambda: [ll.matchl(l,p) for l in lines for p in ptrns]
+    )
+
+    # graph and query the trees
+    trees = _time_(
+        rs,'graph',n,len(dcards),
+        lambda: [
+            grapher.graph({'name':c,'tag':dcards[c]['tag'],'type':dcards[c]['type']})
+            for c in dcards
+        ]
+    )
+    pkl = pickle.dumps(trees,-1)
+    _time_(rs,'tree-load',n,len(trees),lambda: pickle.loads(pkl))
+    encs = [t.encode() for t in trees]
+    _time_(rs,'tree-decode',n,len(trees),lambda: mtgt.decode_many(encs))
+    nxs = pickle.dumps([(c,t.tree) for c,t in zip(dcards,trees)],-1) # eager reference
+    _time_(
+        rs,'tree-nx-load',n,len(trees),
+        lambda: [mtgt.MTGTree(c,tree=t) for c,t in pickle.loads(nxs)]
+    )
+    ntypes = ['thing','action-clause','quantifier','keyword','conditional']
+    _time_(
+        rs,'tree-query',n,len(trees),
+        lambda: [
+            (t.nodes(),t.children('root'),[t.findall(nt) for nt in ntypes])
+            for t in trees
+        ]
+    )
+
+    # pack histograms and deck loading
+    mv = pack.Pack()
+    for c in dcards: mv.add_card(mtgcard.MTGCard(dcards[c]))
+    _time_(
+        rs,'pack-hist',n,len(mv),
+        lambda: (
+            mv.color_hist(),mv.type_hist(),mv.cmc_hist(),mv.mana_sym_hist(),
+            mv.basic_hist(),mv.gold_hist(),mv.cumulative_cmc_hist(),mv.avg_cmc()
+        )
+    )
+    deck = _time_(
+        rs,'deck-load',n,1,
+        lambda: edhdeck.EDHDeck(deck_cmdrs,pth_deck,mv=mv)
+    )
+    rs['deck-load']['n'] = deck.qty() # per card
+    rs['deck-load']['us'] = rs['deck-load']['s']/max(1,deck.qty())*1e6
+    return rs
+
+def save_results(rs,f=None):
+    """
+     saves the pipeline results rs with the platform as json to f (default is
+     benchmark.json in sto)
+    """
+    f = f if f else pth_results
+    try:
+        os.makedirs(os.path.dirname(f),exist_ok=True)
+        with open(f,'w') as fout:
+            json.dump(
+                {
+                    'date':time.strftime('%Y-%m-%d %H:%M:%S'),
+                    'python':platform.python_version(),
+                    'machine':platform.machine(),
+                    'stages':rs,
+                },fout,indent=1
+            )
+    except IOError as e:
+        raise lts.LituusException(lts.EIOOUT,"Failed saving results {}".format(e))
+
+def load_results(f=None):
+    """
+     loads saved pipeline results (default is the baseline)
+    :return: dict stage -> results or None if there are no saved results
+    """
+    try:
+        with open(f if f else pth_baseline) as fin: return json.load(fin)['stages']
+    except FileNotFoundError:
+        return None
+    except (IOError,ValueError,KeyError) as e:
+        raise lts.LituusException(lts.EIOIN,"Failed loading results {}".format(e))
+
+def compare(rs,base,tol=None):
+    """
+     compares pipeline results rs to baseline results base
+    :param rs: current results
+    :param base: baseline results
+    :param tol: tolerance (default is tolerance)
+    :return: list of tuples t = (stage,baseline us,current us,ratio) of stages
+     slower than the baseline by more than tol
+    """
+    tol = tolerance if tol is None else tol
+    slow = []
+    for stage in rs:
+        if stage not in base: continue
+        b,c = base[stage]['us'],rs[stage]['us']
+        if b and c > b*(1+tol): slow.append((stage,b,c,c/b))
+    return slow
+
+def main(argv):
+    """ runs the imports or pipeline benchmark printing results """
+    args = argv[1:]
+    if args and args[0] == 'pipeline': return _main_pipeline_(args[1:])
+    if args and args[0] == 'corpus':
+        jv = make_corpus(int(args[1]) if len(args) > 1 else corpus_size)
+        print("Wrote {} cards to {}".format(len(jv),pth_corpus))
+        return 0
+    if args and args[0] == 'imports': args = args[1:]
+    n = int(args[0]) if args else 5
+    rs,fails = check_imports(n=n)
+    print("{:<24} {:>9} {:>9}  heavy imports".format('module','ms','budget'))
+    for mod,ms,budget,hs in rs:
+        print(
+            "{:<24} {:>9.1f} {:>9} {} {}".format(
+                mod,ms,budget,'!' if mod in fails else ' ',", ".join(hs)
+            )
+        )
+    return 1 if fails else 0
+
+####
+# PRIVATE FCTS
+####
+
+def _main_pipeline_(args):
+    """ runs the pipeline benchmark with args [n runs] [save] """
+    n = int(args[0]) if args and args[0].isdigit() else 5
+    rs = pipeline(n=n)
+    base = load_results()
+    print("{:<12} {:>7} {:>10} {:>11} {:>11}".format(
+        'stage','n','total ms','us/item','baseline')
+    )
+    for stage in rs:
+        r = rs[stage]
+        b = "{:11.1f}".format(base[stage]['us']) if base and stage in base else ' '*11
+        print("{:<12} {:>7} {:>10.1f} {:>11.1f} {}".format(
+            stage,r['n'],r['s']*1000,r['us'],b)
+        )
+    save_results(rs)
+    if 'save' in args:
+        save_results(rs,pth_baseline)
+        return 0
+    slow = compare(rs,base) if base else []
+    for stage,b,c,x in slow:
+        print("{} is {:.0%} slower than the baseline".format(stage,x-1))
+    return 1 if slow else 0
+
+def _read_corpus_(f):
+    """ reads the json cards in f """
+    try:
+        with open(f,encoding='utf-8') as fin: return json.load(fin)
+    except (IOError,ValueError):
+        raise lts.LituusException(lts.EIOIN,"Error reading benchmark corpus")
+
+def _write_corpus_(jv,f):
+    """ writes the json cards jv to f """
+    try:
+        with open(f,'w',encoding='utf-8') as fout:
+            json.dump(jv,fout,indent=1,ensure_ascii=False)
+    except IOError as e:
+        raise lts.LituusException(lts.EIOOUT,"Failed writing corpus {}".format(e))
+
+def _time_(rs,stage,n,items,fct):
+    """
+     runs fct n times keeping the fastest time in rs[stage]
+    :param rs: the results dict
+    :param stage: stage name
+    :param n: number of runs
+    :param items: number of items processed by fct
+    :param fct: the function to time
+    :return: the value returned by fct
+    """
+    best = ret = None
+    for _ in range(n):
+        start = time.perf_counter()
+        ret = fct()
+        el = time.perf_counter() - start
+        if best is None or el < best: best = el
+    rs[stage] = {'n':items,'s':best,'us':best/max(1,items)*1e6}
+    return ret
+
+def _parse_importtime_(err):
+    """
+     parses the -X importtime output err
+    :return: dict module -> cumulative time (ms)
+    """
+    imports = {}
+    for line in err.splitlines():
+        if not line.startswith('import time:'): continue
+        try:
+            _,cum,name = line[len('import time:'):].split('|')
+            imports[name.strip()] = int(cum) / 1000
+        except ValueError: # the header
+            continue
+    return imports
+
+if __name__ == '__main__': sys.exit(main(sys.argv))
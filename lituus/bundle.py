@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+""" bundle.py
+Copyright (C) 2019  Temporal Inept (temporalinept@mail.com)
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+A single file of named, pickled sections (i.e. the multiverse, transformed
+cards and name references) w/ a versioned header and a sha256 checksum per
+section. Sections are optionally compressed in chunks which are (de)compressed
+in parallel, bundles are written to a temporary file and atomically replace the
+old bundle and a section can be read w/o reading the others. The layout is
+ MAGIC (4 bytes) header length (4 bytes, big endian) header (json) sections
+where the header lists each section's name, offset (from the end of the
+header), compressed chunk lengths, raw length and checksum
+"""
+
+#__name__ = 'bundle'
+__license__ = 'GPLv3'
+__version__ = '0.0.1'
+__date__ = 'August 2020'
+__author__ = 'Temporal Inept'
+__maintainer__ = 'Temporal Inept'
+__email__ = 'temporalinept@mail.com'
+__status__ = 'Development'
+
+import os
+import json
+import time
+import zlib
+import pickle
+import struct
+import hashlib
+import lituus as lts
+
+MAGIC = b'LTSB'
+BUNDLE_VERSION = 1
+chunk_size = 1 << 20 # bytes per compressed chunk
+level = 6            # zlib compression level
+
+def write(f,sections,compress=True,workers=None):
+    """
+     writes the sections to the bundle f atomically (the bundle is written to a
+     temporary file which replaces f once complete)
+    :param f: path of the bundle
+    :param sections: dict name -> object (pickled) in the order to write
+    :param compress: if set, sections are compressed in chunks
+    :param workers: number of threads (de)compressing chunks (default is the
+     ThreadPoolExecutor default)
+    :return: the header
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    hdr = {
+        'version':BUNDLE_VERSION,
+        'date':time.strftime('%Y-%m-%d %H:%M:%S'),
+        'codec':'zlib' if compress else None,
+        'sections':[],
+    }
+    blobs = []
+    off = 0
+    with ThreadPoolExecutor(workers) as pool:
+        for name,obj in sections.items():
+            try:
+                raw = pickle.dumps(obj,pickle.HIGHEST_PROTOCOL)
+            except pickle.PickleError as e:
+                raise lts.LituusException(
+                    lts.EIOOUT,"Failed pickling {} ({})".format(name,e)
+                )
+            cs = [raw[i:i+chunk_size] for i in range(0,len(raw),chunk_size)]
+            if compress: cs = list(pool.map(lambda c: zlib.compress(c,level),cs))
+            ls = [len(c) for c in cs]
+            hdr['sections'].append({
+                'name':name,
+                'offset':off,
+                'chunks':ls,
+                'raw':len(raw),
+                'sha256':hashlib.sha256(raw).hexdigest(),
+            })
+            off += sum(ls)
+            blobs.extend(cs)
+
+    # write to a temporary file then replace the bundle
+    hb = json.dumps(hdr).encode('utf-8')
+    tmp = "{}.{}.tmp".format(f,os.getpid())
+    try:
+        with open(tmp,'wb') as fout:
+            fout.write(MAGIC + struct.pack('>I',len(hb)) + hb)
+            for b in blobs: fout.write(b)
+            fout.flush()
+            os.fsync(fout.fileno())
+        os.replace(tmp,f)
+    except OSError as e:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise lts.LituusException(lts.EIOOUT,"Failed writing bundle {}".format(e))
+    return hdr
+
+def header(f):
+    """
+     reads the header of bundle f
+    :param f: path of the bundle
+    :return: the header dict
+    """
+    try:
+        with open(f,'rb') as fin: return _header_(fin)[0]
+    except FileNotFoundError:
+        raise lts.LituusException(lts.EIOIN,"Bundle {} does not exist".format(f))
+    except OSError as e:
+        raise lts.LituusException(lts.EIOIN,"Failed reading bundle {}".format(e))
+
+def read(f,names=None,workers=None):
+    """
+     reads sections of bundle f verifying their checksums
+    :param f: path of the bundle
+    :param names: list of section names to read (default is all sections)
+    :param workers: number of threads decompressing chunks
+    :return: dict name -> object
+    """
+    ret = {}
+    try:
+        with open(f,'rb') as fin:
+            hdr,start = _header_(fin)
+            ss = {s['name']:s for s in hdr['sections']}
+            for name in names if names is not None else list(ss):
+                if name not in ss:
+                    raise lts.LituusException(
+                        lts.EDATA,"Bundle has no section {}".format(name)
+                    )
+                ret[name] = _section_(fin,start,ss[name],hdr['codec'],workers)
+    except FileNotFoundError:
+        raise lts.LituusException(lts.EIOIN,"Bundle {} does not exist".format(f))
+    except OSError as e:
+        raise lts.LituusException(lts.EIOIN,"Failed reading bundle {}".format(e))
+    return ret
+
+def verify(f):
+    """
+     verifies the checksums of all sections of bundle f w/o unpickling them
+    :param f: path of the bundle
+    :return: list of section names failing verification
+    """
+    bad = []
+    try:
+        with open(f,'rb') as fin:
+            hdr,start = _header_(fin)
+            for s in hdr['sections']:
+                try:
+                    _raw_(fin,start,s,hdr['codec'],None)
+                except lts.LituusException:
+                    bad.append(s['name'])
+    except OSError as e:
+        raise lts.LituusException(lts.EIOIN,"Failed reading bundle {}".format(e))
+    return bad
+
+####
+# PRIVATE FCTS
+####
+
+def _header_(fin):
+    """ reads the header returning it & the offset of the sections """
+    pre = fin.read(8)
+    if len(pre) != 8 or pre[:4] != MAGIC:
+        raise lts.LituusException(lts.EDATA,"Not a lituus bundle")
+    n = struct.unpack('>I',pre[4:])[0]
+    try:
+        hdr = json.loads(fin.read(n).decode('utf-8'))
+    except ValueError:
+        raise lts.LituusException(lts.EDATA,"Corrupt bundle header")
+    if hdr.get('version') != BUNDLE_VERSION:
+        raise lts.LituusException(
+            lts.EDATA,"Unsupported bundle version {}".format(hdr.get('version'))
+        )
+    return hdr,8+n
+
+def _raw_(fin,start,s,codec,workers):
+    """ reads, decompresses & verifies the raw (pickled) bytes of section s """
+    fin.seek(start+s['offset'])
+    cs = []
+    for n in s['chunks']:
+        c = fin.read(n)
+        if len(c) != n:
+            raise lts.LituusException(lts.EDATA,"Truncated section {}".format(s['name']))
+        cs.append(c)
+    try:
+        if codec == 'zlib':
+            if len(cs) > 1:
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(workers) as pool: cs = list(pool.map(zlib.decompress,cs))
+            else: cs = [zlib.decompress(c) for c in cs]
+    except zlib.error:
+        raise lts.LituusException(lts.EDATA,"Corrupt section {}".format(s['name']))
+    raw = b''.join(cs)
+    if len(raw) != s['raw'] or hashlib.sha256(raw).hexdigest() != s['sha256']:
+        raise lts.LituusException(lts.EDATA,"Checksum mismatch in {}".format(s['name']))
+    return raw
+
+def _section_(fin,start,s,codec,workers):
+    """ reads and unpickles section s """
+    raw = _raw_(fin,start,s,codec,workers)
+    try:
+        return pickle.loads(raw)
+    except (pickle.PickleError,EOFError,AttributeError) as e:
+        raise lts.LituusException(
+            lts.EIOIN,"Failed unpickling {} ({})".format(s['name'],e)
+        )
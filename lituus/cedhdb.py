@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+""" cedhdb.py
+Copyright (C) 2019  Temporal Inept (temporalinept@mail.com)
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+Bulk loader for the cEDH Decklist Database (Primary Database tsv). Parses the
+database into deck records and builds the EDHDecks of those records having a
+local decklist file
+"""
+
+#__name__ = 'cedhdb'
+__license__ = 'GPLv3'
+__version__ = '0.0.1'
+__date__ = 'May 2020'
+__author__ = 'Temporal Inept'
+__maintainer__ = 'Temporal Inept'
+__email__ = 'temporalinept@mail.com'
+__status__ = 'Development'
+
+import os
+import csv
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+import lituus as lts
+import lituus.mtg as mtg
+import lituus.edhdeck as edhdeck
+
+# file paths
+dbpath = os.path.join(
+    mtg.pth_resources,'cEDH - Decklist Database - Primary Database.tsv'
+)
+pth_decklists = os.path.join(mtg.pth_sto,'decklists')
+deck_exts = ['.dec','.cod']
+
+# tsv column -> record key
+db_cols = {
+    'Primer':'primer',
+    'Strategy':'strategy',
+    'Color(s)':'colors',
+    'Deck Name':'name',
+    'List':'url',
+    'Commander(s)':'commander',
+    'Description':'desc',
+    'CI#':'ci',
+    'Discord':'discord',
+    'Curator(s)':'curators',
+}
+
+class DeckDB(object):
+    """
+     the loaded database: a list of entries (record,deck,error) in database order
+     where deck is the EDHDeck (or None) and error is the LituusException raised
+     while loading the deck (or None)
+    """
+    def __init__(self):
+        self._es = []
+
+    def __len__(self): return len(self._es)
+
+    def __iter__(self):
+        """ iterates the entries as tuples t = (record,deck,error) """
+        yield from [tuple(e) for e in self._es]
+
+    def __getitem__(self,dname):
+        """ returns the (first) deck with name dname """
+        for rec,deck,_ in self._es:
+            if rec['name'] == dname and deck: return deck
+        raise lts.LituusException(lts.EPARAM,"No such deck {}".format(dname))
+
+    @property
+    def records(self): return [e[0] for e in self._es]
+
+    @property
+    def decks(self): return [e[1] for e in self._es if e[1]]
+
+    @property
+    def errors(self): return [(e[0],e[2]) for e in self._es if e[2]]
+
+    def add(self,rec,deck=None,err=None): self._es.append([rec,deck,err])
+
+def read_db(f=None):
+    """
+     reads the cEDH database tsv
+    :param f: path of the tsv (default is the Primary Database in resources)
+    :return: list of deck record dicts (see db_cols for keys)
+    """
+    fin = None
+    try:
+        fin = open(f if f else dbpath,newline='',encoding='utf-8')
+        rdr = csv.DictReader(fin,delimiter='\t')
+        recs = []
+        for row in rdr:
+            rec = {db_cols[k]:(row[k] or "").strip() for k in db_cols}
+            if not rec['name'] and not rec['url']: continue
+            rec['primer'] = rec['primer'].upper() == 'X'
+            rec['strategy'] = int(rec['strategy']) if rec['strategy'].isdigit() else None
+            rec['ci'] = int(rec['ci']) if rec['ci'].isdigit() else None
+            rec['url'] = rec['url'].replace('&amp;','&')
+            recs.append(rec)
+        fin.close()
+        return recs
+    except FileNotFoundError:
+        raise lts.LituusException(lts.EIOIN,"Database file does not exist")
+    except (KeyError,csv.Error) as e:
+        raise lts.LituusException(lts.EDATA,"Malformed database {}".format(e))
+    finally:
+        if fin: fin.close()
+
+def deck_file(rec,ddir=None):
+    """
+     returns the path of the local decklist file of deck record rec. Decklists
+     are named after the url's slug i.e. the last (non-language) part of the
+     url's path or the deck name with a '.dec' or '.cod' extension
+    :param rec: deck record
+    :param ddir: directory of decklist files (default sto/decklists)
+    :return: path of the decklist file or None
+    """
+    ddir = ddir if ddir else pth_decklists
+    ps = [p for p in urlparse(rec['url']).path.split('/') if p]
+    if ps and len(ps[-1]) == 2: ps = ps[:-1] # drop language i.e. /en
+    for base in ([ps[-1]] if ps else []) + [rec['name']]:
+        for ext in deck_exts:
+            f = os.path.join(ddir,base+ext)
+            if os.path.exists(f): return f
+    return None
+
+def load(f=None,ddir=None,mv=None,workers=8):
+    """
+     loads the cEDH database, building each deck having a local decklist
+    :param f: path of the database tsv (default is the Primary Database)
+    :param ddir: directory of decklist files (default sto/decklists)
+    :param mv: the multiverse, loaded once if not given and shared by all decks
+    :param workers: number of threads resolving and reading decklists
+    :return: DeckDB
+    """
+    recs = read_db(f)
+    if mv is None:
+        import lituus.multiverse as multiverse
+        mv = multiverse.multiverse(0)
+    cmdrs = _cmdr_index_(mv)
+
+    db = DeckDB()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for rec,(deck,err) in zip(
+            recs,pool.map(lambda rec: _load_deck_(rec,ddir,mv,cmdrs),recs)
+        ): db.add(rec,deck,err)
+    return db
+
+####
+# PRIVATE FCTS
+####
+
+def _load_deck_(rec,ddir,mv,cmdrs):
+    """
+     builds the deck of deck record rec returning a tuple t = (deck,error)
+    :param rec: deck record
+    :param ddir: decklist directory
+    :param mv: the multiverse
+    :param cmdrs: the commander index (see _cmdr_index_)
+    """
+    try:
+        f = deck_file(rec,ddir)
+        if not f:
+            raise lts.LituusException(
+                lts.EIOIN,"No decklist for {} ({})".format(rec['name'],rec['url'])
+            )
+        cs = "/".join([_cmdr_(c.strip(),cmdrs) for c in rec['commander'].split('/')])
+        deck = edhdeck.EDHDeck(
+            cs,f,rec['name'],rec['url'],rec['curators'],None,rec['discord'],mv
+        )
+        return deck,None
+    except lts.LituusException as e:
+        return None,e
+    except Exception as e:
+        return None,lts.LituusException(lts.EUNDEF,"{}: {}".format(rec['name'],e))
+
+def _cmdr_index_(mv):
+    """
+     returns a dict of name prefix -> set of legendary card names in the
+     multiverse mv that begin with the prefix (the database uses short names
+     i.e. 'Tymna' for 'Tymna the Weaver')
+    """
+    idx = {}
+    for cname in mv:
+        if not mv[cname].is_legendary(): continue
+        ws = cname.replace(',','').split(' ')
+        for i in range(1,len(ws)+1):
+            idx.setdefault(" ".join(ws[:i]),set()).add(cname)
+    return idx
+
+def _cmdr_(cname,cmdrs):
+    """ returns the full name of the commander cname using the index cmdrs """
+    ns = cmdrs.get(cname.replace(',',''),set())
+    if cname in ns or len(ns) != 1: return cname
+    return next(iter(ns))
@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+""" deckindex.py
+Copyright (C) 2019  Temporal Inept (temporalinept@mail.com)
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+Defines a MinHash/LSH index over decks for finding the decks most similar to a
+given deck without comparing it to every deck in the corpus
+"""
+
+#__name__ = 'deckindex'
+__license__ = 'GPLv3'
+__version__ = '0.0.1'
+__date__ = 'May 2020'
+__author__ = 'Temporal Inept'
+__maintainer__ = 'Temporal Inept'
+__email__ = 'temporalinept@mail.com'
+__status__ = 'Development'
+
+import os
+import pickle
+import random
+from hashlib import md5
+import lituus as lts
+import lituus.mtg as mtg
+import lituus.mtgdeck as mtgdeck
+
+# file paths
+dipath = os.path.join(mtg.pth_sto,'deckindex.pkl')
+
+# universal hashing h(x) = (a*x + b) mod p with p the Mersenne prime 2^61 - 1
+_P_ = (1 << 61) - 1
+
+class DeckIndex(object):
+    """
+     a banded LSH index of deck MinHash signatures. A deck's signature is taken
+     over its cards (with qty, a card with qty q is the tokens name#1..name#q so
+     that the Jaccard similarity accounts for quantities). Two decks share a
+     bucket in a band if their signatures agree on all the band's rows.
+     Candidates are re-ranked with the exact similarity of MTGDeck.similar
+    """
+    def __init__(self,num_perm=128,bands=32,lands="all",qty=True,seed=1):
+        """
+         creates an empty index
+        :param num_perm: number of hash functions (signature length)
+        :param bands: number of bands, must divide num_perm. More bands (fewer
+         rows per band) finds less similar decks at the cost of more candidates
+        :param lands: see MTGDeck.similar
+        :param qty: see MTGDeck.similar
+        :param seed: seed for generating the hash functions
+        """
+        if num_perm < 1 or bands < 1 or num_perm % bands:
+            raise lts.LituusException(
+                lts.EPARAM,"bands ({}) must divide num_perm ({})".format(bands,num_perm)
+            )
+        rnd = random.Random(seed)
+        self._lands = lands
+        self._qty = qty
+        self._bands = bands
+        self._rows = num_perm // bands
+        self._hs = [
+            (rnd.randrange(1,_P_),rnd.randrange(0,_P_)) for _ in range(num_perm)
+        ]
+        self._cards = {}                        # key -> dict cardname -> qty
+        self._sigs = {}                         # key -> signature
+        self._buckets = [{} for _ in range(bands)] # band -> band-sig -> set(keys)
+
+    def __len__(self): return len(self._sigs)
+
+    def __contains__(self,key): return key in self._sigs
+
+    def __iter__(self): yield from self._sigs.__iter__()
+
+    @property
+    def lands(self): return self._lands
+
+    @property
+    def qty(self): return self._qty
+
+    def add(self,key,deck):
+        """
+         adds deck to the index under key, replacing any deck with the same key
+        :param key: unique identifier of the deck i.e. the deck url or hash
+        :param deck: MTGDeck
+        """
+        if key in self._sigs: self.remove(key)
+        cs = deck._card_qty_(self._lands,self._qty)
+        sig = self.signature(cs)
+        self._cards[key] = cs
+        self._sigs[key] = sig
+        for b,bsig in enumerate(self._bands_(sig)):
+            self._buckets[b].setdefault(bsig,set()).add(key)
+
+    def remove(self,key):
+        """
+         removes the deck identified by key from the index
+        :param key: the deck identifier
+        """
+        try:
+            sig = self._sigs.pop(key)
+            del self._cards[key]
+        except KeyError:
+            raise lts.LituusException(lts.EPARAM,"No such deck {}".format(key))
+        for b,bsig in enumerate(self._bands_(sig)):
+            bucket = self._buckets[b][bsig]
+            bucket.discard(key)
+            if not bucket: del self._buckets[b][bsig]
+
+    def candidates(self,deck):
+        """
+         returns the set of keys of decks sharing at least one bucket with deck
+        :param deck: MTGDeck
+        :return: set of keys
+        """
+        sig = self.signature(deck._card_qty_(self._lands,self._qty))
+        return self._candidates_(sig)
+
+    def query(self,deck,n=10,exclude=None):
+        """
+         returns the n indexed decks most similar to deck as a list of tuples
+         t = (key,similarity) ordered by decreasing similarity where similarity
+         is that of MTGDeck.similar. Only decks that are candidates (see
+         candidates) are considered
+        :param deck: MTGDeck
+        :param n: maximum number of results (None for all candidates)
+        :param exclude: key to leave out of the results i.e. deck's own key
+        :return: list of (key,similarity)
+        """
+        cs = deck._card_qty_(self._lands,self._qty)
+        ks = self._candidates_(self.signature(cs))
+        ks.discard(exclude)
+        ss = sorted(
+            [(k,mtgdeck.common(cs,self._cards[k])) for k in ks],
+            key=lambda x: (-x[1],str(x[0]))
+        )
+        return ss if n is None else ss[:n]
+
+    def jaccard(self,k1,k2):
+        """
+         returns the estimated Jaccard similarity of the decks identified by
+         k1 and k2 (the fraction of agreeing signature values)
+        :param k1: deck identifier
+        :param k2: deck identifier
+        """
+        try:
+            s1,s2 = self._sigs[k1],self._sigs[k2]
+        except KeyError as e:
+            raise lts.LituusException(lts.EPARAM,"No such deck {}".format(e))
+        return sum(1 for a,b in zip(s1,s2) if a == b) / len(s1)
+
+    def signature(self,cs):
+        """
+         returns the MinHash signature of the card qty dict cs
+        :param cs: dict cardname -> qty
+        :return: tuple of num_perm ints
+        """
+        xs = [
+            int.from_bytes(md5("{}#{}".format(n,i).encode()).digest()[:8],'big')
+            for n in cs for i in range(1,cs[n]+1)
+        ]
+        if not xs: return tuple([_P_]*len(self._hs))
+        return tuple(min((a*x + b) % _P_ for x in xs) for a,b in self._hs)
+
+    def save(self,f=None):
+        """
+         saves the index to f or deckindex.pkl in the sto directory
+        :param f: the file path
+        """
+        fout = None
+        try:
+            fout = open(f if f else dipath,'wb')
+            pickle.dump(self,fout)
+            fout.close()
+        except pickle.PickleError:
+            raise lts.LituusException(lts.EIOOUT,"Failed pickling deck index")
+        except IOError:
+            raise lts.LituusException(lts.EIOOUT,"Failed saving deck index")
+        finally:
+            if fout: fout.close()
+
+    ####
+    # PRIVATE FCTS
+    ####
+
+    def _bands_(self,sig):
+        """ yields the band signatures of signature sig """
+        r = self._rows
+        for b in range(self._bands): yield sig[b*r:(b+1)*r]
+
+    def _candidates_(self,sig):
+        """ returns the set of keys sharing a bucket with signature sig """
+        ks = set()
+        for b,bsig in enumerate(self._bands_(sig)):
+            ks.update(self._buckets[b].get(bsig,()))
+        return ks
+
+def load(f=None):
+    """
+     loads a saved deck index from f or deckindex.pkl in the sto directory
+    :param f: the file path
+    :return: DeckIndex
+    """
+    fin = None
+    try:
+        fin = open(f if f else dipath,'rb')
+        di = pickle.load(fin)
+        fin.close()
+        return di
+    except FileNotFoundError:
+        raise lts.LituusException(lts.EIOIN,"Deck index file does not exist")
+    except pickle.PickleError:
+        raise lts.LituusException(lts.EIOIN,"Error loading deck index")
+    finally:
+        if fin: fin.close()
@@ -0,0 +1,338 @@
+#!/usr/bin/env python
+""" download.py
+Copyright (C) 2019  Temporal Inept (temporalinept@mail.com)
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+Conditional, resumable downloads (i.e. of AllCards.json). A download sends the
+ETag/Last-Modified of the previous download (saved in a sidecar <file>.meta)
+and is skipped on 304 Not Modified, streams to <file>.part hashing as it goes,
+resumes an interrupted .part w/ a Range request (if the server's ETag has not
+changed) and verifies the sha256 (given or from a checksum url) before
+replacing the file. StandIn is a local HTTP server serving a file w/ ETags,
+conditional & range requests for testing offline. Run as
+ python -m lituus.download [url] [path]
+to download (default is AllCards.json) or
+ python -m lituus.download standin
+to exercise the downloader against the stand-in server
+"""
+
+#__name__ = 'download'
+__license__ = 'GPLv3'
+__version__ = '0.0.1'
+__date__ = 'August 2020'
+__author__ = 'Temporal Inept'
+__maintainer__ = 'Temporal Inept'
+__email__ = 'temporalinept@mail.com'
+__status__ = 'Development'
+
+import os
+import sys
+import json
+import time
+import hashlib
+import lituus as lts
+
+chunk_size = 1 << 16 # bytes per streamed chunk
+timeout = 30         # seconds to wait on the server
+
+# results of fetch
+UNMODIFIED = 0 # server returned 304 Not Modified
+UNCHANGED  = 1 # downloaded but the content has the same hash as before
+UPDATED    = 2 # downloaded new content
+
+def fetch(url,f,sha256=None,checksum_url=None,session=None):
+    """
+     downloads url to f conditionally, resuming a previous partial download
+    :param url: the url to download
+    :param f: path to save to
+    :param sha256: expected hex sha256 of the content
+    :param checksum_url: url of the content's hex sha256 (i.e. mtgjson's
+     <file>.sha256) used if sha256 is not given
+    :param session: requests.Session (default is a new session)
+    :return: one of UNMODIFIED, UNCHANGED, UPDATED
+    """
+    import requests
+    s = session if session else requests.Session()
+    meta = load_meta(f)
+    if meta.get('url') != url: meta = {'url':url}
+    part = f + '.part'
+
+    # conditional on the previous download if we still have it
+    hdrs = {}
+    if os.path.exists(f):
+        if meta.get('etag'): hdrs['If-None-Match'] = meta['etag']
+        if meta.get('last-modified'): hdrs['If-Modified-Since'] = meta['last-modified']
+
+    # resume the partial download if the server's version is the same
+    n = os.path.getsize(part) if os.path.exists(part) else 0
+    if n and meta.get('part-etag'):
+        hdrs['Range'] = "bytes={}-".format(n)
+        hdrs['If-Range'] = meta['part-etag']
+    else: n = 0
+
+    try:
+        r = s.get(url,headers=hdrs,stream=True,timeout=timeout)
+    except requests.RequestException as e:
+        raise lts.LituusException(lts.ENET,"Failed requesting {} ({})".format(url,e))
+    try:
+        if r.status_code == 304: return UNMODIFIED
+        if r.status_code == 416: # our partial is no good, start over
+            r.close()
+            _remove_(part)
+            meta.pop('part-etag',None)
+            save_meta(f,meta)
+            return fetch(url,f,sha256,checksum_url,s)
+        if r.status_code not in (200,206):
+            raise lts.LituusException(
+                lts.ENET,"Failed requesting {} ({})".format(url,r.status_code)
+            )
+        if r.status_code == 200: n = 0 # the server sent everything
+
+        # stream to the partial, saving the etag so we can resume it
+        h = hashlib.sha256()
+        if n: h.update(_read_(part))
+        meta['part-etag'] = r.headers.get('ETag')
+        save_meta(f,meta)
+        try:
+            with open(part,'ab' if n else 'wb') as fout:
+                for chunk in r.iter_content(chunk_size):
+                    fout.write(chunk)
+                    h.update(chunk)
+        except requests.RequestException as e:
+            raise lts.LituusException(
+                lts.ENET,"Download of {} interrupted ({})".format(url,e)
+            )
+        except OSError as e:
+            raise lts.LituusException(lts.EIOOUT,"Failed writing {}".format(e))
+    finally:
+        r.close()
+
+    # verify the content before replacing the file
+    dig = h.hexdigest()
+    if sha256 is None and checksum_url: sha256 = _checksum_(s,checksum_url)
+    if sha256 and dig != sha256.lower():
+        _remove_(part)
+        meta.pop('part-etag',None)
+        save_meta(f,meta)
+        raise lts.LituusException(lts.EDATA,"Checksum mismatch for {}".format(url))
+
+    ret = UNCHANGED if dig == meta.get('sha256') and os.path.exists(f) else UPDATED
+    try:
+        if ret == UPDATED: os.replace(part,f)
+        else: os.remove(part)
+    except OSError as e:
+        raise lts.LituusException(lts.EIOOUT,"Failed saving {}".format(e))
+    meta.pop('part-etag',None)
+    meta['etag'] = r.headers.get('ETag')
+    meta['last-modified'] = r.headers.get('Last-Modified')
+    meta['sha256'] = dig
+    meta['size'] = os.path.getsize(f)
+    meta['date'] = time.strftime('%Y-%m-%d %H:%M:%S')
+    save_meta(f,meta)
+    return ret
+
+def load_meta(f):
+    """
+     loads the download metadata of f
+    :param f: path of the downloaded file
+    :return: the metadata dict (empty if there is none)
+    """
+    try:
+        with open(f + '.meta','r') as fin: return json.load(fin)
+    except FileNotFoundError:
+        return {}
+    except (OSError,ValueError):
+        raise lts.LituusException(lts.EIOIN,"Error reading {}.meta".format(f))
+
+def save_meta(f,meta):
+    """
+     saves the download metadata of f
+    :param f: path of the downloaded file
+    :param meta: the metadata dict
+    """
+    try:
+        with open(f + '.meta','w') as fout: json.dump(meta,fout,indent=1)
+    except OSError:
+        raise lts.LituusException(lts.EIOOUT,"Failed saving {}.meta".format(f))
+
+class StandIn(object):
+    """
+     a local HTTP server serving the file at pth (& its hex sha256 at
+     /<name>.sha256) w/ ETag, Last-Modified, conditional and range requests.
+     Use as a context manager i.e.
+      with StandIn(pth) as srv: fetch(srv.url,f,checksum_url=srv.checksum_url)
+    """
+    def __init__(self,pth,port=0):
+        """
+         creates the server on localhost
+        :param pth: path of the file to serve
+        :param port: port to listen on (default is any free port)
+        """
+        from http.server import HTTPServer
+        self.pth = pth
+        self.cut = None  # if set, the next response is cut after cut bytes
+        self.served = [] # log of (status,range header) of responses
+        self._srv = HTTPServer(('127.0.0.1',port),_handler_(self))
+        self._thd = None
+
+    def __enter__(self):
+        import threading
+        self._thd = threading.Thread(target=self._srv.serve_forever,daemon=True)
+        self._thd.start()
+        return self
+
+    def __exit__(self,exc_type,exc_val,exc_tb):
+        self._srv.shutdown()
+        self._srv.server_close()
+        return False
+
+    @property
+    def url(self):
+        return "http://127.0.0.1:{}/{}".format(
+            self._srv.server_port,os.path.basename(self.pth)
+        )
+
+    @property
+    def checksum_url(self): return self.url + '.sha256'
+
+    def state(self):
+        """ returns tuple t = (content,etag,last-modified) of the served file """
+        from email.utils import formatdate
+        data = _read_(self.pth)
+        etag = '"{}"'.format(hashlib.sha256(data).hexdigest()[:16])
+        return data,etag,formatdate(os.path.getmtime(self.pth),usegmt=True)
+
+####
+# PRIVATE FCTS
+####
+
+def _handler_(srv):
+    """ returns the request handler class of StandIn srv """
+    from http.server import BaseHTTPRequestHandler
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self,*args): pass
+
+        def do_GET(self):
+            data,etag,lm = srv.state()
+            if self.path.endswith('.sha256'):
+                return self._send_(200,hashlib.sha256(data).hexdigest().encode())
+            rng = self.headers.get('Range')
+            if self.headers.get('If-None-Match') == etag:
+                return self._send_(304,b'',etag,lm)
+            if rng and self.headers.get('If-Range') in (None,etag):
+                i = int(rng.split('=')[1].split('-')[0])
+                if i >= len(data): return self._send_(416,b'',etag,lm,rng)
+                return self._send_(206,data[i:],etag,lm,rng,(i,len(data)))
+            self._send_(200,data,etag,lm,rng)
+
+        def _send_(self,status,body,etag=None,lm=None,rng=None,crng=None):
+            srv.served.append((status,rng))
+            self.send_response(status)
+            if etag: self.send_header('ETag',etag)
+            if lm: self.send_header('Last-Modified',lm)
+            if crng:
+                self.send_header(
+                    'Content-Range',"bytes {}-{}/{}".format(crng[0],crng[1]-1,crng[1])
+                )
+            self.send_header('Content-Length',str(len(body)))
+            self.end_headers()
+            if srv.cut is not None and status in (200,206):
+                body,srv.cut = body[:srv.cut],None # drop the connection early
+                self.close_connection = True
+            self.wfile.write(body)
+    return Handler
+
+def _read_(fp):
+    """ returns the contents of the file at fp """
+    try:
+        with open(fp,'rb') as fin: return fin.read()
+    except OSError as e:
+        raise lts.LituusException(lts.EIOIN,"Failed reading {}".format(e))
+
+def _remove_(fp):
+    """ removes the file at fp if it exists """
+    try:
+        os.remove(fp)
+    except FileNotFoundError:
+        pass
+
+def _checksum_(s,url):
+    """ returns the hex sha256 at url using session s """
+    import requests
+    try:
+        r = s.get(url,timeout=timeout)
+    except requests.RequestException as e:
+        raise lts.LituusException(lts.ENET,"Failed requesting {} ({})".format(url,e))
+    if r.status_code != 200:
+        raise lts.LituusException(
+            lts.ENET,"Failed requesting {} ({})".format(url,r.status_code)
+        )
+    return r.text.split()[0]
+
+def _standin_():
+    """
+     downloads from a stand-in server: fresh, not modified, interrupted &
+     resumed, modified and changed w/ the same content
+    :return: list of (step,result,ok)
+    """
+    import tempfile
+    rs = []
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp,'AllCards.json')
+        dst = os.path.join(tmp,'dl','AllCards.json')
+        os.makedirs(os.path.dirname(dst))
+        with open(src,'wb') as fout: fout.write(os.urandom(300000))
+        with StandIn(src) as srv:
+            get = lambda: fetch(srv.url,dst,checksum_url=srv.checksum_url)
+            rs.append(('fresh',get(),UPDATED))
+            rs.append(('not modified',get(),UNMODIFIED))
+
+            # interrupt the next download then resume it
+            with open(src,'ab') as fout: fout.write(os.urandom(200000))
+            srv.cut = 100000
+            try:
+                get()
+                rs.append(('interrupted','completed','interrupted'))
+            except lts.LituusException:
+                rs.append(('interrupted','interrupted','interrupted'))
+            del srv.served[:]
+            res = get()
+            resumed = srv.served and srv.served[0][0] == 206
+            rs.append(('resumed',res,UPDATED if resumed else 'resumed'))
+            rs.append(('content',_read_(dst) == _read_(src),True))
+
+            # touch the file (new Last-Modified, same etag) is not modified,
+            # new etag w/ the same content is unchanged
+            os.utime(src)
+            rs.append(('touched',get(),UNMODIFIED))
+            meta = load_meta(dst)
+            meta['etag'] = '"stale"'
+            save_meta(dst,meta)
+            rs.append(('same content',get(),UNCHANGED))
+    return [(step,res,res == exp) for step,res,exp in rs]
+
+def main(argv):
+    """ downloads a url or exercises the downloader (see module docstring) """
+    if len(argv) > 1 and argv[1] == 'standin':
+        rs = _standin_()
+        for step,res,ok in rs: print("{:<14} {!s:<12} {}".format(step,res,'ok' if ok else 'FAILED'))
+        return 0 if all(ok for _,_,ok in rs) else 1
+
+    import lituus.multiverse as multiverse
+    url = argv[1] if len(argv) > 1 else multiverse.url_cards
+    f = argv[2] if len(argv) > 2 else multiverse.jpath
+    start = time.time()
+    res = fetch(url,f,checksum_url=url + '.sha256')
+    print(
+        "{} {} in {:.2f}s".format(
+            f,{UNMODIFIED:'not modified',UNCHANGED:'unchanged',UPDATED:'updated'}[res],
+            time.time()-start
+        )
+    )
+    return 0
+
+if __name__ == '__main__': sys.exit(main(sys.argv))
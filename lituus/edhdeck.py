@@ -20,17 +20,14 @@ __email__ = 'temporalinept@mail.com'
 __status__ = 'Development'
 
 import os
-from bs4 import BeautifulSoup as soup
 import lituus as lts
 import lituus.mtg as mtg
-import lituus.mtgl.mtgl as mtgl
-import lituus.multiverse as multiverse
 import lituus.mtgdeck as mtgdeck
 
 class EDHDeck(mtgdeck.MTGDeck):
     """ Defines an EDH Deck """
     def __init__(self,cs=None,f=None,dname=None,durl=None,
-                      aname=None,aurl=None,diurl=None):
+                      aname=None,aurl=None,diurl=None,mv=None):
         """
         Initializes an EDH  deck from file f with commander(s) cs if present or
         an empty deck if not
@@ -41,9 +38,10 @@ class EDHDeck(mtgdeck.MTGDeck):
         :param aname: deck author
         :param aurl: author url
         :param diurl: discord url
+        :param mv: the multiverse to draw cards from (loaded if not given)
         """
         self._cmdr = [c.strip() for c in cs.split('/')] if cs else []
-        super().__init__(f,dname,durl,aname,aurl,diurl)
+        super().__init__(f,dname,durl,aname,aurl,diurl,mv)
 
     @property
     def commander(self): return self._cmdr
@@ -203,15 +201,22 @@ class EDHDeck(mtgdeck.MTGDeck):
     # PRIVATE FUNCTIONS
     ####
 
-    def _read_deck_(self,f):
-        """ reads a deck from file with path f """
+    def _read_deck_(self,f,mv=None):
+        """
+         reads a deck from file with path f
+        :param f: the file path
+        :param mv: the multiverse, if None, the saved multiverse is loaded
+        """
         # check for commander
-        if not self._cmdr: raise
+        if not self._cmdr:
+            raise lts.LituusException(lts.EPARAM,"EDH Deck must have a Commander(s)")
         ds = None
 
         try:
             # get the multiverse (assumes saved)
-            mv = multiverse.multiverse(0)
+            if mv is None:
+                import lituus.multiverse as multiverse
+                mv = multiverse.multiverse(0)
 
             # check file extension and read in if possible
             _,fext = os.path.splitext(f)
@@ -239,7 +244,7 @@ class EDHDeck(mtgdeck.MTGDeck):
                 cname = " // ".join([cname.strip() for cname in cname.split('/')])
             try:
                 self.add_sb_card(mv[cname],qty)
-            except mtgl.MTGLException:
+            except lts.LituusException:
                 # we'll ignore sideboard errors
                 pass
 
@@ -257,6 +262,12 @@ class EDHDeck(mtgdeck.MTGDeck):
     @staticmethod
     def _read_cod_(f):
         """ reads a cockatrice deck file """
+        try:
+            from bs4 import BeautifulSoup as soup
+        except ImportError:
+            raise lts.LituusException(
+                lts.EIMPL,"Reading cockatrice files requires BeautifulSoup"
+            )
         ds = {'name':"",'mainboard':[],'sideboard':[]}
         fin = None
         try:
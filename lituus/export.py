@@ -0,0 +1,302 @@
+#!/usr/bin/env python
+""" export.py
+Copyright (C) 2019  Temporal Inept (temporalinept@mail.com)
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+Streams the tagged oracle text and (compactly encoded) tree of each card to
+sharded, optionally gzipped JSONL files w/ a manifest of the shards' counts and
+hashes so that consumers (i.e. ESoLW reports) can read the shards in parallel
+without loading the multiverse pickle. Each line is the json object
+ {"name":<card name>,"rid":<ref-id>,"tag":<tagged text>,"tree":<encoded tree>}
+where the tag is null if it is not stored (i.e. a multiverse built w/o debug
+or a card that failed tagging) and the tree is MTGTree.encode() (decode with
+mtgt.decode) or null. Run as
+ python -m lituus.export [output directory]
+to graph & export the saved multiverse (see multiverse) or
+ python -m lituus.export verify [output directory]
+to verify the shards of an export against its manifest
+"""
+
+#__name__ = 'export'
+__license__ = 'GPLv3'
+__version__ = '0.0.1'
+__date__ = 'August 2020'
+__author__ = 'Temporal Inept'
+__maintainer__ = 'Temporal Inept'
+__email__ = 'temporalinept@mail.com'
+__status__ = 'Development'
+
+import os
+import sys
+import gzip
+import json
+import time
+import hashlib
+import lituus as lts
+import lituus.mtg as mtg
+
+# default output directory, manifest file name & cards per shard
+pth_export = os.path.join(mtg.pth_sto,'export')
+manifest_name = 'manifest.json'
+shard_size = 2000
+
+# version of the export format
+EXP_VERSION = 1
+
+class Exporter(object):
+    """
+     writes card records to sharded JSONL files as they are added, writing the
+     manifest on close. Use as a context manager i.e.
+      with Exporter(pth) as exp:
+        for card in cards: exp.add(card.name,card.rid,tag,card.tree)
+     where tag is the card's tagged text or None if it is not stored
+    """
+    def __init__(self,pth=None,n=shard_size,compress=True):
+        """
+         creates the exporter
+        :param pth: output directory (default is pth_export)
+        :param n: number of cards per shard
+        :param compress: if set, shards are gzipped
+        """
+        if n < 1: raise lts.LituusException(lts.EPARAM,"Shard size must be > 0")
+        self._pth = pth if pth else pth_export
+        self._n = n
+        self._gz = compress
+        self._fout = None  # open shard
+        self._shard = None # manifest entry of the open shard
+        self._shards = []  # manifest entries of the shards
+        self._ttl = 0
+        self._man = None   # the manifest once closed
+        try:
+            os.makedirs(self._pth,exist_ok=True)
+        except OSError as e:
+            raise lts.LituusException(lts.EIOOUT,"Failed creating {}".format(e))
+
+    def __enter__(self): return self
+
+    def __exit__(self,exc_type,exc_val,exc_tb):
+        # write the manifest only if the export completed
+        if exc_type is None: self.close()
+        elif self._fout: self._fout.close()
+        return False
+
+    @property
+    def qty(self): return self._ttl
+
+    @property # the manifest (None until closed)
+    def manifest(self): return self._man
+
+    def add(self,name,rid,tag,tree=None):
+        """
+         writes the card's record to the open shard (opening a new shard as
+         needed)
+        :param name: card name
+        :param rid: card ref-id
+        :param tag: tagged oracle text or None
+        :param tree: MTGTree or None
+        """
+        if self._fout is None or self._shard['cards'] == self._n: self._open_()
+        rec = {
+            'name':name,'rid':rid,'tag':tag,
+            'tree':tree.encode() if tree is not None else None
+        }
+        ln = (json.dumps(rec,ensure_ascii=False,default=str) + '\n').encode('utf-8')
+        try:
+            self._fout.write(ln)
+        except OSError as e:
+            raise lts.LituusException(lts.EIOOUT,"Failed writing shard {}".format(e))
+        self._shard['cards'] += 1
+        self._shard['bytes'] += len(ln)
+        self._ttl += 1
+
+    def close(self):
+        """
+         closes the open shard and writes the manifest
+        :return: the manifest
+        """
+        import lituus.mtgl.mtgt as mtgt
+        self._close_()
+        man = {
+            'version':EXP_VERSION,
+            'tree-encoding':mtgt.ENC_VERSION,
+            'date':time.strftime('%Y-%m-%d %H:%M:%S'),
+            'compressed':self._gz,
+            'cards':self._ttl,
+            'shards':self._shards,
+        }
+        try:
+            with open(os.path.join(self._pth,manifest_name),'w') as fout:
+                json.dump(man,fout,indent=1)
+        except OSError as e:
+            raise lts.LituusException(lts.EIOOUT,"Failed writing manifest {}".format(e))
+        self._man = man
+        return man
+
+    ####
+    # PRIVATE FCTS
+    ####
+
+    def _open_(self):
+        """ closes the open shard (if any) and opens the next """
+        self._close_()
+        fname = "cards-{:05d}.jsonl{}".format(len(self._shards),'.gz' if self._gz else '')
+        try:
+            fp = os.path.join(self._pth,fname)
+            # no timestamp in gzipped shards so identical exports hash the same
+            self._fout = gzip.GzipFile(fp,'wb',mtime=0) if self._gz else open(fp,'wb')
+        except OSError as e:
+            raise lts.LituusException(lts.EIOOUT,"Failed opening shard {}".format(e))
+        self._shard = {'file':fname,'cards':0,'bytes':0,'sha256':None}
+
+    def _close_(self):
+        """ closes the open shard hashing it & adding it to the manifest """
+        if self._fout is None: return
+        self._fout.close()
+        self._fout = None
+        self._shard['sha256'] = _sha256_(os.path.join(self._pth,self._shard['file']))
+        self._shards.append(self._shard)
+        self._shard = None
+
+def export(mv,pth=None,n=shard_size,compress=True,graph=True,progress=None):
+    """
+     exports the cards in mv graphing the cards w/o a tree as they are exported
+    :param mv: the multiverse (a Pack), cards w/o a stored tagged text are
+     exported w/ a null tag (and are not graphed)
+    :param pth: output directory (default is pth_export)
+    :param n: number of cards per shard
+    :param compress: if set, shards are gzipped
+    :param graph: if set, graphs cards that do not have a tree
+    :param progress: function progress(i,ttl) called after each card
+    :return: tuple t = (manifest,dict name -> error of cards that failed graphing)
+    """
+    import lituus.mtgl.grapher as grapher
+    errs = {}
+    with Exporter(pth,n,compress) as exp:
+        for i,cname in enumerate(mv):
+            card = mv[cname]
+            try:
+                tag = card.tag
+            except lts.LituusException: # not stored (w/o debug) or failed tagging
+                tag = None
+            tree = card.tree
+            if tree is None and graph and tag is not None:
+                try:
+                    tree = grapher.graph({'name':cname,'tag':tag,'type':card.type})
+                except Exception as e: # the grapher raises more than its own errors
+                    errs[cname] = e
+            exp.add(cname,card.rid,tag,tree)
+            if progress: progress(i+1,len(mv))
+    return exp.manifest,errs
+
+def load_manifest(pth=None):
+    """
+     loads the manifest of an export
+    :param pth: export directory (default is pth_export)
+    :return: the manifest dict
+    """
+    try:
+        with open(os.path.join(pth if pth else pth_export,manifest_name)) as fin:
+            man = json.load(fin)
+    except (OSError,ValueError) as e:
+        raise lts.LituusException(lts.EIOIN,"Failed reading manifest {}".format(e))
+    if man.get('version') != EXP_VERSION:
+        raise lts.LituusException(
+            lts.EDATA,"Unsupported export version {}".format(man.get('version'))
+        )
+    return man
+
+def read_shard(pth,shard,verify=False):
+    """
+     reads the records of a shard
+    :param pth: export directory
+    :param shard: the shard's manifest entry (or its file name)
+    :param verify: if set, checks the shard's hash before reading it
+    :return: generator of record dicts
+    """
+    fname = shard['file'] if isinstance(shard,dict) else shard
+    fp = os.path.join(pth,fname)
+    if verify and isinstance(shard,dict) and _sha256_(fp) != shard['sha256']:
+        raise lts.LituusException(lts.EDATA,"Hash mismatch in {}".format(fname))
+    try:
+        with (gzip.open(fp,'rb') if fname.endswith('.gz') else open(fp,'rb')) as fin:
+            for ln in fin: yield json.loads(ln)
+    except (OSError,ValueError) as e:
+        raise lts.LituusException(lts.EIOIN,"Failed reading {} {}".format(fname,e))
+
+def read(pth=None,verify=False):
+    """
+     reads the records of all shards of an export in order
+    :param pth: export directory (default is pth_export)
+    :param verify: if set, checks each shard's hash before reading it
+    :return: generator of record dicts
+    """
+    pth = pth if pth else pth_export
+    for shard in load_manifest(pth)['shards']: yield from read_shard(pth,shard,verify)
+
+def verify(pth=None):
+    """
+     verifies the shards of an export against the manifest
+    :param pth: export directory (default is pth_export)
+    :return: list of error messages (empty if the export is valid)
+    """
+    pth = pth if pth else pth_export
+    man = load_manifest(pth)
+    errs = []
+    ttl = 0
+    for shard in man['shards']:
+        fp = os.path.join(pth,shard['file'])
+        if not os.path.exists(fp):
+            errs.append("{}: missing".format(shard['file']))
+            continue
+        if _sha256_(fp) != shard['sha256']:
+            errs.append("{}: hash mismatch".format(shard['file']))
+            continue
+        n = sum(1 for _ in read_shard(pth,shard))
+        if n != shard['cards']:
+            errs.append("{}: {} cards, expected {}".format(shard['file'],n,shard['cards']))
+        ttl += n
+    if not errs and ttl != man['cards']:
+        errs.append("{} cards, expected {}".format(ttl,man['cards']))
+    return errs
+
+####
+# PRIVATE FCTS
+####
+
+def _sha256_(fp):
+    """ returns the hex sha256 of the file at fp """
+    h = hashlib.sha256()
+    try:
+        with open(fp,'rb') as fin:
+            for chunk in iter(lambda: fin.read(1 << 20),b''): h.update(chunk)
+    except OSError as e:
+        raise lts.LituusException(lts.EIOIN,"Failed hashing {}".format(e))
+    return h.hexdigest()
+
+def main(argv):
+    """ exports the saved multiverse or verifies an export """
+    args = argv[1:]
+    if args and args[0] == 'verify':
+        pth = args[1] if len(args) > 1 else None
+        errs = verify(pth)
+        for err in errs: print(err)
+        print("{} errors".format(len(errs)))
+        return 1 if errs else 0
+
+    import lituus.multiverse as multiverse
+    pth = args[0] if args else None
+    mv = multiverse.multiverse()
+    start = time.time()
+    man,errs = export(mv,pth,progress=multiverse.progress_bar)
+    print(
+        "\nExported {} cards in {} shards in {:.2f}s ({} failed graphing)".format(
+            man['cards'],len(man['shards']),time.time()-start,len(errs)
+        )
+    )
+    return 0
+
+if __name__ == '__main__': sys.exit(main(sys.argv))
@@ -36,6 +36,76 @@ pth_esolw = os.path.join(os.path.dirname(__file__),'ESoLW/res')
 re_clr_mana_sym = re.compile(r'\{([WUBRGP\/]*)\}')
 re_mana_sym = re.compile(r'\{([0-9WUBRGSCPX\/]*)\}')
 
+# MANA COSTS
+
+class ManaCost(object):
+    """
+     a parsed mana cost. Instances are shared between all cards having the same
+     mana cost (see parse_mana_cost) and should be treated as read-only
+      pips: colored pip count per color in mana_colors order. A hybrid symbol
+       counts once for each of its colors, as does a phyrexian or 2/C symbol
+      generic: total of numeric symbols
+      colorless: number of {C} symbols
+      x: number of {X} symbols
+      snow: number of {S} symbols
+      hybrid: number of hybrid symbols (including {2/C})
+      phyrexian: number of phyrexian symbols
+    """
+    __slots__ = ('cost','pips','generic','colorless','x','snow','hybrid','phyrexian')
+
+    def __init__(self,cost):
+        self.cost = cost
+        self.generic = self.colorless = self.x = self.snow = 0
+        self.hybrid = self.phyrexian = 0
+        pips = [0]*len(mana_colors)
+        for ms in re_mana_sym.findall(cost or ''):
+            if '/' in ms:
+                ss = ms.split('/')
+                if 'P' in ss: self.phyrexian += 1
+                else: self.hybrid += 1
+                for s in ss:
+                    if s in mana_colors: pips[mana_colors.index(s)] += 1
+            elif ms in mana_colors: pips[mana_colors.index(ms)] += 1
+            elif ms.isdigit(): self.generic += int(ms)
+            elif ms == 'C': self.colorless += 1
+            elif ms == 'X': self.x += 1
+            elif ms == 'S': self.snow += 1
+        self.pips = tuple(pips)
+
+    def __repr__(self): return "ManaCost({!r})".format(self.cost)
+
+    def __reduce__(self): return (parse_mana_cost,(self.cost,))
+
+    @property
+    def colors(self):
+        """ returns list of colors (in mana_colors order) having pips """
+        return [c for i,c in enumerate(mana_colors) if self.pips[i]]
+
+    def count(self,clr):
+        """
+         returns the number of pips of color clr
+        :param clr: one of mana_colors
+        :return: pip count
+        """
+        return self.pips[mana_colors.index(clr)]
+
+    def is_double(self):
+        """ returns True if any color has two or more pips """
+        return max(self.pips) > 1
+
+_mana_costs_ = {}
+def parse_mana_cost(cost):
+    """
+     returns the (shared) parsed ManaCost of the mana cost string cost
+    :param cost: mana cost string i.e. '{2}{U}{U}'
+    :return: ManaCost
+    """
+    try:
+        return _mana_costs_[cost]
+    except KeyError:
+        mc = _mana_costs_[cost] = ManaCost(cost)
+        return mc
+
 # CONSTANTS
 # TODO: need to update
 last_exp = ['WAR','RNA','GRN','C18','M19']
@@ -7,23 +7,23 @@ the terms of the GNU General Public License as published by the Free Software
 Foundation, either version 3 of the License, or (at your option) any later
 version.
 
-Defines the MTGCard class - a wrapper around a  card dict
+Defines the MTGCard class - a compact, slotted representation of a card dict.
+Card trees are stored frozen (see mtgt.FrozenMTGTree) so that the node-id and
+attribute tables are shared by all cards
 """
 
 #__name__ = 'mtgcard'
 __license__ = 'GPLv3'
-__version__ = '0.1.2'
+__version__ = '0.1.3'
 __date__ = 'May 2020'
 __author__ = 'Temporal Inept'
 __maintainer__ = 'Temporal Inept'
 __email__ = 'temporalinept@mail.com'
 __status__ = 'Development'
 
-import regex as re
+import sys
 import lituus as lts
 import lituus.mtg as mtg
-import lituus.mtgl.mtgl as mtgl
-import lituus.mtgl.mtgt as mtgt
 
 # helper function
 def is_int(s):
@@ -33,28 +33,98 @@ def is_int(s):
     except ValueError:
         return False
 
-class MTGCard(object):
-    """ a more manageable wrapper around a card dictionary """
-    def __init__(self,card): self._card = card
+# shared, interned values. Types, sub-types, colors and printings repeat across
+# thousands of cards, each card references the single shared tuple
+_shared_ = {}
+def _share_(vs):
+    """
+     returns the shared tuple of interned strings equivalent to the iterable vs
+    :param vs: iterable of strings
+    :return: shared tuple
+    """
+    t = tuple(sys.intern(v) for v in vs)
+    try:
+        return _shared_[t]
+    except KeyError:
+        _shared_[t] = t
+        return t
 
+def _freeze_(tree):
+    """ returns the FrozenMTGTree of the MTGTree tree (frozen trees as is) """
+    return tree.freeze() if hasattr(tree,'freeze') else tree
+
+class MTGCard(object):
+    """ a compact card: attributes are stored in slots vice a wrapped dict """
+    __slots__ = (
+        '_rid','_name','_layout','_super_type','_type','_sub_type','_cmc',
+        '_face_cmc','_mana_cost','_mana','_pt','_loyalty','_color_ident','_color',
+        '_oracle','_tag','_tree','_sets'
+    )
+
+    def __init__(self,card,debug=True):
+        """
+         creates the card from the card dict (see multiverse.harvest)
+        :param card: the card dict
+        :param debug: if False, debugging artifacts (tagged and raw oracle text)
+         are not stored
+        """
+        try:
+            self._rid = card['rid']
+            self._name = card['name']
+            self._layout = sys.intern(card.get('layout') or '')
+            self._super_type = _share_(card['super-type'])
+            self._type = _share_(card['type'])
+            self._sub_type = _share_(card['sub-type'])
+            self._cmc = card['cmc']
+            self._face_cmc = card['face-cmc']
+            self._mana_cost = card['mana-cost']
+            self._mana = mtg.parse_mana_cost(self._mana_cost)
+            self._pt = card.get('P/T')
+            self._loyalty = card.get('loyalty')
+            self._color_ident = _share_(
+                sorted(card['color-ident'],key=mtg.mana_colors.index)
+            )
+            self._color = _share_(sorted(card['colors'],key=mtg.mana_colors.index))
+            self._oracle = card['oracle'] if debug else None
+            self._tag = card.get('tag') if debug else None
+            self._tree = _freeze_(card.get('mtgt'))
+            self._sets = _share_(card['sets'])
+        except KeyError as e:
+            raise lts.LituusException(lts.EDATA,"{}->{}".format(card.get('name'),e))
+
+    def __getstate__(self):
+        """ pickle the slots as a tuple """
+        return tuple(getattr(self,attr) for attr in self.__slots__)
+
+    def __setstate__(self,state):
+        """ restore the slots, re-sharing the type and set tuples & freezing the tree """
+        for attr,val in zip(self.__slots__,state): setattr(self,attr,val)
+        for attr in ['_super_type','_type','_sub_type','_color_ident','_color','_sets']:
+            setattr(self,attr,_share_(getattr(self,attr)))
+        self._layout = sys.intern(self._layout)
+        self._mana = mtg.parse_mana_cost(self._mana_cost)
+        self._tree = _freeze_(self._tree) # i.e. cards saved w/ a thawed tree
 
     """ pretty print card's tree """
     def print(self,attr=False): raise lts.LituusException(lts.EIMPL,"Pending")
 
     @property
-    def name(self): return self._card['name']
+    def name(self): return self._name
+
+    @property
+    def rid(self): return self._rid
 
     @property
-    def rid(self): return self._card['rid']
+    def layout(self): return self._layout
 
     @property
-    def super_type(self): return self._card['super-type']
+    def super_type(self): return self._super_type
 
     @property
-    def type(self): return self._card['type']
+    def type(self): return self._type
 
     @property
-    def sub_type(self): return self._card['sub-type']
+    def sub_type(self): return self._sub_type
 
     @property
     def primary_type(self): 
@@ -62,30 +132,37 @@ class MTGCard(object):
             if ptype in self.type: return ptype
 
     @property
-    def cmc(self): return self._card['cmc']
+    def cmc(self): return self._cmc
 
     @property
-    def face_cmc(self): return self._card['face-cmc']
+    def face_cmc(self): return self._face_cmc
 
     @property
-    def mana_cost(self): return self._card['mana-cost']
+    def mana_cost(self): return self._mana_cost
 
     @property
-    def color_ident(self):
-        return sorted(self._card['color-ident'],key=mtg.mana_colors.index)
+    def mana(self): return self._mana
 
     @property
-    def color(self):
-        return sorted(self._card['colors'],key=mtg.mana_colors.index)
+    def color_ident(self): return list(self._color_ident)
 
     @property
-    def oracle(self): return self._card['oracle']
+    def color(self): return list(self._color)
+
+    @property
+    def oracle(self):
+        if self._oracle is None:
+            raise lts.LituusException(lts.EATTR,"Oracle not stored")
+        return self._oracle
 
     @property # TODO: for debugging only
-    def tag(self): return self._card['tag']
+    def tag(self):
+        if self._tag is None:
+            raise lts.LituusException(lts.EATTR,"Tagged oracle not stored")
+        return self._tag
 
-    @property
-    def tree(self): return self._card['mtgt']
+    @property # the read-only tree, thaw it to modify it
+    def tree(self): return self._tree
 
     @property # NOTE: this may include duplicates
     def keywords(self):
@@ -105,33 +182,51 @@ class MTGCard(object):
 
     @property
     def pt(self):
-        try:
-            return self._card['P/T']
-        except KeyError:
+        if self._pt is None:
             raise lts.LituusException(lts.EATTR,"Not a creature")
+        return self._pt
 
     @property
-    def sets(self): return self._card['sets']
+    def loyalty(self):
+        if self._loyalty is None:
+            raise lts.LituusException(lts.EATTR,"Not a planeswalker")
+        return self._loyalty
+
+    @property
+    def sets(self): return self._sets
+
+    def retag(self,tag):
+        """
+         returns a copy of the card w/ the tagged oracle tag and no tree (the
+         tree of the previous tag is stale)
+        :param tag: the tagged oracle text
+        :return: the retagged MTGCard
+        """
+        card = MTGCard.__new__(MTGCard)
+        card.__setstate__(self.__getstate__())
+        if card._oracle is not None: card._tag = tag
+        card._tree = None
+        return card
 
-    def is_split(self): return '//' in self._card['name']
+    def is_split(self): return '//' in self._name
 
-    def is_land(self): return 'Land' in self._card['type']
+    def is_land(self): return 'Land' in self._type
 
-    def is_creature(self): return 'Creature' in self._card['type']
+    def is_creature(self): return 'Creature' in self._type
 
-    def is_artifact(self): return 'Artifact' in self._card['type']
+    def is_artifact(self): return 'Artifact' in self._type
 
-    def is_enchantment(self): return 'Enchantment' in self._card['type']
+    def is_enchantment(self): return 'Enchantment' in self._type
     
-    def is_instant(self): return 'Instant' in self._card['type']
+    def is_instant(self): return 'Instant' in self._type
 
-    def is_sorcery(self): return 'Sorcery' in self._card['type']
+    def is_sorcery(self): return 'Sorcery' in self._type
 
-    def is_planeswalker(self): return 'Planeswalker' in self._card['type']
+    def is_planeswalker(self): return 'Planeswalker' in self._type
 
-    def is_legendary(self): return 'Legendary' in self._card['super-type']
+    def is_legendary(self): return 'Legendary' in self._super_type
 
-    def is_multitype(self): return len(self.type) > 1
+    def is_multitype(self): return len(self._type) > 1
 
     def is_gold(self,ci=False): 
         return len(self.color_ident) > 1 if ci else len(self.color) > 1
@@ -145,10 +240,9 @@ class MTGCard(object):
 
     #### CASTING/COST RELATED ####
 
-    def x_cost(self): return '{X}' in self.mana_cost
+    def x_cost(self): return self._mana.x > 0
 
-    def phyrexian_mana(self):
-        return mtgl.re_mtg_phy_ms.match(self.mana_cost) is not None
+    def phyrexian_mana(self): return self._mana.phyrexian > 0
 
     def acc(self): raise lts.LituusException(lts.EIMPL,"Pending")
 
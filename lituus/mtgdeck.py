@@ -15,7 +15,7 @@ EDHDeck
 
 #__name__ = 'mtgdeck'
 __license__ = 'GPLv3'
-__version__ = '0.0.1'
+__version__ = '0.0.2'
 __date__ = 'April 2020'
 __author__ = 'Temporal Inept'
 __maintainer__ = 'Temporal Inept'
@@ -34,7 +34,8 @@ sbl = '0123456789abcdefghijklmnopqrstuvwxyz' # for deck hashing
 
 class MTGDeck(pack.Pack):
     """ defines a MTG Constructed Deck (100.2) """
-    def __init__(self,f=None,dname=None,durl=None,aname=None,aurl=None,diurl=None):
+    def __init__(self,f=None,dname=None,durl=None,aname=None,aurl=None,diurl=None,
+                      mv=None):
         """
         Initializes a deck from file if present or an empty deck if not
         :param f: the file path (local)
@@ -43,6 +44,7 @@ class MTGDeck(pack.Pack):
         :param aname: deck author
         :param aurl: author url
         :param diurl: discord url
+        :param mv: the multiverse to draw cards from (loaded if not given)
         """
         super().__init__()
         self._sb = {}   # define the sideboard (100.4)
@@ -53,9 +55,10 @@ class MTGDeck(pack.Pack):
         self._author = None
         self._aurl = None
         self._diurl = None
-        if f: self.open_deck(f,dname,durl,aname,aurl,diurl)
+        if f: self.open_deck(f,dname,durl,aname,aurl,diurl,mv)
 
-    def open_deck(self,f,dname=None,durl=None,aname=None,aurl=None,diurl=None):
+    def open_deck(self,f,dname=None,durl=None,aname=None,aurl=None,diurl=None,
+                       mv=None):
         """
         Opens a deck from file f (overwriting current deck if present)
         :param f: the file path (local)
@@ -64,6 +67,7 @@ class MTGDeck(pack.Pack):
         :param aname: deck author
         :param aurl: author url
         :param diurl: discord url
+        :param mv: the multiverse to draw cards from (loaded if not given)
         """
         # TODO: add better exception handling and raising i.e. check for existence
         #  of file first
@@ -71,14 +75,15 @@ class MTGDeck(pack.Pack):
             raise lts.LituusException(lts.EIOIN,"File {} does not exist".format(f))
 
         try:
-            self._read_deck_(f)
+            self._read_deck_(f,mv)
             self._dname = dname if dname else self._path.split('/')[-1]
             self._url = durl if durl else "Unknown"
             self._author = aname if aname else "Unknown"
             self._aurl = aurl if aurl else ""
             self._diurl = diurl if diurl else ""
+        except lts.LituusException: raise
         except IOError as e:
-            raise lts.LituusExeption(lts.EIOIN,e)
+            raise lts.LituusException(lts.EIOIN,e)
         except Exception as e:
             raise lts.LituusException(lts.EUNDEF,e)
 
@@ -195,11 +200,7 @@ class MTGDeck(pack.Pack):
         """
         # create a dict of name -> qty for each deck based on specified lands.
         # Then a list of the intersection of cards and find the # in common
-        s = 0
-        cs1 = {n:q if qty else 1 for (n,q) in self.cards(lands)}
-        cs2 = {n:q if qty else 1 for (n,q) in d.cards(lands)}
-        for n in list(set(cs1.keys()) & set(cs2.keys())): s += min(cs1[n],cs2[n])
-        return s
+        return common(self._card_qty_(lands,qty),d._card_qty_(lands,qty))
 
     def decklist(self):
         """ returns a the mainboard as a decklist (sorted by type) as a dict """
@@ -216,6 +217,85 @@ class MTGDeck(pack.Pack):
     # PRIVATE FCTS
     ####
 
-    def _read_deck_(self,f): raise NotImplementedError
-
-    def _write_deck(self,f): raise NotImplementedError
\ No newline at end of file
+    def _card_qty_(self,lands="all",qty=True):
+        """
+         returns a dict of cardname -> qty (1 if not qty) for specified lands
+        :param lands: see similar
+        :param qty: see similar
+        """
+        return {n:q if qty else 1 for (n,q) in self.cards(lands)}
+
+    def _read_deck_(self,f,mv=None): raise NotImplementedError
+
+    def _write_deck(self,f): raise NotImplementedError
+
+####
+# BATCH OPERATIONS
+####
+
+def common(cs1,cs2):
+    """
+     returns the # of cards in common between two dicts of cardname -> qty
+    :param cs1: dict cardname -> qty
+    :param cs2: dict cardname -> qty
+    """
+    if len(cs2) < len(cs1): cs1,cs2 = cs2,cs1
+    return sum(min(q,cs2[n]) for n,q in cs1.items() if n in cs2)
+
+def deck_matrix(decks,lands="all",qty=True):
+    """
+     builds a sparse deck x card quantity matrix M over decks where M[i,j] is
+     the qty of card j in decks[i]
+    :param decks: list of MTGDeck
+    :param lands: see MTGDeck.similar
+    :param qty: if False, each card is counted once
+    :return: tuple t = (M,cnames) where M is a scipy.sparse csr matrix with a
+     row for each deck and cnames is the list of card names (columns)
+    """
+    try:
+        from scipy.sparse import csr_matrix
+    except ImportError:
+        raise lts.LituusException(lts.EIMPL,"Batch deck operations require scipy")
+
+    cidx = {}            # cardname -> column index
+    rs,cs,vs = [],[],[]  # row, col, data for the coo triplets
+    for i,deck in enumerate(decks):
+        for cname,q in deck._card_qty_(lands,qty).items():
+            rs.append(i)
+            cs.append(cidx.setdefault(cname,len(cidx)))
+            vs.append(q)
+    M = csr_matrix((vs,(rs,cs)),shape=(len(decks),len(cidx)),dtype='int32')
+    return M,sorted(cidx,key=cidx.get)
+
+def similarity_matrix(decks,lands="all",qty=True):
+    """
+     computes the similarity (see MTGDeck.similar) of every pair of decks.
+     Since min(a,b) = sum over k >= 1 of [a >= k][b >= k], the quantity matrix
+     is expanded into threshold layers (a column per card and qty level) and
+     the similarity matrix is the product of the layer matrix and its transpose
+    :param decks: list of MTGDeck
+    :param lands: see MTGDeck.similar
+    :param qty: see MTGDeck.similar
+    :return: a DxD numpy array S where S[i,j] = decks[i].similar(decks[j])
+    """
+    try:
+        import numpy as np
+        from scipy.sparse import csr_matrix
+    except ImportError:
+        raise lts.LituusException(lts.EIMPL,"Batch deck operations require scipy")
+
+    M,_ = deck_matrix(decks,lands,qty)
+    if not qty: L = M
+    else:
+        # expand each nonzero (i,j,q) into q unit entries at columns (j,1..q)
+        M = M.tocoo()
+        q = M.data
+        n = int(q.sum())
+        kmax = int(q.max()) if n else 1
+        k = np.arange(n) - np.repeat(np.cumsum(q) - q,q) # 0..q-1 within each run
+        rs = np.repeat(M.row,q)
+        cs = np.repeat(M.col,q) * kmax + k
+        L = csr_matrix(
+            (np.ones(n,dtype='int32'),(rs,cs)),shape=(M.shape[0],M.shape[1]*kmax)
+        )
+    return (L @ L.T).toarray()
@@ -16,11 +16,16 @@ Contains:
  mtgl.py - defines regex, string replacements etc for parsing/processin mtg oracle
   text
  mtgl_dd.py - defines mtgl data dictionary for the grapher
+ lazyre.py - lazily compiled pattern registry for mtgl and mtgl_dd w/ timeouts
  mtgltag.py - defines functions to work with mtgl tags
  tagger.py - tagging mtg oracle text
+ vocab.py - single scan tagger of the first pass word lists
+ tagcheck.py - differential checks of optimized tagger stages
+ latency.py - per card tagging & graphing latencies of the multiverse build
  lexer.py - tokenizes the tagged text
  grapher.py - parses the tagged text and graphs it
  mtgt.py - defines the MTGTree (a wrapper around a networkx rooted, ordered DAG)
+  its compact encoding and the read-only FrozenMTGTree
 """
 
 #__name__ = 'mtgl'
@@ -20,20 +20,45 @@ __maintainer__ = 'Temporal Inept'
 __email__ = 'temporalinept@mail.com'
 __status__ = 'Development'
 
+import threading
+import functools
 import regex as re
 import lituus as lts
 import lituus.mtgl.mtgl as mtgl
+import lituus.mtgl.lazyre as lazyre
 import lituus.mtgl.mtgt as mtgt
 import lituus.mtgl.mtgl_dd as dd
 import lituus.mtgl.mtgltag as mtgltag
 
 # TODO: togroup signifies attributes that need to be graphed
-def graph(dcard):
+def graph(dcard,stats=None,prof=None):
     """
     graphs the oracle text in card cname return the MTG Tree
     :param dcard: the card dictionary
+    :param stats: if a dict, is updated with the card's memo counters: evals
+     (checks & handlers evaluated), avoided (evaluations answered by the memo)
+     and failed (handler failures memoized)
+    :param prof: if set, a function prof(name,handler,args,kws) called in place
+     of each graph_* handler while graphing the card in this thread (see
+     latency)
     :return: the MTG Tree of the oracle text
     """
+    prev = getattr(_local_,'memo',None),getattr(_local_,'prof',None)
+    _local_.memo = memo = _Memo()
+    _local_.prof = prof
+    try:
+        with lazyre.watching(dcard['name']): return _graph_(dcard)
+    except lts.LituusException as e:
+        if e.errno != lts.ETIMEOUT: raise
+        raise lts.LituusException(
+            lts.ETIMEOUT,"Graphing {} failed due to {}".format(dcard['name'],e)
+        )
+    finally:
+        _local_.memo,_local_.prof = prev
+        if stats is not None: stats.update(memo.stats())
+
+def _graph_(dcard):
+    """ graphs the oracle text in card cname (see graph) """
     # create an empty tree & grab the parent. setup lines
     t = mtgt.MTGTree(dcard['name'])
     parent = t.root
@@ -108,33 +133,35 @@ def graph_keyword(t,pid,kw,ktype,param):
     :param ktype: optional keyword type (landwalk,cycling,offering)
     :param param: optional parameters
     """
-    # create the keyword clause node with keyword (replacing underscore w/ space
-    # and capitalizing first letter)
-    kwid = t.add_node(pid,'kw-clause')
-    t.add_node(kwid,'keyword',value=kw.replace('_',' ').capitalize())
-    if ktype: t.add_node(kwid,'type',value=ktype)
     try:
-        m = dd.kw_param[kw].search(param)
-        if m.endpos == len(param):
-            if m.group() != '': # have a good match, continue
-                try:
-                    # TODO: for each of these, have to graph accordingly i.e. cost
-                    #  should be graphed as a cost etc
-                    for i,k in enumerate(dd.kw_param_template[kw]):
-                        if m.group(i+1):
-                            if k == 'cost':
-                                graph_cost(t,t.add_node(kwid,'cost'),m.group(i+1))
-                            else: t.add_node(kwid,k,value=m.group(i+1))
-                except IndexError:
-                    raise lts.LituusException(
-                        lts.EPTRN,"{} does not match template".format(kw)
-                    )
-        else: raise lts.LituusException(lts.EPTRN,"Incomplete match for {}".format(kw))
+        val,search,builders = (_kw_table_ or _kw_dispatch_())[kw]
     except KeyError:
         raise lts.LituusException(
             lts.EPTRN,"Missing template for keyword {}".format(kw)
         )
 
+    # create the keyword clause node with keyword (replacing underscore w/ space
+    # and capitalizing first letter). Keywords w/o parameters are done
+    kwid = t.add_node(pid,'kw-clause')
+    t.add_node(kwid,'keyword',value=val)
+    if ktype: t.add_node(kwid,'type',value=ktype)
+    if search is None: return kwid
+
+    m = search(param)
+    if not m:
+        raise lts.LituusException(lts.EPTRN,"Incomplete match for {}".format(kw))
+    if m.group() == '': return kwid
+    if builders is None:
+        raise lts.LituusException(lts.EPTRN,"{} does not match template".format(kw))
+    # TODO: for each of these, have to graph accordingly i.e. cost
+    #  should be graphed as a cost etc
+    for i,k in builders:
+        v = m.group(i)
+        if v:
+            if k == 'cost': graph_cost(t,t.add_node(kwid,'cost'),v)
+            else: t.add_node(kwid,k,value=v)
+    return kwid
+
 def graph_line(t,pid,line,ctype=None):
     """
     graphs the line of tagged text
@@ -299,78 +326,98 @@ def graph_phrase(t,pid,line,i=0):
     """
     Graphs phrases looking first at high-level consructs. Starting again with
     triggered and activated abilities, then replacement effects (614.1,614.2),
-    and alternate cost (APC) effects (118.9)
+    and alternate cost (APC) effects (118.9). Works off a worklist of (phrase,
+    iteration) where phrases that are not graphed are split into sentences
+    (or passed again) and added back to the worklist
     :param t: the tree
     :param pid: parent of the line
     :param line: the text to graph
     :param i: iteration count to avoid infinite recursion
+    :return: the node id of the last phrase graphed
+    """
+    rid = None
+    work = [(line,i)]
+    while work:
+        line,i = work.pop()
+        rid = _graph_phrase_(t,pid,line,i,work)
+    return rid
+
+def _graph_phrase_(t,pid,line,i,work):
+    """
+    graphs a phrase from graph_phrase's worklist
+    :param t: the tree
+    :param pid: parent of the line
+    :param line: the text to graph
+    :param i: iteration count to avoid infinite recursion
+    :param work: the worklist, phrases to graph are added in reverse order
+    :return: the node id or None if phrases were added to the worklist
     """
     # check for activated /triggered ability and complex phrases
-    if _activated_check_(line): return graph_activated(t,pid,line)
-    elif dd.re_tgr_check.search(line): return graph_triggered(t,pid,line)
-    elif dd.re_complex_tgr_check.search(line): graph_complex_triggered(t,pid,line)
+    if _search_(_activated_check_,line): return graph_activated(t,pid,line)
+    elif _search_(dd.re_tgr_check,line): return graph_triggered(t,pid,line)
+    elif _search_(dd.re_complex_tgr_check,line): graph_complex_triggered(t,pid,line)
     else:
         # TODO: can we make a check for all of these?
         # have to modal first', due to  graph_replacment_effect mistakenly
         #  grabbing portions of modal lines
-        if dd.re_modal_check.search(line): return graph_modal_phrase(t,pid,line)
+        if _search_(dd.re_modal_check,line): return graph_modal_phrase(t,pid,line)
 
         # replacement effects
-        rid = graph_replacement_effect(t,pid,line)
+        rid = _memo_(graph_replacement_effect,t,pid,line)
         if rid: return rid
 
         # alternate casting costs
-        rid = graph_apc_phrase(t,pid,line)
+        rid = _memo_(graph_apc_phrase,t,pid,line)
         if rid: return rid
 
         # additional casting costs
-        if dd.re_add_cost_check.search(line):
-            rid = graph_additional_cost_phrase(t,pid,line)
+        if _search_(dd.re_add_cost_check,line):
+            rid = _memo_(graph_additional_cost_phrase,t,pid,line)
             if rid: return rid
 
         # restriction phrases
-        rid = graph_restriction_phrase(t,pid,line)
+        rid = _memo_(graph_restriction_phrase,t,pid,line)
         if rid: return rid
 
         # exception clauses
-        if dd.re_excp_check.search(line):
-            rid = graph_exception_phrase(t, pid, line)
+        if _search_(dd.re_excp_check,line):
+            rid = _memo_(graph_exception_phrase,t,pid,line)
             if rid: return rid
 
         # delayed triggers
-        if dd.re_delayed_tgr_check.search(line):
-            rid = graph_delayed_tgr(t,pid,line)
+        if _search_(dd.re_delayed_tgr_check,line):
+            rid = _memo_(graph_delayed_tgr,t,pid,line)
             if rid: return rid
 
         # condition phrases
-        rid = graph_conditional_phrase(t,pid,line)
+        rid = _memo_(graph_conditional_phrase,t,pid,line)
         if rid: return rid
 
         # optional phrases
-        if dd.re_optional_check.search(line):
-            rid = graph_optional_phrase(t,pid,line)
+        if _search_(dd.re_optional_check,line):
+            rid = _memo_(graph_optional_phrase,t,pid,line)
             if rid: return rid
 
         # sequences
-        if dd.re_seq_check.search(line):
-            rid = graph_sequence_phrase(t,pid,line)
+        if _search_(dd.re_seq_check,line):
+            rid = _memo_(graph_sequence_phrase,t,pid,line)
             if rid: return rid
 
         # multiple comjoined action clause phrases
-        rid = graph_conjoined_phrase(t,pid,line)
+        rid = _memo_(graph_conjoined_phrase,t,pid,line)
         if rid: return rid
 
         # Now we have to break down the line in smaller chunks: sentences and
         # then clauses
         ss = [x.strip() + '.' for x in dd.re_sentence.split(line) if x]
         if len(ss) > 1:
-            rid = None
-            for s in ss: rid = graph_phrase(t,pid,s,i+1)
-            return rid # return the last one
+            work.extend((s,i+1) for s in reversed(ss))
+            return None # the last sentence's node is returned
         else:
             # if the iteration is less than one we have to run it through again
-            # or oracle text with only one sentence will not be graphed
-            if i < 1: return graph_phrase(t,pid,line,i+1)
+            # or oracle text with only one sentence will not be graphed. The
+            # second pass only re-evaluates what did not fail (see _memo_)
+            if i < 1: work.append((line,i+1))
             else: return graph_clause(t,pid,line)
                 # split the phrase into clauses (by comma) - we have to run the
                 # individual clauses through graph_phrase first NOTE: the clause
@@ -381,6 +428,7 @@ def graph_phrase(t,pid,line,i=0):
                 #    for clause in [x.strip() for x in dd.re_clause.split(line) if x]:
                 #        cid = graph_phrase(t,pid,clause)
                 #    return cid # return the last one
+    return None
 
 def graph_clause(t,pid,clause):
     """
@@ -390,13 +438,13 @@ def graph_clause(t,pid,clause):
     :param clause: the text to graph
     """
     # turn structures
-    if dd.re_ts_check.search(clause):
-        rid = graph_turn_structure(t,pid,clause)
+    if _search_(dd.re_ts_check,clause):
+        rid = _memo_(graph_turn_structure,t,pid,clause)
         if rid: return rid
 
     # action clauses
-    if dd.re_act_clause_check.search(clause):
-        rid = graph_action_clause(t,pid,clause)
+    if _search_(dd.re_act_clause_check,clause):
+        rid = _memo_(graph_action_clause,t,pid,clause)
         if rid: return rid
 
     # phase clauses
@@ -2368,6 +2416,102 @@ def graph_phase_clause(t,pid,clause):
 ## PRIVATE FUNCTIONS
 ####
 
+# the memo & profiler of the card being graphed in this thread
+_local_ = threading.local()
+
+def _hook_(handler):
+    """ wraps the graph_* handler, calling the thread's profiler if any """
+    name = handler.__name__
+    @functools.wraps(handler)
+    def wrapper(*args,**kws):
+        prof = getattr(_local_,'prof',None)
+        if prof is None: return handler(*args,**kws)
+        return prof(name,handler,args,kws)
+    return wrapper
+
+# keyword -> (keyword node value,parameter search or None,node builders)
+_kw_table_ = {}
+
+def _kw_dispatch_():
+    """
+     builds the keyword dispatch table from mtgl_dd's keyword parameter patterns
+     & templates once. Keywords w/o parameters (re_kw_empty) get no search and
+     the node builders are tuples t = (group #,node type) or None if the
+     template has more groups than the pattern
+    :return: the table
+    """
+    tbl = {}
+    for kw,ptrn in dd.kw_param.items():
+        val = kw.replace('_',' ').capitalize()
+        if ptrn is dd.re_kw_empty:
+            tbl[kw] = (val,None,())
+            continue
+        tmpl = dd.kw_param_template.get(kw,())
+        if len(tmpl) > ptrn.compiled().groups: bs = None # fails when graphed
+        else: bs = tuple((i+1,k) for i,k in enumerate(tmpl))
+        tbl[kw] = (val,ptrn.search,bs)
+    _kw_table_.update(tbl)
+    return _kw_table_
+
+class _Memo(object):
+    """
+     per card memo of the check pattern results and of the handlers that failed
+     (returned None) on a phrase. Checks and handlers depend only on the phrase
+     so a phrase re-entering graph_phrase (i.e. the second pass of single
+     sentence lines) does not re-evaluate them
+    """
+    __slots__ = ('checks','failed','evals','avoided')
+
+    def __init__(self):
+        self.checks = {}     # (check,phrase) -> result
+        self.failed = set()  # (handler name,phrase)
+        self.evals = 0
+        self.avoided = 0
+
+    def stats(self):
+        return {'evals':self.evals,'avoided':self.avoided,'failed':len(self.failed)}
+
+def _search_(chk,phrase):
+    """
+     returns whether the check chk (a pattern or a function of the phrase)
+     matches phrase, memoized per card
+    :param chk: check pattern or function
+    :param phrase: the text to check
+    :return: True if the check matches
+    """
+    memo = getattr(_local_,'memo',None)
+    fct = chk if callable(chk) and not hasattr(chk,'search') else chk.search
+    if memo is None: return bool(fct(phrase))
+    k = (getattr(chk,'pattern',chk),phrase) # LazyPatterns replace themselves
+    try:
+        ret = memo.checks[k]
+        memo.avoided += 1
+    except KeyError:
+        ret = memo.checks[k] = bool(fct(phrase))
+        memo.evals += 1
+    return ret
+
+def _memo_(handler,t,pid,phrase):
+    """
+     calls handler(t,pid,phrase) unless it already failed on phrase for this
+     card
+    :param handler: the graph_* function
+    :param t: the tree
+    :param pid: parent id
+    :param phrase: the text to graph
+    :return: the handler's node id or None
+    """
+    memo = getattr(_local_,'memo',None)
+    if memo is None: return handler(t,pid,phrase)
+    k = (handler.__name__,phrase)
+    if k in memo.failed:
+        memo.avoided += 1
+        return None
+    memo.evals += 1
+    rid = handler(t,pid,phrase)
+    if not rid: memo.failed.add(k)
+    return rid
+
 def _enclosed_quote_(t,m):
     """
     graphs the contents of an enclosed quote (in m) under an unrooted node and
@@ -2987,3 +3131,9 @@ def _graph_ap_attack_(t,pid,param):
     except lts.LituusException as e:
         if e.errno == lts.EPTRN and doid: t.del_node(doid)
     return None
+
+# every graph_* handler, however it is reached (directly, _memo_ or the keyword
+# dispatch table), goes through _hook_ so a profiler only sees its own thread
+for _h_ in [h for h in list(globals()) if h.startswith('graph_')]:
+    globals()[_h_] = _hook_(globals()[_h_])
+del _h_
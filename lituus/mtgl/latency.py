@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+""" latency.py
+Copyright (C) 2019  Temporal Inept (temporalinept@mail.com)
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+Per card tagging and graphing latencies. Profiles each card's tagging (tag) and
+graphing (graph) attributing graphing time to the grapher's graph_* handlers,
+summarizing the latencies as percentiles (p50/p95/p99/max) w/ the slowest cards.
+The multiverse build saves its profile (see multiverse) and reports the change
+from the previous build. Run as
+ python -m lituus.mtgl.latency [n] [path to corpus]
+to profile a corpus (default is the benchmark corpus) reporting the n slowest
+cards or
+ python -m lituus.mtgl.latency saved [n]
+to report the profile of the last multiverse build
+"""
+
+#__name__ = 'latency'
+__license__ = 'GPLv3'
+__version__ = '0.0.1'
+__date__ = 'August 2020'
+__author__ = 'Temporal Inept'
+__maintainer__ = 'Temporal Inept'
+__email__ = 'temporalinept@mail.com'
+__status__ = 'Development'
+
+import os
+import sys
+import json
+import time
+import lituus as lts
+import lituus.mtg as mtg
+import lituus.mtgl.tagger as tagger
+import lituus.mtgl.grapher as grapher
+import lituus.mtgl.lazyre as lazyre
+
+# latencies of the last multiverse build
+pth_latency = os.path.join(mtg.pth_sto,'latency.json')
+
+# stages profiled and the percentiles reported
+stages = ['tag','graph']
+pcts = [('p50',0.50),('p95',0.95),('p99',0.99),('max',1.0)]
+
+def profile(dcards,ctx=None,top=20):
+    """
+     tags and graphs each card in dcards timing each. Graphing time is
+     attributed to the graph_* handler it was spent in (exclusive of the
+     handlers it called) through the grapher's per thread profiler hook (see
+     grapher.graph) so other threads graphing are not profiled
+    :param dcards: dict name -> card dict with at least the keys 'oracle' and
+     'type' (i.e. from multiverse.harvest)
+    :param ctx: tagger.TaggerContext (default is the mtgl name references)
+    :param top: number of slowest cards kept per stage
+    :return: the profile dict with keys
+      'cards': number of cards,
+      'tag','graph': {'p50','p95','p99','max': ms,'ttl': s,
+                      'slowest': list of [name,ms,handler]},
+      'handlers': dict graph_* handler -> {'n': calls,'ms': exclusive time},
+      'errors': dict name -> error message
+    """
+    lat = {s:{} for s in stages}
+    hs = {}
+    errs = {}
+    hcard = {} # name -> the handler taking the most of the card's graph time
+    # keep compiling patterns & the tagger's first use out of the card times
+    lazyre.warm()
+    for cname in list(dcards)[:1]:
+        try:
+            tagger.tag(cname,dcards[cname]['oracle'],ctx)
+        except lts.LituusException:
+            pass
+    prof = _Profiler(hs)
+    for cname in dcards:
+        dcard = dcards[cname]
+        start = time.perf_counter()
+        try:
+            txt = tagger.tag(cname,dcard['oracle'],ctx)
+        except lts.LituusException as e:
+            errs[cname] = "tag: {}".format(e)
+            continue
+        lat['tag'][cname] = time.perf_counter() - start
+
+        prof.reset()
+        start = time.perf_counter()
+        try:
+            grapher.graph({'name':cname,'tag':txt,'type':dcard['type']},prof=prof)
+        except Exception as e: # the grapher raises more than its own errors
+            errs[cname] = "graph: {}".format(e)
+            continue
+        lat['graph'][cname] = time.perf_counter() - start
+        if prof.card: hcard[cname] = max(prof.card,key=prof.card.get)
+
+    prof = {'cards':len(dcards),'handlers':{},'errors':errs}
+    for s in stages:
+        prof[s] = summarize(lat[s])
+        prof[s]['slowest'] = [
+            [cname,round(el*1000,3),hcard.get(cname) if s == 'graph' else None]
+            for cname,el in sorted(lat[s].items(),key=lambda x: -x[1])[:top]
+        ]
+    for h in sorted(hs,key=lambda h: -hs[h][1]):
+        prof['handlers'][h] = {'n':hs[h][0],'ms':round(hs[h][1]*1000,3)}
+    return prof
+
+def summarize(lat):
+    """
+     summarizes latencies
+    :param lat: dict name -> seconds
+    :return: dict with the percentiles (ms) & the total (s)
+    """
+    els = sorted(lat.values())
+    ret = {}
+    for p,q in pcts:
+        ret[p] = round(els[max(0,int(round(q*len(els)))-1)]*1000,3) if els else None
+    ret['ttl'] = round(sum(els),4)
+    return ret
+
+def report(prof,n=10,prev=None):
+    """
+     formats the profile prof
+    :param prof: the profile (see profile)
+    :param n: number of slowest cards & handlers to include
+    :param prev: a previous profile to compare percentiles against
+    :return: the report string
+    """
+    ls = ["{} cards ({} errors)".format(prof['cards'],len(prof['errors']))]
+    hdr = "{:<6}" + " {:>10}"*len(pcts) + " {:>9}"
+    ls.append(hdr.format('ms',*[p for p,_ in pcts],'ttl s'))
+    for s in stages:
+        ls.append(
+            hdr.format(s,*[_fmt_(prof[s][p]) for p,_ in pcts],prof[s]['ttl'])
+        )
+        if prev and s in prev:
+            ls.append(
+                hdr.format(
+                    ' prev',*[_fmt_(prev[s].get(p)) for p,_ in pcts],
+                    prev[s].get('ttl')
+                )
+            )
+            ls.append(
+                hdr.format(
+                    ' chg',*[_chg_(prof[s][p],prev[s].get(p)) for p,_ in pcts],
+                    _chg_(prof[s]['ttl'],prev[s].get('ttl'))
+                )
+            )
+    for s in stages:
+        ls.append("slowest {}:".format(s))
+        for cname,ms,h in prof[s]['slowest'][:n]:
+            ls.append(
+                " {:>9.2f}ms {}{}".format(ms,cname," ({})".format(h) if h else '')
+            )
+    ls.append("graph_* handlers (exclusive ms):")
+    for h in list(prof['handlers'])[:n]:
+        ls.append(
+            " {:>9.2f}ms {:>7} calls {}".format(
+                prof['handlers'][h]['ms'],prof['handlers'][h]['n'],h
+            )
+        )
+    return "\n".join(ls)
+
+def save(prof,f=None):
+    """
+     saves the profile prof w/ the date it was made
+    :param prof: the profile (see profile)
+    :param f: path to save to (default is pth_latency)
+    """
+    prof['date'] = time.strftime('%Y-%m-%d %H:%M:%S')
+    try:
+        with open(f if f else pth_latency,'w') as fout: json.dump(prof,fout,indent=1)
+    except IOError:
+        raise lts.LituusException(lts.EIOOUT,"Failed saving latencies")
+
+def load(f=None):
+    """
+     loads a saved profile
+    :param f: path to load from (default is pth_latency)
+    :return: the profile or None if there is no saved profile
+    """
+    try:
+        with open(f if f else pth_latency,'r') as fin: return json.load(fin)
+    except FileNotFoundError:
+        return None
+    except (IOError,ValueError):
+        raise lts.LituusException(lts.EIOIN,"Error reading latencies")
+
+####
+# PRIVATE FCTS
+####
+
+class _Profiler(object):
+    """
+     the grapher profiler hook (see grapher.graph) accumulating calls &
+     exclusive seconds per graph_* handler
+    """
+    def __init__(self,hs):
+        """
+        :param hs: dict handler -> [calls,seconds] to accumulate in
+        """
+        self.hs = hs
+        self.card = {}  # handler -> exclusive seconds for the card being graphed
+        self._stack = [] # [entry time,time spent in child handlers]
+
+    def reset(self):
+        """ starts a new card """
+        self.card = {}
+        self._stack = []
+
+    def __call__(self,h,fct,args,kws):
+        fr = [time.perf_counter(),0.0]
+        self._stack.append(fr)
+        try:
+            return fct(*args,**kws)
+        finally:
+            self._stack.pop()
+            el = time.perf_counter() - fr[0]
+            if self._stack: self._stack[-1][1] += el
+            acc = self.hs.setdefault(h,[0,0.0])
+            acc[0] += 1
+            acc[1] += el - fr[1]
+            self.card[h] = self.card.get(h,0.0) + el - fr[1]
+
+def _fmt_(ms): return '-' if ms is None else "{:.2f}".format(ms)
+
+def _chg_(cur,prev):
+    """ returns the relative change from prev to cur """
+    if cur is None or not prev: return '-'
+    return "{:+.0%}".format((cur-prev)/prev)
+
+def main(argv):
+    """ profiles a corpus or reports the saved profile (see module docstring) """
+    ns = [int(a) for a in argv[1:] if a.isdigit()]
+    n = ns[0] if ns else 10
+    if 'saved' in argv[1:]:
+        prof = load()
+        if prof is None:
+            print("No saved latencies, build the multiverse first")
+            return 1
+        print("Multiverse build of {}".format(prof.get('date')))
+        print(report(prof,n))
+        return 0
+
+    import lituus.benchmark as benchmark
+    import lituus.multiverse as multiverse
+    from hashlib import md5
+    ps = [a for a in argv[1:] if not a.isdigit()]
+    jv = benchmark.load_corpus(ps[0] if ps else None)
+    ctx = tagger.TaggerContext({c:md5(c.encode()).hexdigest() for c in jv})
+    dcards = {c:multiverse.harvest(c,jv[c]) for c in jv}
+    to,bgt = lazyre.TIMEOUT,lazyre.BUDGET
+    if to is None: lazyre.set_timeout(multiverse.re_timeout,multiverse.re_budget)
+    try:
+        prof = profile(dcards,ctx,max(n,20))
+    finally:
+        lazyre.set_timeout(to,bgt)
+    print(report(prof,n,load()))
+    return 0
+
+if __name__ == '__main__': sys.exit(main(sys.argv))
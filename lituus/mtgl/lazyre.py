@@ -0,0 +1,310 @@
+#!/usr/bin/env python
+""" lazyre.py
+Copyright (C) 2019  Temporal Inept (temporalinept@mail.com)
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+A registry of lazily compiled regular expressions. mtgl and mtgl_dd define
+several hundred patterns (some with thousands of alternatives) of which most
+users of a module only need a few. Patterns are compiled on first use and the
+registry can be warmed i.e. before forking workers. A per call timeout and a
+per subject (i.e. card) budget can be set on the registered patterns (see
+set_timeout) bounding the time a pattern that backtracks badly or a card
+making many slow calls can stall tagging or graphing. Run as
+ python -m lituus.mtgl.lazyre [n]
+to report the import time of the pattern libraries and the n most costly
+patterns to compile
+"""
+
+#__name__ = 'lazyre'
+__license__ = 'GPLv3'
+__version__ = '0.0.1'
+__date__ = 'August 2020'
+__author__ = 'Temporal Inept'
+__maintainer__ = 'Temporal Inept'
+__email__ = 'temporalinept@mail.com'
+__status__ = 'Development'
+
+import os
+import sys
+import time
+import threading
+import collections
+from contextlib import contextmanager
+import regex as re
+import lituus as lts
+
+# set LITUUS_EAGER_RE to compile patterns when they are defined
+EAGER = bool(os.environ.get('LITUUS_EAGER_RE'))
+
+# set LITUUS_RE_TIMEOUT to the seconds a pattern may take per call (see
+# set_timeout). While a timeout is set, calls taking longer than SLOW seconds
+# are logged (see slow)
+TIMEOUT = float(os.environ.get('LITUUS_RE_TIMEOUT') or 0) or None
+SLOW = 0.05
+
+# set LITUUS_RE_BUDGET to the seconds the calls matching a subject may take in
+# total while a timeout is set (see set_timeout & watching)
+BUDGET = float(os.environ.get('LITUUS_RE_BUDGET') or 0) or None
+
+class LazyPattern(object):
+    """
+     a regex.Pattern compiled on first use. Once compiled, the pattern replaces
+     itself in the module it was registered with (see register) so that later
+     lookups i.e. mtgl.re_obj get the compiled pattern directly unless a
+     timeout is set in which case calls go through the LazyPattern
+    """
+    __slots__ = ('_ptrn','_flags','_c','_mod','name','cost')
+
+    def __init__(self,ptrn,flags=0):
+        self._ptrn = ptrn
+        self._flags = flags
+        self._c = None
+        self._mod = None
+        self.name = None
+        self.cost = None # seconds taken to compile
+
+    def __repr__(self):
+        return "LazyPattern({!r}{})".format(
+            self._ptrn if len(self._ptrn) < 60 else self._ptrn[:57] + '...',
+            '' if self._c is None else ', compiled'
+        )
+
+    def __getattr__(self,attr): return getattr(self.compiled(),attr)
+
+    @property
+    def pattern(self): return self._ptrn
+
+    @property
+    def flags(self): return self.compiled().flags
+
+    @property
+    def is_compiled(self): return self._c is not None
+
+    def compiled(self):
+        """ returns the compiled regex.Pattern, compiling it if necessary """
+        if self._c is None:
+            start = time.perf_counter()
+            self._c = re.compile(self._ptrn,self._flags)
+            self.cost = time.perf_counter() - start
+            if TIMEOUT is None and self._mod and getattr(self._mod,self.name,None) is self:
+                setattr(self._mod,self.name,self._c)
+        return self._c
+
+    @property
+    def label(self):
+        """ the module qualified name of the pattern i.e. mtgl.re_obj """
+        if not self._mod: return repr(self)
+        return "{}.{}".format(self._mod.__name__.split('.')[-1],self.name)
+
+    # delegate the commonly used methods w/o going through __getattr__
+    def sub(self,*args,**kws): return self._call_(self.compiled().sub,args,kws)
+    def subn(self,*args,**kws): return self._call_(self.compiled().subn,args,kws)
+    def search(self,*args,**kws): return self._call_(self.compiled().search,args,kws)
+    def match(self,*args,**kws): return self._call_(self.compiled().match,args,kws)
+    def fullmatch(self,*args,**kws): return self._call_(self.compiled().fullmatch,args,kws)
+    def findall(self,*args,**kws): return self._call_(self.compiled().findall,args,kws)
+    def split(self,*args,**kws): return self._call_(self.compiled().split,args,kws)
+
+    def finditer(self,*args,**kws):
+        if TIMEOUT is None: return self.compiled().finditer(*args,**kws)
+        return self._iter_(args,kws)
+
+    def _call_(self,fct,args,kws):
+        """ calls the compiled pattern's method fct, timing out if set """
+        if TIMEOUT is None: return fct(*args,**kws)
+        kws['timeout'] = to = _limit_(self)
+        start = time.perf_counter()
+        try:
+            ret = fct(*args,**kws)
+        except TimeoutError:
+            raise _timedout_(self,time.perf_counter()-start,to < TIMEOUT)
+        el = time.perf_counter() - start
+        if el >= SLOW: _watch_(self,el)
+        return ret
+
+    def _iter_(self,args,kws):
+        """ iterates the matches of finditer, timing out if set """
+        to = _limit_(self)
+        start = time.perf_counter()
+        try:
+            yield from self.compiled().finditer(*args,timeout=to,**kws)
+        except TimeoutError:
+            raise _timedout_(self,time.perf_counter()-start,to < TIMEOUT)
+        el = time.perf_counter() - start
+        if el >= SLOW: _watch_(self,el)
+
+# all patterns in order of definition
+_registry_ = []
+
+def compile(ptrn,flags=0):
+    """
+     defines a pattern to be compiled on first use
+    :param ptrn: the pattern string
+    :param flags: regex flags
+    :return: LazyPattern
+    """
+    lp = LazyPattern(ptrn,flags)
+    _registry_.append(lp)
+    if EAGER: lp.compiled()
+    return lp
+
+def register(modname):
+    """
+     names the module level LazyPatterns of module modname i.e. 'mtgl.re_obj'.
+     Call at the end of the module
+    :param modname: the module's __name__
+    """
+    mod = sys.modules[modname]
+    for name,obj in list(vars(mod).items()):
+        if isinstance(obj,LazyPattern) and obj._mod is None:
+            obj._mod = mod
+            obj.name = name
+            if obj.is_compiled and TIMEOUT is None: setattr(mod,name,obj._c)
+
+def lazy(ptrn):
+    """
+     returns the registered LazyPattern of ptrn so that an object storing the
+     pattern i.e. a vocab.Sub calls it through the timeout & budget
+    :param ptrn: a LazyPattern or the compiled pattern a LazyPattern replaced
+     itself with
+    :return: the LazyPattern (ptrn if it is not registered)
+    """
+    if isinstance(ptrn,LazyPattern): return ptrn
+    for lp in _registry_:
+        if lp._c is ptrn: return lp
+    return ptrn
+
+def warm():
+    """
+     compiles all uncompiled patterns
+    :return: the number of patterns compiled
+    """
+    n = 0
+    for lp in _registry_:
+        if not lp.is_compiled:
+            lp.compiled()
+            n += 1
+    return n
+
+def set_timeout(secs,budget=None):
+    """
+     sets the seconds each call of a registered pattern may take and the
+     seconds all the calls matching a subject (see watching) may take before
+     raising a LituusException (ETIMEOUT). While set, the registered patterns
+     are called through their LazyPattern and slow calls are logged (see
+     slow). Patterns looked up before setting i.e. stored in another object are
+     not affected (see lazy). The budget is checked when a call starts and
+     bounds the call, time spent outside the registered patterns counts
+     against the budget but is not interrupted
+    :param secs: seconds per call or None to remove the timeout (& budget)
+    :param budget: seconds per subject or None for no budget
+    """
+    global TIMEOUT,BUDGET
+    TIMEOUT = secs if secs else None
+    BUDGET = budget if budget and TIMEOUT else None
+    for lp in _registry_:
+        if lp._mod is None: continue
+        cur = getattr(lp._mod,lp.name,None)
+        if cur is not lp and cur is not lp._c: continue # rebound by the module
+        setattr(lp._mod,lp.name,lp._c if TIMEOUT is None and lp.is_compiled else lp)
+
+@contextmanager
+def watching(subject,n=1):
+    """
+     names what is being matched in the current thread i.e. the card being
+     tagged, logged with slow calls. While a budget is set, the calls matching
+     the subject time out once the subject has taken n budgets (within the
+     budget of an enclosing subject)
+    :param subject: the name of what is being matched
+    :param n: number of budgets the subject gets i.e. a batch of n cards
+    """
+    prev = getattr(_local_,'subject',None),getattr(_local_,'deadline',None)
+    _local_.subject = subject
+    if BUDGET:
+        dl = time.perf_counter() + BUDGET*n
+        _local_.deadline = dl if prev[1] is None else min(dl,prev[1])
+    try:
+        yield
+    finally:
+        _local_.subject,_local_.deadline = prev
+
+def slow():
+    """
+     returns the logged slow calls (the last 1000)
+    :return: list of tuples t = (subject,pattern,seconds,timed out)
+    """
+    return list(_slow_)
+
+def stats():
+    """
+     returns the compile cost of each compiled pattern
+    :return: list of tuples t = (name,seconds) ordered by decreasing cost
+    """
+    ss = [(lp.label if lp._mod else '?',lp.cost) for lp in _registry_ if lp.is_compiled]
+    return sorted(ss,key=lambda x: -x[1])
+
+def pending(): return sum(1 for lp in _registry_ if not lp.is_compiled)
+
+####
+# PRIVATE FCTS
+####
+
+_local_ = threading.local()                 # subject & deadline of the current thread
+_slow_ = collections.deque(maxlen=1000)     # logged slow calls
+
+def _watch_(lp,el,to=False):
+    """ logs the call of lp that took el seconds (and timed out if to) """
+    _slow_.append((getattr(_local_,'subject',None),lp.label,el,to))
+
+def _limit_(lp):
+    """
+     returns the seconds the next call of lp may take, the timeout or what is
+     left of the subject's budget if less, raising a LituusException (ETIMEOUT)
+     if the budget is spent
+    """
+    dl = getattr(_local_,'deadline',None)
+    if dl is None: return TIMEOUT
+    left = dl - time.perf_counter()
+    if left <= 0: raise _timedout_(lp,0,True)
+    return min(TIMEOUT,left)
+
+def _timedout_(lp,el,spent=False):
+    """
+     logs lp timing out after el seconds (on the subject's budget if spent)
+     returning the exception
+    """
+    _watch_(lp,el,True)
+    if spent:
+        return lts.LituusException(
+            lts.ETIMEOUT,"{} exceeded its budget at {}".format(
+                getattr(_local_,'subject',None),lp.label
+            )
+        )
+    return lts.LituusException(
+        lts.ETIMEOUT,"{} timed out after {:.2f}s".format(lp.label,el)
+    )
+
+def main(argv):
+    """ reports import & compile times of the mtgl pattern libraries """
+    # run as __main__, the pattern libraries register with the module proper
+    import lituus.mtgl.lazyre as lazyre
+    n = int(argv[1]) if len(argv) > 1 else 20
+    start = time.perf_counter()
+    import lituus.mtgl.mtgl
+    import lituus.mtgl.mtgl_dd
+    it = time.perf_counter() - start
+    np = lazyre.pending()
+    start = time.perf_counter()
+    lazyre.warm()
+    wt = time.perf_counter() - start
+    print("import mtgl & mtgl_dd: {:.1f}ms ({} patterns pending)".format(it*1000,np))
+    print("warm: {:.1f}ms".format(wt*1000))
+    for name,cost in lazyre.stats()[:n]:
+        print(" {:<40} {:8.2f}ms".format(name,cost*1000))
+    return 0
+
+if __name__ == '__main__': sys.exit(main(sys.argv))
@@ -21,6 +21,7 @@ import regex as re
 from collections import OrderedDict
 from hashlib import md5
 import lituus as lts
+import lituus.mtgl.lazyre as lazyre
 
 """
  Defines a series of regular of expressions and string replacements for tagging
@@ -99,6 +100,10 @@ DBL = '"'  # double quote
 SNG = "'"  # single quote
 # symbols used in mtgjson format
 MIN = '−'  # not used yet (found in negative loyalty costs)
+# separates cards in tagger.tag_many, begins and ends with a newline so patterns
+# see a line break and \x1e (record separator) does not occur in oracle text.
+# Patterns whose classes can span lines i.e. [^\.]+ must exclude \x1e
+CRD = '\n\x1e\n'
 
 ####
 # REGEX AND STRING MANIP FOR PARSING
@@ -106,30 +111,30 @@ MIN = '−'  # not used yet (found in negative loyalty costs)
 
 # CATCHALLS
 # re_dbl_qte = r'".*?"'                                    # double quoted string
-re_rem_txt = re.compile(r"\(.+?\)")                        # reminder text
-re_mana_remtxt = re.compile(r"\(({t}: add.+?)\)")          # find add mana inside ()
-re_melds_remtxt = re.compile(r"\((melds with [^\.]+\.)\)") # find melds ... inside ()
-re_non = re.compile(r"non(\w)")                            # find 'non' without hyphen
-re_un = re.compile(r"un(\w)")                              # find 'un'
+re_rem_txt = lazyre.compile(r"\(.+?\)")                        # reminder text
+re_mana_remtxt = lazyre.compile(r"\(({t}: add.+?)\)")          # find add mana inside ()
+re_melds_remtxt = lazyre.compile(r"\((melds with [^\.]+\.)\)") # find melds ... inside ()
+re_non = lazyre.compile(r"non(\w)")                            # find 'non' without hyphen
+re_un = lazyre.compile(r"un(\w)")                              # find 'un'
 
 # DELIMITERS
 
 # matches mtgl punctuation & spaces not inside a tag
-re_tkn_delim = re.compile(
+re_tkn_delim = lazyre.compile(
     r"([:,\.\"\'•—\s])(?![\w \+\/\-=¬∧∨⊕⋖⋗≤≥≡⇔→'\(\)]+>)"
 )
 
 # matches mtgl conjoining operators in a mtgl tag parameter
-re_param_delim_nop = re.compile(r"[∧∨⊕⋖⋗≤≥≡→\(\)]")  # w\o operators
-re_param_delim_wop = re.compile(r"([∧∨⊕⋖⋗≤≥≡→\(\)])")  # w\ operators
+re_param_delim_nop = lazyre.compile(r"[∧∨⊕⋖⋗≤≥≡→\(\)]")  # w\o operators
+re_param_delim_wop = lazyre.compile(r"([∧∨⊕⋖⋗≤≥≡→\(\)])")  # w\ operators
 
 # matches prefix operators
-re_param_prefix = re.compile(r"[\+\-¬]")
+re_param_prefix = lazyre.compile(r"[\+\-¬]")
 
 # conjunction operators
 conj_op = {'and':AND,'or':OR,'and/or':AOR}
 conj_op_tkns = '|'.join(conj_op)
-re_conj_op = re.compile(r"\b({})\b".format(conj_op_tkns))
+re_conj_op = lazyre.compile(r"\b({})\b".format(conj_op_tkns))
 
 ####
 ## CARD REFERENCES
@@ -178,12 +183,12 @@ token_names = [
 TN2R = {n: md5(n.encode()).hexdigest() for n in token_names}
 
 # "create a .... token named NAME" i.e. Cloudseeder
-re_tkn_ref1 = re.compile(
+re_tkn_ref1 = lazyre.compile(
     r"(.+? named) ({})".format('|'.join(list(TN2R.keys())))
 )
 
 # "create TOKEN NAME, .... token."
-re_tkn_ref2 = re.compile(
+re_tkn_ref2 = lazyre.compile(
     r"[C|c]reate ({}), (.+?) token".format('|'.join(list(TN2R.keys())))
 )
 
@@ -194,10 +199,12 @@ meld_tokens = [
     'Brisela, Voice of Nightmares','Chittering Host','Hanweir, the Writhing Township'
 ]
 MN2R = {n: md5(n.encode()).hexdigest() for n in meld_tokens}
-re_tkn_ref3 = re.compile(r"({})".format('|'.join(list(MN2R.keys()))))
+re_tkn_ref3 = lazyre.compile(r"({})".format('|'.join(list(MN2R.keys()))))
 
 # other card referencing will be initialized once in the call to set n2r due to
-# size of name to ref-id dict
+# size of name to ref-id dict. These are the default used by the tagger when it
+# is not given a tagger.TaggerContext (prefer the context, these globals can
+# only hold one multiverse's names at a time)
 re_oth_ref = None
 N2R = None
 
@@ -208,11 +215,11 @@ named_cards = [
     "Throne of Empires","Crown of Empires","Scepter of Empires",
 ]
 NC2R = {n: md5(n.encode()).hexdigest() for n in named_cards}
-re_oth_ref2 = re.compile(r"({})".format('|'.join(list(NC2R.keys()))))
+re_oth_ref2 = lazyre.compile(r"({})".format('|'.join(list(NC2R.keys()))))
 
 def set_n2r(n2r):
     # call global IOT calculate the lengthy regex once during the first call
-    # to tag (Could objectify the tagger and avoid this)
+    # to tag (see tagger.TaggerContext to avoid the globals)
     global re_oth_ref
     global N2R
     if re_oth_ref is None:
@@ -228,16 +235,14 @@ def release_n2r():
     # release/delete the global N2R file (once its no longer needed)
     global re_oth_ref
     global N2R
-    if not N2R is None:
-        N2R = {}
-        del N2R
-        re_oth_ref = None
+    N2R = None
+    re_oth_ref = None
 
 ####
 ## SPECIAL KEYWORD PREPROCESSING
 ####
-re_cycling_pre = re.compile(r"\b(\w+?)cycling\b")  # seperate type & cycling
-re_landwalk_pre = re.compile(r"(\w+?)(?<! land)walk(?!er)")  # seperate type & landwalk
+re_cycling_pre = lazyre.compile(r"\b(\w+?)cycling\b")  # seperate type & cycling
+re_landwalk_pre = lazyre.compile(r"(\w+?)(?<! land)walk(?!er)")  # seperate type & landwalk
 
 ####
 ## WORD HACKS
@@ -324,7 +329,7 @@ word_hacks = {
 
 }
 word_hack_tkns = '|'.join(word_hacks.keys())
-re_word_hack = re.compile(r"\b({})\b".format(word_hack_tkns))
+re_word_hack = lazyre.compile(r"\b({})\b".format(word_hack_tkns))
 
 ####
 ## EHGLISH WORD NUMBERS
@@ -337,28 +342,28 @@ E2I = { # twenty is Ulamog
     'nineteen':'19','twenty':'20',
 }
 e2i_tkns = '|'.join(list(E2I.keys()))
-re_wd2int = re.compile(r"\b({})\b".format(e2i_tkns))
+re_wd2int = lazyre.compile(r"\b({})\b".format(e2i_tkns))
 
 ####
 ## MISC
 ####
 
 # reminder text including the space preceding
-re_reminder = re.compile(r" ?\(.+?\)")
+re_reminder = lazyre.compile(r" ?\(.+?\)")
 
 # modify modal spells IOT facilitate graphing:
 #  1. find occurrences of ".•", as period is used by the grapher to delimit clauses
 #  2. periods inside modal lines signify instructions to that option, find all
 #   periods that are the last one
-re_modal_blt = re.compile(r"\.•")
-re_modal_lvl_instr_fix = re.compile(r"\.(?= )")
+re_modal_blt = lazyre.compile(r"\.•")
+re_modal_lvl_instr_fix = lazyre.compile(r"\.(?= )")
 
 # modify level ups IOT facilitate graphing.
-re_lvl_up = re.compile(r"^(level up {[^\n]+})\n")
-re_lvl_blt = re.compile(r"\n(?=level)")
+re_lvl_up = lazyre.compile(r"^(level up {[^\n]+})\n")
+re_lvl_blt = lazyre.compile(r"\n(?=level)")
 
 # modify sagas IOT facilitate graphing
-re_saga_chapter = re.compile(r"\n([iv]+[,iv]*) — ")
+re_saga_chapter = lazyre.compile(r"\n([iv]+[,iv]*) — ")
 
 ####
 ## BEGIN MTGL REG EX
@@ -378,7 +383,7 @@ lituus_quantifiers = [
     'either',
 ]
 quantifier_tkns = '|'.join(lituus_quantifiers)
-re_quantifier = re.compile(r"\b({})\b".format(quantifier_tkns))
+re_quantifier = lazyre.compile(r"\b({})\b".format(quantifier_tkns))
 
 ####
 ## QUALFIERS
@@ -392,7 +397,7 @@ lituus_qualifiers = [
     'also','maximum','most','much','alone','high','base',
 ]
 qualifier_tkns = '|'.join(lituus_qualifiers)
-re_qualifier = re.compile(r"\b({})\b".format(qualifier_tkns))
+re_qualifier = lazyre.compile(r"\b({})\b".format(qualifier_tkns))
 
 ####
 ## NUMBERS
@@ -401,7 +406,7 @@ re_qualifier = re.compile(r"\b({})\b".format(qualifier_tkns))
 # numbers are 1 or more digits or one of the variable x, y, z which. Only those
 # that are preceded by whitespace, a '/','+','-' or start a line and that are
 # followed by whitespace '/' or '.' are matched.
-re_number = re.compile(
+re_number = lazyre.compile(
     r"(?<=(?:^|[\s\/+-]))(\d+|x|y|z])(?=(?:[—\s\/+-\.:\n]|$))"
 )
 
@@ -414,7 +419,7 @@ objects = [  # objects 109.1 NOTE target can also be an object (115.1)
     'ability','card','copy','token','spell','permanent','emblem','source'
 ]
 obj_tkns = '|'.join(objects)
-re_obj = re.compile(
+re_obj = lazyre.compile(
     r"\b(?<!<[^>]*)({})(?=(?:s|ing|ed|ion|\'s|s\'|:|\.|,|\n|\"|\'| |—|$))".format(obj_tkns)
 )
 
@@ -427,7 +432,7 @@ lituus_objects = [  # lituus objects
     'him','her','loyalty','instance',
 ]
 lobj_tkns = '|'.join(lituus_objects)
-re_lituus_obj = re.compile(
+re_lituus_obj = lazyre.compile(
     r"\b(?<!<[^>]*)({})(?=(?:s|ing|ed|ion|\'s|s\'|:|\.|,|\n|\"|\'| |—|$))".format(lobj_tkns)
 )
 
@@ -437,7 +442,7 @@ lituus_players = [
     'you','opponent','teammate','player','owner','controller','they','bidder',
 ]
 ply_tkns = '|'.join(lituus_players)
-re_lituus_ply = re.compile(
+re_lituus_ply = lazyre.compile(
     r"\b(?<!<[^>]*)({})(?=(?:s|ing|ed|ion|\'s|s\'|:|\.|,|\n|\"|\'| |—|$))".format(ply_tkns)
 )
 
@@ -449,13 +454,13 @@ re_lituus_ply = re.compile(
 phases = [
     'beginning','precombat main','combat','postcombat main','ending','main'
 ]
-re_phase = re.compile(r"\b({}) phase".format('|'.join(phases)))
+re_phase = lazyre.compile(r"\b({}) phase".format('|'.join(phases)))
 
 # because there are cases where combat is not followed by phase, have to do
 # additional checks.
 #  1. preceded by a quantifier this, each or that
 #  2. preceded by a sequence (NOTE: they have not been tagged yet)
-re_combat_phase = re.compile(r"\b(?<!<[^>]*)combat(?! damage)")
+re_combat_phase = lazyre.compile(r"\b(?<!<[^>]*)combat(?! damage)")
 
 # steps
 # 501.1 beginning phase steps - untap, upkeep, draw
@@ -468,12 +473,12 @@ steps1 = ['untap','draw','end','combat damage']  # must be followed by 'step'
 steps2 = [  # may or may not be followed by 'step'
     'upkeep','declare attackers','declare blockers','cleanup',
 ]
-re_step1 = re.compile(r"\b({}) step".format('|'.join(steps1)))
-re_step2 = re.compile(r"\b({})( step)?".format('|'.join(steps2)))
+re_step1 = lazyre.compile(r"\b({}) step".format('|'.join(steps1)))
+re_step2 = lazyre.compile(r"\b({})( step)?".format('|'.join(steps2)))
 
 # generic terms NOTE: standalone 'phase' is handled later in Status)
 generic_turns = ["turn","step","eot"]
-re_generic_turn = re.compile(r"\b({})".format('|'.join(generic_turns)))
+re_generic_turn = lazyre.compile(r"\b({})".format('|'.join(generic_turns)))
 
 ####
 ## ENGLISH
@@ -507,26 +512,26 @@ op_keys = [
     "more than","greater than","equal to","equal","at least","plus","minus",
     "exactly",
 ]
-re_op = re.compile(r"\b({})\b".format('|'.join(list(op_keys))))
-re_upto_op = re.compile(r"pr<up_to>(?= nu<[^>]+>)")
-re_only_upto = re.compile(r"(op<≤> nu<([^>]+)> sq<time suffix=s>)")
+re_op = lazyre.compile(r"\b({})\b".format('|'.join(list(op_keys))))
+re_upto_op = lazyre.compile(r"pr<up_to>(?= nu<[^>]+>)")
+re_only_upto = lazyre.compile(r"(op<≤> nu<([^>]+)> sq<time suffix=s>)")
 
 # finds number or greater, less, more or fewer
-re_num_op = re.compile(r"(nu<(?:\d+|x|y|z)>) or (greater|less|more|fewer)")
+re_num_op = lazyre.compile(r"(nu<(?:\d+|x|y|z)>) or (greater|less|more|fewer)")
 
 # prepositions (check for ending tags)
 prepositions = [
     'top','bottom','up to','from','to','into','in','on','out','under','onto',
     'without','with','for','up','down','by','as though','as','of',
 ]
-re_prep = re.compile(r"\b(?<!<[^>]*)({})\b(?!>)".format('|'.join(prepositions)))
+re_prep = lazyre.compile(r"\b(?<!<[^>]*)({})\b(?!>)".format('|'.join(prepositions)))
 
 # conditional/requirement related
 conditionals = [
     'only if','if','would','could','unless','rather than','instead','may','except',
     'not','only','otherwise',
 ]
-re_cond = re.compile(r"\b({})\b".format('|'.join(conditionals)))
+re_cond = lazyre.compile(r"\b({})\b".format('|'.join(conditionals)))
 
 # sequence/time related  words
 sequences = [
@@ -534,7 +539,7 @@ sequences = [
     'as long as','simultaneously','time','again',
 ]
 seq_tkns = '|'.join(sequences)
-re_seq = re.compile(
+re_seq = lazyre.compile(
     r"\b(?<!<[^>]*)({})(?=(?:s|ing|ed|ion|\'s|s\'|:|\.|,|\n|\"|\'| |—|$))".format(seq_tkns)
 )
 
@@ -543,7 +548,8 @@ re_seq = re.compile(
 ###
 
 # trigger preambles 603.1
-re_trigger = re.compile(r"\b(at|whenever|when)\b")
+triggers = ['at','whenever','when']
+re_trigger = lazyre.compile(r"\b({})\b".format('|'.join(triggers)))
 
 ####
 ## COUNTERS
@@ -554,7 +560,7 @@ re_trigger = re.compile(r"\b(at|whenever|when)\b")
 # see (https://mtg.gamepedia.com/Counter_(marker)/Full_List)
 # Ikoria introduced keyword counters which will be kept separate
 # NOTE: this must be done prior to keyword actions processing
-re_pt_ctr = re.compile(r"(\+|-)nu<(\d+)>/(\+|-)nu<(\d+)> (counters*)\b")
+re_pt_ctr = lazyre.compile(r"(\+|-)nu<(\d+)>/(\+|-)nu<(\d+)> (counters*)\b")
 named_counters = [
     'age','aim','arrow','arrowhead','awakening','blaze','blood','bounty','bribery',
     'brick','cage','carrion','charge','coin','credit','corpse','crystal','cube',
@@ -574,13 +580,13 @@ named_counters = [
 
 ]
 named_ctr_tkns = '|'.join(named_counters)
-re_named_ctr = re.compile(r"\b({}) counter(s)?\b".format(named_ctr_tkns))
+re_named_ctr = lazyre.compile(r"\b({}) counter(s)?\b".format(named_ctr_tkns))
 iko_counters = [
     'deathtouch','double strike','first strike','flying','hexproof',
     'indestructible','lifelink','menace','reach','trample','vigilance',
 ]
 iko_ctr_tkns = '|'.join(iko_counters)
-re_iko_ctr = re.compile(r"\b({}) counter\b".format(iko_ctr_tkns))
+re_iko_ctr = lazyre.compile(r"\b({}) counter\b".format(iko_ctr_tkns))
 
 # two of these coin and time will have already been misstagged as xo<coin>
 
@@ -598,7 +604,7 @@ ability_words = [  # ability words 207.2c Updated 25-May-20 with IKO
     "will of the council",
 ]
 aw_tkns = '|'.join(ability_words)
-re_aw = re.compile(
+re_aw = lazyre.compile(
     r"\b(?<!<[^>]*)({})(?=(?:s|ing|ed|ion|\'s|s\'|:|\.|,|\n|\"|\'| |—|$))".format(aw_tkns)
 )
 
@@ -611,7 +617,7 @@ keyword_actions = [  # (legal) Keyword actions 701.2 - 701.43 Updated IKO 25-May
     'adapt','amass','mill',
 ]
 kwa_tkns = '|'.join(keyword_actions)
-re_kw_act = re.compile(
+re_kw_act = lazyre.compile(
     r"\b(?<!<[^>]*)({})(?=(?:s|ing|ed|ion|\'s|s\'|:|\.|,|\n|\"|\'| |—|$))".format(kwa_tkns)
 )
 
@@ -639,7 +645,7 @@ keywords = [  # (legal) Keyword Abilties 702.2 - 702,139 Updated IKO 25-May-20
     'escape','companion','mutate',
 ]
 kw_tkns = '|'.join(keywords)
-re_kw = re.compile(
+re_kw = lazyre.compile(
     # NOTE: we have to add checks for the long hyphen and end of string to
     # ensure we tag all keywords
     r"\b(?<!<[^>]*)({})(?=(?:s|ing|ed|ion|\'s|s\'|:|\.|,|\n|\"|\'| |—|$))".format(kw_tkns)
@@ -659,13 +665,13 @@ lituus_actions = [  # words not defined in the rules but important any way
     'cost',  # will have already been tagged as an object
 ]
 la_tkns = '|'.join(lituus_actions)
-re_lituus_act = re.compile(
+re_lituus_act = lazyre.compile(
     r"\b(?<!<[^>]*)({})(?=(?:s|ing|ed|ion|\'s|s\'|:|\.|,|\n|\"|\'| |—|$))".format(la_tkns)
 )
 
 # because target is primarily a quantifier we will only tag the verb version
 # with suffix 's','ing' or 'ed' NOTE: currently have only seen 's'
-re_lituus_target_verb = re.compile(r'\btarget(s|ing|ed)\b')
+re_lituus_target_verb = lazyre.compile(r'\btarget(s|ing|ed)\b')
 
 ####
 ## EFFECTS
@@ -675,7 +681,7 @@ re_lituus_target_verb = re.compile(r'\btarget(s|ing|ed)\b')
 # NOTE: These should not have already been tagged, but just in case
 effects = ["combat damage","damage","effect"]
 eff_tkns = '|'.join(effects)
-re_effect = re.compile(
+re_effect = lazyre.compile(
     r"\b(?<!<[^>]*)({})(?=(?:s|ing|ed|ion|\'s|s\'|:|\.|,|\n|\"|\'| |—|$))".format(eff_tkns)
 )
 
@@ -687,8 +693,8 @@ meta_characteristics = [  # 200.1 These are parts of a card
     'p/t','everything','text','name','mana cost','cmc','power','toughness',
     'color identity','color','type','kind',
 ]
-re_meta_char = re.compile(r"{}".format('|'.join(meta_characteristics)))
-re_meta_attr = re.compile(  # for meta characteristics
+re_meta_char = lazyre.compile(r"{}".format('|'.join(meta_characteristics)))
+re_meta_attr = lazyre.compile(  # for meta characteristics
     r"(ch<(?:p/t|everything|text|name|mana cost|cmc|power|toughness|"
     r"color_identity|color|type)(?: [\w\+\-/=¬∧∨⊕⋖⋗≤≥≡⇔→'\(\)]+?)*>)"
 )
@@ -696,16 +702,16 @@ re_meta_attr = re.compile(  # for meta characteristics
 color_characteristics = [  # 105.1, 105.2a, 105.2b, 105.2c
     'white','blue','black','green','red','colorless','multicolored','monocolored'
 ]
-re_clr_char = re.compile(r"{}".format('|'.join(color_characteristics)))
+re_clr_char = lazyre.compile(r"{}".format('|'.join(color_characteristics)))
 
 super_characteristics = ['legendary','basic','snow','world']  # 205.4a
-re_super_char = re.compile(r"{}".format('|'.join(super_characteristics)))
+re_super_char = lazyre.compile(r"{}".format('|'.join(super_characteristics)))
 
 type_characteristics = [  # 300.1, NOTE: we added historic
     'artifact','creature','enchantment','instant','land','planeswalker',
     'sorcery','tribal','historic',
 ]
-re_type_char = re.compile(r"{}".format('|'.join(type_characteristics)))
+re_type_char = lazyre.compile(r"{}".format('|'.join(type_characteristics)))
 
 # sub characteristics (updated 25-Jan-20 with IKO).
 
@@ -713,7 +719,7 @@ re_type_char = re.compile(r"{}".format('|'.join(type_characteristics)))
 subtype_artifact_characteristics = [
     "clue","equipment","food","fortification","gold","treasure","vehicle",
 ]
-re_subtype_artifact_char = re.compile(
+re_subtype_artifact_char = lazyre.compile(
     r"{}".format('|'.join(subtype_artifact_characteristics))
 )
 
@@ -721,7 +727,7 @@ re_subtype_artifact_char = re.compile(
 subtype_enchantment_characteristics = [
     "aura","cartouche","curse","saga","shrine",
 ]
-re_subtype_enchantment_char = re.compile(
+re_subtype_enchantment_char = lazyre.compile(
     r"{}".format('|'.join(subtype_enchantment_characteristics))
 )
 
@@ -730,7 +736,7 @@ subtype_land_characteristics = [
     "desert","forest","gate","island","lair","locus","mine","mountain",
     "plains","power-plant","swamp","tower","urza’s",
 ]
-re_subtype_land_char = re.compile(r"{}".format('|'.join(subtype_land_characteristics)))
+re_subtype_land_char = lazyre.compile(r"{}".format('|'.join(subtype_land_characteristics)))
 
 # 205.3j planeswalker types
 subtype_planeswalker_characteristics = [
@@ -742,13 +748,13 @@ subtype_planeswalker_characteristics = [
     "tezzeret","tibalt","ugin","venser","vivien","vraska","will","windgrace",
     "wrenn","xenagos","yanggu","yanling",
 ]
-re_subtype_planeswalker_char = re.compile(
+re_subtype_planeswalker_char = lazyre.compile(
     r"{}".format('|'.join(subtype_planeswalker_characteristics))
 )
 
 # 205.3k instant/sorcery subtypes
 subtype_instant_sorcery_characteristics = ["adventure","arcane","trap", ]
-re_subtype_instant_sorcery_char = re.compile(
+re_subtype_instant_sorcery_char = lazyre.compile(
     r"{}".format('|'.join(subtype_instant_sorcery_characteristics))
 )
 
@@ -787,7 +793,7 @@ subtype_creature_characteristics = [
     "wizard","wolf","wolverine","wombat","worm","wraith","wurm","yeti","zombie",
     "zubera",
 ]
-re_subtype_creature_char = re.compile(
+re_subtype_creature_char = lazyre.compile(
     r"{}".format('|'.join(subtype_creature_characteristics))
 )
 
@@ -798,7 +804,7 @@ sub_characteristics = subtype_artifact_characteristics + \
                       subtype_planeswalker_characteristics + \
                       subtype_instant_sorcery_characteristics + \
                       subtype_creature_characteristics
-re_sub_char = re.compile(r"{}".format('|'.join(sub_characteristics)))
+re_sub_char = lazyre.compile(r"{}".format('|'.join(sub_characteristics)))
 
 # subtype of
 subtypes_of = [
@@ -865,45 +871,45 @@ char_tkns = '|'.join(
     type_characteristics +
     sub_characteristics
 )
-re_ch = re.compile(
+re_ch = lazyre.compile(
     r"\b(?<!<[^>]*)({})(?=(?:s|ing|ed|ion|\'s|s\'|:|\.|,|\n|\"|\'| |—|$))".format(char_tkns)
 )
 
 # seperate procedure for tagging p/t has to be done after numbers are tagged
-re_ch_pt = re.compile(r"(\+|-)?nu<(\d+|x|y|z)>/(\+|-)?nu<(\d+|x|y|z)>(?! counter)")
+re_ch_pt = lazyre.compile(r"(\+|-)?nu<(\d+|x|y|z)>/(\+|-)?nu<(\d+|x|y|z)>(?! counter)")
 
 # meta 'attribute' values see Rathi Intimidator picks out three values 1) the
 # attribute, 2) the operator and 3) the value of the attribute
-re_attr_val = re.compile(r"xr<([^>]+)> op<([⊕⋖⋗≤≥≡])> nu<(\d+|x|y|z)>")
+re_attr_val = lazyre.compile(r"xr<([^>]+)> op<([⊕⋖⋗≤≥≡])> nu<(\d+|x|y|z)>")
 
 # meta 'attribute' values see Triskaidekaphobia where a lituus object preceded
 # by a number can be instantiated as an attribute. We only want vanilla lituus
 # objects, that is, they do not have an attribute list
 # NOTE: this should only be life or mana
 # TODO: may need to relook 'mana'
-re_op_num_lo = re.compile(r"op<(.)> nu<([^>]+)> xo<(\w+)>")
+re_op_num_lo = lazyre.compile(r"op<(.)> nu<([^>]+)> xo<(\w+)>")
 
 # damage preceded by a number should be combined
-re_num_dmg = re.compile(r"nu<([^>]+)> ef<(\w*damage)>")
+re_num_dmg = lazyre.compile(r"nu<([^>]+)> ef<(\w*damage)>")
 
 # exception cases for three cards Void Winnower, Gyruda and Isperia
 # TODO: could we add 'different' here as well, perhaps some other quantifiers
-re_attr_val_wd = re.compile(r"(?:xq<a> )?xc<(odd|even)> xr<([^>]+)( suffix=s)?>")
+re_attr_val_wd = lazyre.compile(r"(?:xq<a> )?xc<(odd|even)> xr<([^>]+)( suffix=s)?>")
 
 # meta 'attribute' value see Repeal where no operator is present
-re_attr_val_nop = re.compile(r"xr<([^>]+)> nu<(\d+|x|y|z)>")
+re_attr_val_nop = lazyre.compile(r"xr<([^>]+)> nu<(\d+|x|y|z)>")
 
 # colored will be tagged as xr<color suffix=ed> need to switch this
-re_attr_colored = re.compile(r"xr<((?:mono)?color) suffix=ed>")
+re_attr_colored = lazyre.compile(r"xr<((?:mono)?color) suffix=ed>")
 
 # ... base power and toughness X/Y i.e. Godhead of Awe then power and toughness
 # i.e Transmutation
-re_base_pt = re.compile(r"base ch<power> and ch<toughness> (ch<p/t[^>]*>)")
+re_base_pt = lazyre.compile(r"base ch<power> and ch<toughness> (ch<p/t[^>]*>)")
 
 # if after instantiatiating attributes we want to 'chain' cases of
 #  power and/or toughness where toughness has a value i.e. Tetsuko Umezawa,
 #  Fugitive
-re_combine_pt = re.compile(r"xr<power> (and|or|and/or) xr<toughness val=([^>]+)>")
+re_combine_pt = lazyre.compile(r"xr<power> (and|or|and/or) xr<toughness val=([^>]+)>")
 
 # lituus characteristics
 # TODO: keep control, own?
@@ -911,7 +917,7 @@ lituus_characteristics = [
     'life total','control','own','life','hand size','devotion','odd','even',
 ]
 lch_tkns = '|'.join(lituus_characteristics)
-re_lituus_ch = re.compile(
+re_lituus_ch = lazyre.compile(
     r"\b(?<!<[^>]*)({})(?=(?:s|ing|ed|ion|\'s|s\'|:|\.|,|\n|\"|\'| |—|$))".format(lch_tkns)
 )
 
@@ -925,7 +931,7 @@ zones = [
     'anywhere','zone',
 ]
 zn_tkns = '|'.join(zones)
-re_zone = re.compile(
+re_zone = lazyre.compile(
     r"\b(?<!<[^>]*)({})(?=(?:s|ing|ed|ion|\'s|s\'|:|\.|,|\n|\"|\'| |—|$))".format(zn_tkns)
 )
 
@@ -954,10 +960,36 @@ lituus_status = [
     'suspended','kicked','discarded','cycled','illegal',
 ]
 lstat_tkns = '|'.join(lituus_status)
-re_lituus_status = re.compile(
+re_lituus_status = lazyre.compile(
     r"\b(?<!<[^>]*)({})(?=(?:s|ing|ed|ion|\'s|s\'|:|\.|,|\n|\"|\'| |—|$))".format(lstat_tkns)
 )
 
+####
+## UNTAGGED SPANS
+####
+
+# The lookbehind (?<!<[^>]*) prevents (re)tagging words inside an existing tag's
+# value but has to scan backwards at every candidate position. The first pass
+# runs the below variants (sans lookbehind) over masked text where tag values
+# have been blanked out (see tagger.MaskedText) which produces the same result
+re_tag_value = lazyre.compile(r"<[^>]*")
+lb_tag_value = r"(?<!<[^>]*)"
+def untagged(ptrn): return lazyre.compile(ptrn.pattern.replace(lb_tag_value,''))
+re_obj_ut = untagged(re_obj)
+re_lituus_obj_ut = untagged(re_lituus_obj)
+re_lituus_ply_ut = untagged(re_lituus_ply)
+re_combat_phase_ut = untagged(re_combat_phase)
+re_prep_ut = untagged(re_prep)
+re_seq_ut = untagged(re_seq)
+re_aw_ut = untagged(re_aw)
+re_kw_ut = untagged(re_kw)
+re_kw_act_ut = untagged(re_kw_act)
+re_lituus_act_ut = untagged(re_lituus_act)
+re_effect_ut = untagged(re_effect)
+re_ch_ut = untagged(re_ch)
+re_lituus_ch_ut = untagged(re_lituus_ch)
+re_zone_ut = untagged(re_zone)
+
 ####
 ## DECONFLICTIONS
 ####
@@ -966,14 +998,14 @@ re_lituus_status = re.compile(
 
 # Past tense deconflictions: transform, suspend, [un]attach. reveal are keywords
 # /keyword actions that are statuses if they have an 'ed' suffix
-re_ed_lituus_status = re.compile(
+re_ed_lituus_status = lazyre.compile(
     r"(k[aw])(?=<(?:transform|suspend|(?:un)?attach|reveal) suffix=ed>)"
 )
 
 # Past tense deconflictions: enchant, equip and exile are keywords/keyword actions
 # that are statuses if they have an 'ed' suffix and precede a Thing (have to check
 # for players as well as objects - don't think lituus objects but check hough)
-re_ed_thing_lituus_status = re.compile(
+re_ed_thing_lituus_status = lazyre.compile(
     r"(k[aw])(?=<(?:enchant|equip|exile) suffix=ed> (?:ob|xp|xo))"
 )
 
@@ -982,7 +1014,7 @@ re_ed_thing_lituus_status = re.compile(
 # like Geist of Saint Traft have incorrectly tagged status.
 # This matches the phrases "tapped and attacking","attacking or blocking and
 # "unblocked attacking"
-re_combat_status_chain = re.compile(
+re_combat_status_chain = lazyre.compile(
     r"(st|ka|xa)<((?:un)?(?:tap|attack|block)) suffix=(ed|ing)>"
     r"(?: ?(and|or|and/or)? )"
     r"xa<(attack|block) suffix=ing>"
@@ -992,7 +1024,7 @@ re_combat_status_chain = re.compile(
 # unless they are preceded by an is/not or a Thing or followed by a "does not"
 # (Johan) and
 #
-re_combat_status = re.compile(
+re_combat_status = lazyre.compile(
     r"(?<!(?:(?:ob|xo|xp)<\w+?>|is|are|was|be)(?: cn<not>)? )"
     r"xa<((?:un|¬)?attack|block|defend) suffix=ing>"
     r"(?! does cn<not>)"
@@ -1006,33 +1038,33 @@ re_combat_status = re.compile(
 
 # activated/triggered
 # finds the phrase "activated or triggered i.e. Stifle (5 total)
-re_ab_type_chain = re.compile(r"ka<activate suffix=ed> or xa<trigger suffix=ed>")
+re_ab_type_chain = lazyre.compile(r"ka<activate suffix=ed> or xa<trigger suffix=ed>")
 
 # when activate or trigger with suffex ed is followed by an object it is a status
-re_ab_status = re.compile(r"[kx]a<(activate|trigger) suffix=ed>(?= ob)")
+re_ab_status = lazyre.compile(r"[kx]a<(activate|trigger) suffix=ed>(?= ob)")
 
 # activation cost - combine this as activation_cost
-re_activation_cost = re.compile(r"ka<activate suffix=ion> xo<cost( suffix=s)?>")
+re_activation_cost = lazyre.compile(r"ka<activate suffix=ion> xo<cost( suffix=s)?>")
 
 # Target
 # target may be a quantifier, an object (115.1) or an action (Bronze Horze).
 
 # special case (2 cards Meddle, Quicksilver Dragon) that contain the phrase
 # "target and that target" - here both are objects
-re_target_sc = re.compile(r"xq<target> and xq<that> xq<target>")
+re_target_sc = lazyre.compile(r"xq<target> and xq<that> xq<target>")
 
 # that target (aside from above), could target and can target are references to an action
-re_target_act = re.compile(r"(?<=(?:xq<that>|cn<could>|xa<can>) )(xq<target>)")
+re_target_act = lazyre.compile(r"(?<=(?:xq<that>|cn<could>|xa<can>) )(xq<target>)")
 
 # Find target quantifier that is not followed by an mtg object, a status or
 # a player/opponent - these are objects
-re_target_obj = re.compile(
+re_target_obj = lazyre.compile(
     r"(xq<target>)"
     r"(?! (?:ob|st|xs|xo<commander>|(?:xp<(?:player|opponent(?: suffix=(?:s|s'|'s))?))))"
 )
 
 # find 'target' preceded by a quantifier and followed by a preposition
-re_target_obj2 = re.compile(
+re_target_obj2 = lazyre.compile(
     r"(?<=xq<[^>]+> )(?:xa<target([^>]+)>)(?= pr<[^>]+>)"
 )
 
@@ -1041,7 +1073,7 @@ re_target_obj2 = re.compile(
 # deconfliction has already occurred in consecutive object handling
 
 # copy followed by a quantifier or 'it' is an action
-re_copy_act = re.compile(r"(ob<copy( suffix=s)?>)(?= (?:xq<|xo<it>))")
+re_copy_act = lazyre.compile(r"(ob<copy( suffix=s)?>)(?= (?:xq<|xo<it>))")
 
 ## Keywords that may be actions and/or statuses
 
@@ -1055,26 +1087,26 @@ re_copy_act = re.compile(r"(ob<copy( suffix=s)?>)(?= (?:xq<|xo<it>))")
 #  TODO: unless preceded by be
 # 4. suffix=s: (see Sidis, Undead Vizier) a keyword with suffix 's' preceded by
 #  a Thing will be considered and action
-re_kicker_act = re.compile(r"(?<=was )kw<kicker suffix=ed>")
-re_be_kw = re.compile(r"(?<=(?:be|xo<it>) )kw<([^>]+?) suffix=ed>")
-re_kw_status = re.compile(r"(?<=is )kw<([^>]+?) suffix=ed>")
-re_kw_action = re.compile(r"(?<=(?:xp|ob|xo)<[^>]+> )kw<([^>]+?) suffix=s>")
+re_kicker_act = lazyre.compile(r"(?<=was )kw<kicker suffix=ed>")
+re_be_kw = lazyre.compile(r"(?<=(?:be|xo<it>) )kw<([^>]+?) suffix=ed>")
+re_kw_status = lazyre.compile(r"(?<=is )kw<([^>]+?) suffix=ed>")
+re_kw_action = lazyre.compile(r"(?<=(?:xp|ob|xo)<[^>]+> )kw<([^>]+?) suffix=s>")
 
 # action words that are statuses
 # action words with a suffix of 'ed' that are preceded by a quantifier and
 # followed by an object are statuses i.e. Xathrid Demon
-re_action_status = re.compile(
+re_action_status = lazyre.compile(
     r"(?<=xq<[^>]+> )(?:ka|xa)<([^ ]+ suffix=ed)>(?= ob<[^>]+>)"
 )
 
 # consecutive (non-possessive) turn structures i.e. Dwarven Sea Clan
-re_consecutive_ts = re.compile(r"ts<(\w+)> ts<step>")
+re_consecutive_ts = lazyre.compile(r"ts<(\w+)> ts<step>")
 
 # declare attackers|blockers
-re_declare_step = re.compile(r"xa<declare> xo<([^>]+?) suffix=s> ts<step>")
+re_declare_step = lazyre.compile(r"xa<declare> xo<([^>]+?) suffix=s> ts<step>")
 
 # incorrectly tagged draw
-re_draw_step = re.compile(r"(xq<[^>]+>) xa<draw>")
+re_draw_step = lazyre.compile(r"(xq<[^>]+>) xa<draw>")
 
 ####
 ## MID-PASS CLEANUP
@@ -1107,18 +1139,18 @@ val_join = {
     "did not":"did_not","other than":"other_than"
 }
 val_join_tkns = '|'.join(val_join.keys())
-re_val_join = re.compile(r"(?<=[<=])({})(?=>)".format(val_join_tkns))
+re_val_join = lazyre.compile(r"(?<=[<=])({})(?=>)".format(val_join_tkns))
 # TODO: this would be better done via a regular expression vice a dict
 
 # Negated tags i.e. non-XX<...>
-re_negate_tag = re.compile(r"non-(\w\w)<([^>]+)>")
+re_negate_tag = lazyre.compile(r"non-(\w\w)<([^>]+)>")
 
 # Hanging Basic finds the supertype not followed by an explicit land
-re_hanging_basic = re.compile(r"(ch<¬?basic>)(?! ch<land[^>]*>)")
+re_hanging_basic = lazyre.compile(r"(ch<¬?basic>)(?! ch<land[^>]*>)")
 
 # Hanging Snow finds the supertype that is followed by a land subtype (with no
 # explicit 'land' inbetween NOTE: we are only checking the FIVE basic subtypes
-re_hanging_snow = re.compile(
+re_hanging_snow = lazyre.compile(
     r"(ch<¬?snow>)(?= ch<¬?(?:forest|island|mountain|plains|swamp)[^>]*>)"
 )
 
@@ -1127,15 +1159,15 @@ re_hanging_snow = re.compile(
 #   equal to the number of lands"
 #  2. use nu<z> to denote "any number of" i.e. Ad Nauseum "any number of times"
 #  3. remove "are each" if followed by an operator
-re_equal_y = re.compile(r"(?<=op<[⊕⋖⋗≤≥≡]> )(xq<the> number of)")
-re_equal_z = re.compile(r"xq<any> number of")
-re_are_each = re.compile(r"are xq<each> (?=op<[⊕⋖⋗≤≥≡]>)")
+re_equal_y = lazyre.compile(r"(?<=op<[⊕⋖⋗≤≥≡]> )(xq<the> number of)")
+re_equal_z = lazyre.compile(r"xq<any> number of")
+re_are_each = lazyre.compile(r"are xq<each> (?=op<[⊕⋖⋗≤≥≡]>)")
 
 # find xo<mana cost> for conversion
-re_mana_cost = re.compile(r"xo<mana cost( suffix=s)?>")
+re_mana_cost = lazyre.compile(r"xo<mana cost( suffix=s)?>")
 
 # find 'no' followed by a thing or quanitifier
-re_no_thing = re.compile(r"no(?= (?:ob|xp|xo|zn|xq))")
+re_no_thing = lazyre.compile(r"no(?= (?:ob|xp|xo|zn|xq))")
 
 ####
 ## STATUS DECONFLICTION
@@ -1143,45 +1175,45 @@ re_no_thing = re.compile(r"no(?= (?:ob|xp|xo|zn|xq))")
 
 # only looking at tap and flip - it will be a status only if there is a suffix
 # of 'ed' and it is not preceded by 'is'
-re_status = re.compile(
+re_status = lazyre.compile(
     r"(?<!is )(?:[kx]a)<(un)?({}) suffix=ed>".format('|'.join(status[0:2]))
 )
 
 # in some cases, if 'tapped' is preceded by an 'is', it is a status but only if
 # it is not followed by a 'for'
-re_status_tap = re.compile(r"(?<=is )(?:[kx]a)<(un)?tap suffix=ed>(?! pr<for>)")
+re_status_tap = lazyre.compile(r"(?<=is )(?:[kx]a)<(un)?tap suffix=ed>(?! pr<for>)")
 
 # Phase can be Status, Action or Turn Structure
 # See Time and Tide for example of phased as a status and as an action
-re_status_phase = re.compile(r"xa<phase suffix=ed>-pr<(in|out)>")  # all status have a hyphen
-re_action_phase = re.compile(r"xa<phase(?: suffix=(s|ed))?> pr<(in|out)>")
-re_ts_phase = re.compile(r"xa<phase>(s?)(?=\W)")
+re_status_phase = lazyre.compile(r"xa<phase suffix=ed>-pr<(in|out)>")  # all status have a hyphen
+re_action_phase = lazyre.compile(r"xa<phase(?: suffix=(s|ed))?> pr<(in|out)>")
+re_ts_phase = lazyre.compile(r"xa<phase>(s?)(?=\W)(?!\n\x1e)")
 
 # face can be a Status (has a hyphen) i.e. Pull from Eternity or a modifier to
 # an action i.e. Bomat Courier
 #  "...exile the top card of your library face down.", generally 'turn'
-re_status_face = re.compile(r"face-pr<(up|down)>")
-re_mod_face = re.compile(r"face pr<(up|down)>")
+re_status_face = lazyre.compile(r"face-pr<(up|down)>")
+re_mod_face = lazyre.compile(r"face pr<(up|down)>")
 
 ####
 ## TURN (ACTION|OBJECT) DECONFLICTION
 ####
 
 # turn is an action if it is followed by a 'xm' (modifier) or 'xq' (quantifier)
-re_turn_action = re.compile(r"ts<(turn[^>]*)>(?= (?:xm|xq)<[^>]+>)")
+re_turn_action = lazyre.compile(r"ts<(turn[^>]*)>(?= (?:xm|xq)<[^>]+>)")
 
 # turn can be considered an object if preceded by a
 #  [a][conjoined quantifiers] [turn structure]
 # TODO: need to consider other quantifiers possibley this|that
 # TODO: need to consider possessive turn structure see Gisa and Geralf "your turn"
 # TODO: do we want to retag the turn strucutre i.e. turn-phase
-re_turn_object = re.compile(r"(xq<(?:a(?:[∧∨⊕][^>]+)?)>) ts<([^>]+)>")
+re_turn_object = lazyre.compile(r"(xq<(?:a(?:[∧∨⊕][^>]+)?)>) ts<([^>]+)>")
 
 ####
 ## ZONE DECONFLICTION
 ####
 # find exile preceded by a preposition
-re_zn_exile = re.compile(r"(?<=pr<[^>]+> )(ka<exile>)")
+re_zn_exile = lazyre.compile(r"(?<=pr<[^>]+> )(ka<exile>)")
 
 ####
 ## COST DECONFLICTION
@@ -1196,30 +1228,30 @@ re_zn_exile = re.compile(r"(?<=pr<[^>]+> )(ka<exile>)")
 # "...mana an ability/object costs to...'
 # After this there are 3 'exceptions' Valiant Changleling, Brutal Suppression,
 #  and Drought
-re_cost_mana = re.compile(
+re_cost_mana = lazyre.compile(
     r"xo<cost( suffix=s)?>(?= (?:pr<up_to> )?{(?:[0-9wubrgscpx\/]+)})"
 )
-re_cost_num = re.compile(
+re_cost_num = lazyre.compile(
     r"xo<cost( suffix=s)?>(?= (?:op<[⊕⋖⋗≤≥≡]> )?nu<(?:[0-9wubrgscpx\/]+)>)"
 )
-re_cost_aa = re.compile(r"(?<=ob<[^>+]> )xo<cost( suffix=s)?>")
-re_cost_except = re.compile(  # Drought and Brutal Suppresion and Valiant Changeling
+re_cost_aa = lazyre.compile(r"(?<=ob<[^>+]> )xo<cost( suffix=s)?>")
+re_cost_except = lazyre.compile(  # Drought and Brutal Suppresion and Valiant Changeling
     r"xo<cost( suffix=s)?>(?= (?:xq<a> xq<additional>|by more than))"
 )
 
 # flip as action vs object
 #  1. flip is an object if it is preceded by a quantifier or a number
 #  2. flip is an object if preceded by coin
-re_flip_object = re.compile(r"(?<=(?:xq<[^>]+>|nu<[^>]+>) )xa<flip( suffix=s)?>")
-re_coin_flip = re.compile(r"xo<coin> xa<flip>")
+re_flip_object = lazyre.compile(r"(?<=(?:xq<[^>]+>|nu<[^>]+>) )xa<flip( suffix=s)?>")
+re_coin_flip = lazyre.compile(r"xo<coin> xa<flip>")
 
 # 'counters' as action vs lituus object
 # two cards Baral and Lullmage mentor have counters that is an action all others
 # are counters that put on a permanent
 # in the case of ka<counter> if it is preceded by xq<a> or a preposition (Soul
 # Diviner, Vorel) it as an object counter
-re_counters_obj = re.compile(r"ka<counter suffix=s>(?! xq<(?:target|a))")
-re_counter_obj = re.compile(r"(?<=(xq<a>|pr<[^>]+>) )(ka<counter>)")
+re_counters_obj = lazyre.compile(r"ka<counter suffix=s>(?! xq<(?:target|a))")
+re_counter_obj = lazyre.compile(r"(?<=(xq<a>|pr<[^>]+>) )(ka<counter>)")
 
 ####
 ## MISC DECONFLICTION
@@ -1237,49 +1269,49 @@ misstag = {
     "pr<as> long pr<as>":"sq<as_long_as>","ob<spell> mastery":"aw<spell_mastery>",
 }
 misstag_tkns = '|'.join(misstag.keys())
-re_misstag = re.compile(r"({})".format(misstag_tkns))
+re_misstag = lazyre.compile(r"({})".format(misstag_tkns))
 
 # from combat find untagged combat preceded by from
-re_from_combat = re.compile(r"(?<=pr<from> )ts<combat>")
+re_from_combat = lazyre.compile(r"(?<=pr<from> )ts<combat>")
 
 # discarded is a status if it is preceded by the and followed by card
-re_discard_stat = re.compile(r"(?<=xq<the> )ka<discard suffix=ed>(?= ob<)")
+re_discard_stat = lazyre.compile(r"(?<=xq<the> )ka<discard suffix=ed>(?= ob<)")
 
 # enchated is a status if it is preceded by that_is/that_are
-re_enchant_stat = re.compile(
+re_enchant_stat = lazyre.compile(
     r"(?<=xq<that> xa<is(?:[^>]+)?> )kw<enchant suffix=ed>"
 )
 
 # (un)spent is a status if followed by mana
-re_spend_stat = re.compile(r"xa<(un)?spend suffix=ed>(?= xo)")
+re_spend_stat = lazyre.compile(r"xa<(un)?spend suffix=ed>(?= xo)")
 
 # 'at' is a preposition if followed by a qualifier (random) i.e. Black Cat or
 #  status i.e. Lens of Clarity or preceeded by 'look' i.e. Lens of Clarity
-re_at_prep = re.compile(r"(tp<at>)(?= (?:xl|st)<[^>]+>)")
-re_at_prep2 = re.compile(r"(?<=xa<look> )(tp<at>)")
+re_at_prep = lazyre.compile(r"(tp<at>)(?= (?:xl|st)<[^>]+>)")
+re_at_prep2 = lazyre.compile(r"(?<=xa<look> )(tp<at>)")
 
 # 'bidding'
-re_bidding = re.compile(r"bidding")
-re_bid_obj = re.compile(r"(?<=(?:xq|xl)<[^>]+> )(xa<bid>)")
+re_bidding = lazyre.compile(r"bidding")
+re_bid_obj = lazyre.compile(r"(?<=(?:xq|xl)<[^>]+> )(xa<bid>)")
 
 # three cards have 'ends' which should be tagged as an object
-re_end_obj = re.compile(r"sq<end suffix=s>")
+re_end_obj = lazyre.compile(r"sq<end suffix=s>")
 
 # no nu<1> needs to be retagged
-re_no_one = re.compile(r"no nu<1>")
+re_no_one = lazyre.compile(r"no nu<1>")
 
 # pw<with> nu<0> needs to be retagged (only 2 Hindervines & Muraganda Petroglyphs)
-re_with_null = re.compile(r"pr<with> nu<0>")
+re_with_null = lazyre.compile(r"pr<with> nu<0>")
 
 # no followed by damage
-re_no_dmg = re.compile(r"no (ef<(?:combat_)?damage>)")
+re_no_dmg = lazyre.compile(r"no (ef<(?:combat_)?damage>)")
 
 ####
 ## SUFFICES
 ####
 
 # move any suffices 'r','s','ing' 'ed' or "'s" to parameters inside tags
-re_suffix = re.compile(r"(\w\w)<([^>]+)>(s'|s|ion|ing|ed|'s)")
+re_suffix = lazyre.compile(r"(\w\w)<([^>]+)>(s'|s|ion|ing|ed|'s)")
 
 ####
 ## ALIGNMENTS
@@ -1298,7 +1330,7 @@ re_suffix = re.compile(r"(\w\w)<([^>]+)>(s'|s|ion|ing|ed|'s)")
 # two consecutive types (separated by a space) or a conjuction i.e. Grisly Spectacle
 # and Mox Amber. This is commonly artifact creature
 # NOTE: on the first type we should not see any attributes
-re_align_dual = re.compile(
+re_align_dual = lazyre.compile(
     r"(ch<¬?(?:artifact|creature|enchantment|instant|land|planeswalker|sorcery)[^>]*>)"
     r" (?:(and|or|and/or) )?"
     r"(ch<¬?(?:artifact|creature|enchantment|instant|land|planeswalker|sorcery)[^>]*>)"
@@ -1307,7 +1339,7 @@ re_align_dual = re.compile(
 # 2 or more consecutive types. Cards like Warden of the First Tree and Figure of
 # Destiny, We capture it here just in case future cards display this behavior.
 # This will default to dual types as above for exactly 2 consecutive types
-re_align_n = re.compile(
+re_align_n = lazyre.compile(
     r"(ch<¬?(?:artifact|creature|enchantment|instant|land|planeswalker|sorcery)[^>]*>)"
     r" (?:(and|or|and/or) )?"
     r"(ch<¬?(?:artifact|creature|enchantment|instant|land|planeswalker|sorcery)[^>]*>)"
@@ -1322,7 +1354,7 @@ re_align_n = re.compile(
 # lands they control... nonbasic applies to lands and not to the permanents that
 # must be sacrified
 # NOTE: We are assuming that super-type alignments are all space-delimited
-re_align_super = re.compile(
+re_align_super = lazyre.compile(
     r"(ch<¬?(?:legendary|basic|snow|world)> )+"
      r"(ch<¬?(?:artifact|creature|enchantment|instant|land|planeswalker|sorcery)"
     r"(?:[∧∨⊕→]¬?(?:artifact|creature|enchantment|instant|land|planeswalker|sorcery))*[^>]*>)"
@@ -1335,7 +1367,7 @@ re_align_super = re.compile(
 # ... xa<put> xq<a> ch<kraken>, ch<leviathan>, ch<octopus>, or ch<creature→serpent>
 # ob<card>. Only serpent has been aligned to creature. During chaining, the
 # remaining subtypes will be chained
-re_align_sub = re.compile(
+re_align_sub = lazyre.compile(
     r"(ch<¬?(?:" + re_sub_char.pattern + ")> )+"
     r"(ch<¬?(?:artifact|creature|enchantment|instant|land|planeswalker|sorcery)"
     r"(?:[∧∨⊕→]¬?(?:artifact|creature|enchantment|instant|land|planeswalker|sorcery))*"
@@ -1344,7 +1376,7 @@ re_align_sub = re.compile(
 
 # hanging subtypes are those subtype characteristics that are not followed by
 # a type characteristic.
-re_hanging_subtype = re.compile(
+re_hanging_subtype = lazyre.compile(
     r"(ch<¬?(?:" + re_sub_char.pattern + ")[^>]*>)"
      r"(?! ch<¬?(?:artifact|creature|enchantment|instant|land|planeswalker|sorcery)[^>]*>)"
 )
@@ -1353,7 +1385,7 @@ re_hanging_subtype = re.compile(
 # Skinshifter) where characteristics are separated by an action (attacking)
 # TODO: so far have only found cases where the action is attacking. have to be
 #  on the lookout for other tokens
-re_disjoint_ch = re.compile(
+re_disjoint_ch = lazyre.compile(
     r"(ch<(?:¬?(?:white|blue|black|green|red|colorless|multicolored|monocolored|"
      r"historic|legendary|basic|snow|world))>) (xa<[^>]+>) (ch<[^>]+>)"
 )
@@ -1364,26 +1396,31 @@ re_disjoint_ch = re.compile(
 ####
 
 # ... p/t X/Y or p/t A/B ...
-re_pt_chain = re.compile(r"(ch<p/t[^>]+>) or (ch<p/t[^>]+>)")
+re_pt_chain = lazyre.compile(r"(ch<p/t[^>]+>) or (ch<p/t[^>]+>)")
 
 # chain two or more sequential tags of the same id having the form
 #   [tid 1, ..., tid n-2] tid n-1[,] conjunction op tid n
 # that can be combined into a single tag
+_re_chains_ = {} # tag-id -> compiled chain pattern
 def re_chain(tid):
     """
     compiles a conjunction chaing pattern of type tid
     :param tid: the two letter tag-id to search for
     :return: regex.Pattern
     """
-    return re.compile(
-        r"((?:{0}<[^>]+>, )*)({0}<[^>]+>),? (and|or|and/or) ({0}<[^>]+>)".format(tid)
-    )
+    try:
+        return _re_chains_[tid]
+    except KeyError:
+        _re_chains_[tid] = re.compile(
+            r"((?:{0}<[^>]+>, )*)({0}<[^>]+>),? (and|or|and/or) ({0}<[^>]+>)".format(tid)
+        )
+        return _re_chains_[tid]
 
 # above not working for quantifiers TODO: why
-re_chain_quantifiers = re.compile(r"xq<[^>]+> xq<[^>]+>( xq<[^>]+>)*")
+re_chain_quantifiers = lazyre.compile(r"xq<[^>]+> xq<[^>]+>( xq<[^>]+>)*")
 
 # a subset of the conjunction_chain that matches only color chains
-re_clr_conjunction_chain = re.compile(
+re_clr_conjunction_chain = lazyre.compile(
     r"((?:ch<¬?(?:white|blue|black|green|red|colorless|multicolored|monocolored)>, )*)"
     r"(ch<¬?(?:white|blue|black|green|red|colorless|multicolored|monocolored)>)"
     r",? (and|or|and/or) "
@@ -1392,21 +1429,21 @@ re_clr_conjunction_chain = re.compile(
 
 # currently only 1 card found with this pattern, Seize the Soul, Destroy target
 # nonwhite, nonblack creature.
-re_clr_conjunction_chain_special = re.compile(
+re_clr_conjunction_chain_special = lazyre.compile(
     r"(ch<¬?(?:white|blue|black|green|red|colorless|multicolored|monocolored)>), "
      r"(ch<¬?(?:white|blue|black|green|red|colorless|multicolored|monocolored)>)"
 )
 
 # search for color conjunction type only 2, Soldevi Adnate and Tezzeret's
 # Gatebreaker. These are special cases
-re_clr_conj_type = re.compile(
+re_clr_conj_type = lazyre.compile(
     r"ch<(¬?(?:white|blue|black|green|red|colorless|multicolored|monocolored))>"
     r" (and|or|and\or) "
     r"(ch<¬?(?:artifact|creature|enchantment|instant|land|planeswalker|sorcery)[^>]*>)"
 )
 
 # a subset of the conjunction_chain that matches only type chains
-re_type_conjunction_chain = re.compile(
+re_type_conjunction_chain = lazyre.compile(
     r"((?:ch<¬?(?:artifact|creature|enchantment|instant|land|planeswalker|sorcery)[^>]*>, )*)"
     r"(ch<¬?(?:artifact|creature|enchantment|instant|land|planeswalker|sorcery)[^>]*>)"
     r",? (and|or|and/or) "
@@ -1415,7 +1452,7 @@ re_type_conjunction_chain = re.compile(
 
 # color type pairs where the pair is not preceded by or followed by a characteristic
 # matches the color value and the type tag
-re_clr_type_chain = re.compile(
+re_clr_type_chain = lazyre.compile(
     r"(?<!ch<[^>]+> )"
     r"(?:ch<(¬?(?:white|blue|black|green|red|colorless|multicolored|monocolored)"
     r"(?:[∧∨⊕]¬?(?:white|blue|black|green|red))*)>)"
@@ -1428,7 +1465,7 @@ re_clr_type_chain = re.compile(
 # in Lay Bare the Heart (supertype) and Urborg Stalker (color). Several of these
 # i.e. Martyrdom are part of a larger or clause (arget creature, planeswalker, or
 # player) so it also captures any trailing conjunctions
-re_conjunction_chain_special = re.compile(
+re_conjunction_chain_special = lazyre.compile(
     r"ch<(¬?(?:white|blue|black|green|red|colorless|multicolored|monocolored|"
     r"artifact|creature|enchantment|instant|land|planeswalker|sorcery|tribal|"
     r"historic|legendary|basic|snow|world))>"
@@ -1441,7 +1478,7 @@ re_conjunction_chain_special = re.compile(
 #    ob<permanent characteristics=planeswalker>, or xp<opponent>.
 # we will have one characteristic that is anded and one not. Additionally the last
 # object on the right of the conjuunction operator is a player so it won't be joined
-re_pob_chain = re.compile(
+re_pob_chain = lazyre.compile(
     r"ch<(¬?(?:artifact|creature|enchantment|instant|land|planeswalker|sorcery))"
     r"[∧∨⊕](¬?(?:artifact|creature|enchantment|instant|land|planeswalker|sorcery))>"
     r", "
@@ -1455,7 +1492,7 @@ re_pob_chain = re.compile(
 
 # Phrases of the form [SUPER] [P/T] [COLOR] TYPE [OBJECT]. This requires colors
 # types have been chained and aligned
-re_reify_phrase = re.compile(
+re_reify_phrase = lazyre.compile(
     # optional super-type (value only)
     r"(?:ch<(¬?legendary|basic|snow|world)> )?"
     # optional p/t (value only)
@@ -1472,26 +1509,26 @@ re_reify_phrase = re.compile(
 # after above we have some non-type characteristics followed by an object i.e.
 # Unmask. The characteristic may be complex but will not have an attribute dict.
 # matches the tag-value of the characteristic and the complete tag of the object
-re_reify_single = re.compile(r"ch<([^>]+)> (ob<[^>]+>)")
+re_reify_single = lazyre.compile(r"ch<([^>]+)> (ob<[^>]+>)")
 
 # finds singleton characteristics left over after reify_phrase, reify_single
 # these can reified into an attribute
-re_reify_singleton_char = re.compile(r"(ch<[^>]+>)")
+re_reify_singleton_char = lazyre.compile(r"(ch<[^>]+>)")
 
 # finds two consecutive space delimited objects. This may be permanent card i.e.
 # Celestial Gatekeeper possesive i.e Teferi's Response or nontoken permanent i.e.
 # City in a Bottle
-re_consecutive_obj = re.compile(r"(ob<[^>]+>) (ob<[^>]+>)")
+re_consecutive_obj = lazyre.compile(r"(ob<[^>]+>) (ob<[^>]+>)")
 
 ####
 ## MISC POST CHAIN OPERATIONS
 ####
 
 # find 'no' followed by an object
-re_no2num = re.compile(r"(no)(?= ob<)")
+re_no2num = lazyre.compile(r"(no)(?= ob<)")
 
 # find phrases of the form ATTR OP with no following number
-re_uninit_attr = re.compile(
+re_uninit_attr = lazyre.compile(
     r"xr<(p/t|everything|text|name|mana cost|cmc|power|toughness|"
     r"color_identity|color|type)> op<(.)>(?! nu)"
 )
@@ -1501,12 +1538,12 @@ re_uninit_attr = re.compile(
 ####
 
 # phrases of the form OBJECT with KEYWORD (assumes chained keywords)
-re_obj_with_kw = re.compile(r"(ob<[^>]+>) pr<with> kw<([^>]+)>")
+re_obj_with_kw = lazyre.compile(r"(ob<[^>]+>) pr<with> kw<([^>]+)>")
 
 # abilities can be preceded by mana, triggered, activated and in one case "bands
 # with other"
 # NOTE: Assumes that statuses have had their stem and suffix combined
-re_ability_type = re.compile(
+re_ability_type = lazyre.compile(
     r"(?:(?:xs|xo)<(\w+)>|(\"bands pr<with> xq<other>\")) (ob<ability[^>]*>)"
 )
 
@@ -1515,14 +1552,14 @@ re_ability_type = re.compile(
 ####
 
 # find cost preceded by a keyword i.e. Rafter Demon
-re_cost_type = re.compile(r"(kw<[\w-]+>) (xo<cost[^>]*>)")
+re_cost_type = lazyre.compile(r"(kw<[\w-]+>) (xo<cost[^>]*>)")
 
 # find punctuation immediately followed by quotations
-re_encl_punct = re.compile(r"([\.\,])(\'\"|\'|\")")
+re_encl_punct = lazyre.compile(r"([\.\,])(\'\"|\'|\")")
 
 # find status with suffix (these should all be (un)tap but catch
 # everything just in case
-re_status_suffix = re.compile(r"(st|xs)<(\w+) suffix=(\w+)>")
+re_status_suffix = lazyre.compile(r"(st|xs)<(\w+) suffix=(\w+)>")
 
 # tagging verb "to be" forms: 'is', 'are' and 'was', 'were' doing this after
 # other tagging to avoid rewriting a lot of patterns
@@ -1531,14 +1568,14 @@ is_forms = {
     'be':'xa<be>','been':'xa<be suffix=ed>',
 }
 is_forms_tkns = '|'.join(list(is_forms.keys()))
-re_is2tag = re.compile(r"\b({})\b".format(is_forms_tkns))
+re_is2tag = lazyre.compile(r"\b({})\b".format(is_forms_tkns))
 
 # OPERATOR NUMBER
-re_op_num = re.compile(r"op<(.)> nu<([^>]+)>")
+re_op_num = lazyre.compile(r"op<(.)> nu<([^>]+)>")
 
 # power and toughness = y - have to check that it is not preceded by a power = y
-re_pt_value = re.compile(
-    r"(?<!xr<power val=[^>]+>[^\.]+)xr<power> and xr<toughness val=([^>]+)>"
+re_pt_value = lazyre.compile(
+    r"(?<!xr<power val=[^>]+>[^\.\x1e]+)xr<power> and xr<toughness val=([^>]+)>"
 )
 
 ####
@@ -1550,16 +1587,16 @@ re_pt_value = re.compile(
 # mill
 #  can be targeted i.e. their library or the player i.e. your library
 #  can specify the number of cards "top 2 cards" or not "top card"
-re_mill = re.compile(
+re_mill = lazyre.compile(
     r"xa<put( suffix=\w+)?> xq<the> pr<top> (?:(nu<[^>]+>) )?ob<card[^>]*> "
     r"pr<of> (xp|xq)<[^>]+> zn<library> pr<into> (xp|xq)<[^>]+> zn<graveyard>"
 )
 
 # detain i.e. Mythos of Vadrok
 # [thing] can't attack or block and its activated abilities cant be activated
-re_detain = re.compile(
-    r"(?<=[,|\.|\n] )([^,|^\.]+) xa<can> cn<not> xa<attack> or xa<block> and "
-     r"([^,|^\.]+) ob<ability[^>]+> xa<can> cn<not> xa<be> ka<activate[^>]+>"
+re_detain = lazyre.compile(
+    r"(?<=[,|\.|\n] )([^,|^\.\x1e]+) xa<can> cn<not> xa<attack> or xa<block> and "
+     r"([^,|^\.\x1e]+) ob<ability[^>]+> xa<can> cn<not> xa<be> ka<activate[^>]+>"
 )
 
 # loot i.e. Merfolk Looter
@@ -1571,9 +1608,9 @@ re_detain = re.compile(
 
 # flicker i.e. Essence Flux
 # exile [thing] then return it to the battlefield [status]? under it's owner control
-re_flicker = re.compile(
-    r"ka<exile> ([^,]+),? sq<then> xa<return> ([^,|\.]+) pr<to> xq<the> "
-     r"zn<battlefield> (?:([^,|\.]+) )?pr<under> xo<it suffix='s> "
+re_flicker = lazyre.compile(
+    r"ka<exile> ([^,\x1e]+),? sq<then> xa<return> ([^,|\.\x1e]+) pr<to> xq<the> "
+     r"zn<battlefield> (?:([^,|\.\x1e]+) )?pr<under> xo<it suffix='s> "
      r"xp<owner suffix='s> xc<control>"
 )
 
@@ -1581,26 +1618,26 @@ re_flicker = re.compile(
 # re_blink = re.compile(r"")
 
 # etb and ltb (NOTE: matching any suffix which should only be 'tense'
-re_etb = re.compile(r"xa<enter( [^>]+)?> xq<the> zn<battlefield>")
-re_ltb = re.compile(r"xa<leave( [^>]+)?> xq<the> zn<battlefield>")
+re_etb = lazyre.compile(r"xa<enter( [^>]+)?> xq<the> zn<battlefield>")
+re_ltb = lazyre.compile(r"xa<leave( [^>]+)?> xq<the> zn<battlefield>")
 
 # [thing] able to block [thing] do so is difficult for the grapher
 # NOTE: prefixes have not been applied to action verbs yet
-re_able_to_block = re.compile(r"(.+) able pr<to> xa<block> (.+) xa<do> so")
+re_able_to_block = lazyre.compile(r"(.+) able pr<to> xa<block> (.+) xa<do> so")
 
 # find phrases of the form:
 # the color( or colors)? of your choice
-re_color_choice = re.compile(
+re_color_choice = lazyre.compile(
     r"xq<the> xr<color>( or xr<color suffix=s>)? pr<of> xp<you suffix='s> xo<choice>"
 )
 
 # find phrase of the form
 # life total among all players
-re_life_ttl = re.compile(r"(xo<life_total>) among xq<all> xp<player suffix=s>")
+re_life_ttl = lazyre.compile(r"(xo<life_total>) among xq<all> xp<player suffix=s>")
 
 # your opponents can be combined
-re_your_opponents = re.compile(r"xp<you suffix='s> xp<opponent suffix=s>")
-re_one_of_opponents = re.compile(r"nu<1> pr<of> xp<opponent suffix=s>")
+re_your_opponents = lazyre.compile(r"xp<you suffix='s> xp<opponent suffix=s>")
+re_one_of_opponents = lazyre.compile(r"nu<1> pr<of> xp<opponent suffix=s>")
 
 # own, control related - We want to remove "do not" replaceing it with the negation
 # sign and standarize others
@@ -1608,34 +1645,34 @@ re_one_of_opponents = re.compile(r"nu<1> pr<of> xp<opponent suffix=s>")
 # b. neither own nor control (Conjured Currency) -replace neither with "do not"
 # c you control but do not own (Thieving Amalgam) -and the own & control negating control
 # d. you don't control (Aether tradewinds) and don't own (Agent of Treachery)
-re_both_ownctrl = re.compile(r"xq<both> (xc<own∧control>)")
-re_neither_ownctrl = re.compile(r"neither xc<own> nor xc<control>")
-re_own_not_ctrl = re.compile(r"xc<control> but xa<do> cn<not> xc<own>")
-re_dont_ownctrl = re.compile(r"xa<do[^>]*> cn<not> xc<(own|control)>")
+re_both_ownctrl = lazyre.compile(r"xq<both> (xc<own∧control>)")
+re_neither_ownctrl = lazyre.compile(r"neither xc<own> nor xc<control>")
+re_own_not_ctrl = lazyre.compile(r"xc<control> but xa<do> cn<not> xc<own>")
+re_dont_ownctrl = lazyre.compile(r"xa<do[^>]*> cn<not> xc<(own|control)>")
 
 # action word prefixs
 #  either a form of 'to be' 'action-word' or 'to' 'action-word'
-re_prefix_aw = re.compile(
+re_prefix_aw = lazyre.compile(
     r"((?:xa|pr)<(?:is|be|become|to)[^>]*>) (?:(cn<not>) )?((?:xa|ka)<[^>]+>)"
 )
 
 # player's own phase (own is redudndant) - only found in Dosan and City of Solitude
-re_ply_own_phase = re.compile(r"(xp<[^>]+>) xc<own> (ts<[^>]+>)")
+re_ply_own_phase = lazyre.compile(r"(xp<[^>]+>) xc<own> (ts<[^>]+>)")
 
 # related to voting/votes
-re_vote_check = re.compile(r"ka<vote[^>]*>")
+re_vote_check = lazyre.compile(r"ka<vote[^>]*>")
 
 # named votes i.e. Magister of Worth 'grace' and 'condemnation
 # 1: extract the two named candidates
-re_vote_candidates = re.compile(
+re_vote_candidates = lazyre.compile(
     r"starting pr<with> xp<you>, xq<each> xp<player> ka<vote suffix=s> pr<for> "
-    r"([^\.]+) or ([^\.]+)."
+    r"([^\.\x1e]+) or ([^\.\x1e]+)."
 )
 
 # 2: grab the whole sub-phrase 'candidate1 or candidate2'
-re_vote_choice = re.compile(
+re_vote_choice = lazyre.compile(
     r"(?<=starting pr<with> xp<you>, xq<each> xp<player> ka<vote suffix=s> pr<for> )"
-    r"([^\.]+ or [^\.]+.)"
+    r"([^\.\x1e]+ or [^\.\x1e]+.)"
 )
 
 # deconflict 'vote' as an object
@@ -1644,9 +1681,10 @@ re_vote_choice = re.compile(
 # 3. any vote preceded by a quantifier or qualifier
 def vote_obj1(tkn): return re.compile(r"{} ka<vote>".format(tkn))
 def vote_obj2(tkn): return re.compile("{}(?= xa<get suffix=s> xl<more>)".format(tkn))
-re_vote_obj3 = re.compile(r"(?<=(?:xl|xq)<[^>]*> )ka<vote([^>]*)>")
+re_vote_obj3 = lazyre.compile(r"(?<=(?:xl|xq)<[^>]*> )ka<vote([^>]*)>")
 
 # find landwalk preceded by an object or attribute, do the same w/ offering/cycling
-re_landwalk = re.compile(r"((?:ob|xr)<[^>]+>) (kw<landwalk>)")
-re_offering = re.compile(r"(ob<[^>]+>) (kw<offering>)")
-re_cycling = re.compile(r"(ob<[^>]+>) (kw<cycling>)")
\ No newline at end of file
+re_landwalk = lazyre.compile(r"((?:ob|xr)<[^>]+>) (kw<landwalk>)")
+re_offering = lazyre.compile(r"(ob<[^>]+>) (kw<offering>)")
+re_cycling = lazyre.compile(r"(ob<[^>]+>) (kw<cycling>)")
+lazyre.register(__name__)
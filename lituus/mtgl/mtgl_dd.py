@@ -19,7 +19,7 @@ __maintainer__ = 'Temporal Inept'
 __email__ = 'temporalinept@mail.com'
 __status__ = 'Development'
 
-import regex as re
+import lituus.mtgl.lazyre as lazyre
 
 ####
 ## MISCELLANEOUS
@@ -50,18 +50,18 @@ MTG_PHASES = [
 # Thanks to 'Jens' for the solution to this at
 # https://stackoverflow.com/questions/6462578/regex-to-match-all-instances-not-inside-quotes
 # which finds any periods followed by an even number of quotes
-re_sentence = re.compile(r"\.(?=(?:[^\"]*\"[^\"]*\")*[^\"]*$)")
+re_sentence = lazyre.compile(r"\.(?=(?:[^\"]*\"[^\"]*\")*[^\"]*$)")
 
 # clauses are separated by commas (may include an and that will be 'stripped'
-re_clause = re.compile(r",(?: and)?")
-re_clause2 = re.compile(r', ')
+re_clause = lazyre.compile(r",(?: and)?")
+re_clause2 = lazyre.compile(r', ')
 
 ####
 ## TYPE CHECKS
 ####
 
 # an action clause will start with an action tag
-re_is_act_clause = re.compile(r"^[kx]a<\w+>")
+re_is_act_clause = lazyre.compile(r"^[kx]a<\w+>")
 
 ####
 ## LINE TYPES
@@ -69,11 +69,11 @@ re_is_act_clause = re.compile(r"^[kx]a<\w+>")
 
 # Ability word lines start with an ability word followed by a long hypen and then
 # the ability clause and end with a sentence
-re_aw_line = re.compile(r"^aw<([^>]+)> — (.+?)\.$")
+re_aw_line = lazyre.compile(r"^aw<([^>]+)> — (.+?)\.$")
 
 # Keyword lines start with a keyword (or object keyword if landwalk) and contain
 # one or more comma separated keyword claues
-re_kw_line = re.compile(r"^((?:ob|xr)<[^>]+> )?(kw<[\w-]+>)")
+re_kw_line = lazyre.compile(r"^((?:ob|xr)<[^>]+> )?(kw<[\w-]+>)")
 
 # a non-standard keyword line will contain a long hypen and end with a period
 # between the hypen and period is the non-standard cost i.e. Aboroth
@@ -90,8 +90,8 @@ re_kw_line = re.compile(r"^((?:ob|xr)<[^>]+> )?(kw<[\w-]+>)")
 # complex activated (contain an 'and' or 'or'
 # 2. the conjunction operator separates two phrases, the second being a triggered
 #  ability i.e. Chaos Moon
-re_complex_tgr_check = re.compile(r"^[^,]+,? (and|or) tp<[^>]+> [^\.]+\.?$")
-re_complex_tgr = re.compile(
+re_complex_tgr_check = lazyre.compile(r"^[^,]+,? (and|or) tp<[^>]+> [^\.]+\.?$")
+re_complex_tgr = lazyre.compile(
     r"^([^,]+),? (and|or) (tp<[^>]+> [^\.]+)\.?$"
 )
 
@@ -100,8 +100,8 @@ re_complex_tgr = re.compile(
 #  [cost]: [effect]. [Instructions]?
 # NOTE: knowing where effect and instructions split is difficult. For now we
 #  are assuming the last sentence if present are instructions
-re_act_check = re.compile(r"(?<!\"[^\"]+):")
-re_act_line = re.compile(r"^(.+?): (.+?)(?:\. ([^.]+))?\.?$")
+re_act_check = lazyre.compile(r"(?<!\"[^\"]+):")
+re_act_line = lazyre.compile(r"^(.+?): (.+?)(?:\. ([^.]+))?\.?$")
 
 # Triggered (603.1) lines starts with a trigger preamble
 # Triggered abilities have the form:
@@ -111,17 +111,17 @@ re_act_line = re.compile(r"^(.+?): (.+?)(?:\. ([^.]+))?\.?$")
 #  [When/Whenever/At] [condition] [triggered-ability]
 #  (Wildfire Devils) have conjoined conditions
 #  [When/Whenever/At] [condition] and|or [When/Whenever/At] [condition] ...
-re_tgr_check = re.compile(r"^(tp<\w+>)")
-re_tgr_line = re.compile(r"^tp<(\w+)> ([^,|^\.]+), ([^\.]+)(?:\. (.+))?\.?$")
-re_embedded_tgr_line = re.compile(r"^tp<([^>+)> ([^\.]+), (tp<[^>]+> [^\.]+)\.?$")
-re_conjoined_tgr_condition_line = re.compile(
+re_tgr_check = lazyre.compile(r"^(tp<\w+>)")
+re_tgr_line = lazyre.compile(r"^tp<(\w+)> ([^,|^\.]+), ([^\.]+)(?:\. (.+))?\.?$")
+re_embedded_tgr_line = lazyre.compile(r"^tp<([^>+)> ([^\.]+), (tp<[^>]+> [^\.]+)\.?$")
+re_conjoined_tgr_condition_line = lazyre.compile(
     r"^(tp<[^>]+> [^,]+) (and|or) (tp<[^>]+> [^,]+), (.+)\.?$"
 )
 
 # some cards have additional conditional phrases in the trigger condition
 # such as Faerie Miscreant where the trigger condition clause will have the form
 # [condition], if [condition]
-re_split_tgr_condition = re.compile(r"^(.+), (cn<if> .+)$")
+re_split_tgr_condition = lazyre.compile(r"^(.+), (cn<if> .+)$")
 
 # Delayed Triggered (603.7) "do something at a later time - contains a trigger
 # preamble but not usually at the beginning of the ability and end with a turn
@@ -130,8 +130,8 @@ re_split_tgr_condition = re.compile(r"^(.+), (cn<if> .+)$")
 #  [effect] [when/whenever/at] [condition]
 #  where the condition ends with a turn structure
 # NOTE: we ensure effect does not cross sentence/clause boundaries
-re_delayed_tgr_check = re.compile(r"tp<\w+> (?:.+ )?ts<[^>]+>\.?$")
-re_delayed_tgr_clause = re.compile(
+re_delayed_tgr_check = lazyre.compile(r"tp<\w+> (?:.+ )?ts<[^>]+>\.?$")
+re_delayed_tgr_clause = lazyre.compile(
     r"^([^,|^\.]+) tp<(\w+)> ((?:[^\.]+ )?ts<[^>]+>)\.?$"
 )
 
@@ -140,7 +140,7 @@ re_delayed_tgr_clause = re.compile(
 # that the first phrase does not have commas (or periods). In other words, if
 # there are commas preceding a ", and", this is part of a list otherwise, it
 # signifies distinct parts
-re_conjoined_phrase_dual = re.compile(r"^([^,|^\.]+), and ([^\.]+)$")
+re_conjoined_phrase_dual = lazyre.compile(r"^([^,|^\.]+), and ([^\.]+)$")
 
 # the following is not a defined line but needs to be handled carefully
 # Quotation enclosed phrases preceded by 'have' (Coral Net) or 'gain' (Abnormal
@@ -150,14 +150,14 @@ re_conjoined_phrase_dual = re.compile(r"^([^,|^\.]+), and ([^\.]+)$")
 #  granted via an optional check for an 'and' followed by an enclosed phrase
 # These have the form:
 #  [duration],? [object] has/gains "[ability]" [and "ability"]? [duration]?.
-re_enclosed_quote = re.compile(r'\"([^\"]+)\"') # drop the last period
+re_enclosed_quote = lazyre.compile(r'\"([^\"]+)\"') # drop the last period
 
 # variable instantiates have the form
 # [variable|variable attribute], where nu<x|y> is [instantiation]
 # NOTE: have to stop on a period, comma, end of line or 'and'
 # For certain cases (Magus of the Mind), we have to graph everything prior to
 # the variable and after the variable IOT to return it
-re_variable_val = re.compile(
+re_variable_val = lazyre.compile(
     r"^(.*?)"
     r"(nu<\w>|xr<[^>]+ val=\w>|\w\w<[^>]+ quantity=\w>)"
     r"([^,]*?), where nu<\w> xa<is> ([^\.|,]+?)"
@@ -166,7 +166,7 @@ re_variable_val = re.compile(
 
 # mana instantiates have the form (see Spell Rupture)
 # {X}, where nu<x> is [instantiation]
-re_variable_mana = re.compile(
+re_variable_mana = lazyre.compile(
     r"({x}), where nu<\w> xa<is> ([^\.|,]+?)(?=(?:\.|,| and|$))"
 )
 
@@ -182,7 +182,7 @@ re_variable_mana = re.compile(
 # Use findall to grab tuples of keyword clauses where t = (QUALITY,KEYWORD,TEXT)
 # NOTE: some keywords have commas in their parameters - have to make sure we
 #  split the clauses only if the comma is followed by another keyword
-re_kw_clause = re.compile(
+re_kw_clause = lazyre.compile(
     r"((?:xr|ob)<(?:¬?[\w\+\-/=¬∧∨⊕⋖⋗≤≥≡⇔→'\(\)]+?)"
      r"(?: [\w\+\-/=¬∧∨⊕⋖⋗≤≥≡⇔→'\('\)]+?)*>)? ?"
     r"kw<([\w-]+)>"
@@ -196,7 +196,7 @@ re_kw_clause = re.compile(
 #  a specific pattern for that keyword will be used
 
 # no parameters
-re_kw_empty = re.compile('')
+re_kw_empty = lazyre.compile('')
 
 # generic parameters
 
@@ -205,7 +205,7 @@ re_kw_empty = re.compile('')
 #  Affinity (702.40) Affinity for [QUALITY]
 #  Champion (702.71) Champion a [QUALITY]
 # keywords of the form KEYWORD for [quality] (affinity)
-re_kw_thing = re.compile(
+re_kw_thing = lazyre.compile(
     r"(?:pr<for>|sq<an?>)? ?"
     r"((?:ob|xp|xo)"
     r"<(?:¬?[\w\+\-/=¬∧∨⊕⋖⋗≤≥≡⇔→'\(\)]+?)(?: [\w\+\-/=¬∧∨⊕⋖⋗≤≥≡⇔→'\('\)]+?)*>)"
@@ -217,24 +217,24 @@ re_kw_thing = re.compile(
 # have a 'N'
 # TODO: could just remove the fist pattern and use the optional 'N' but not
 #  sure if I like that
-re_kw_n = re.compile(r"(?:nu<(\d+|x|y|z])>|—(.+?)$)")
-re_kw_n2 = re.compile(r"(?:nu<(\d+|x|y|z])>)?")
+re_kw_n = lazyre.compile(r"(?:nu<(\d+|x|y|z])>|—(.+?)$)")
+re_kw_n2 = lazyre.compile(r"(?:nu<(\d+|x|y|z])>)?")
 
 # keywords of the form KEYWORD [cost]
 # This will capture cost where cost is a mana string or a non-standard cost
 # mana costs will be in group 1 and non-standard will be in group 2
-re_kw_cost = re.compile(r"(?:((?:{[0-9wubrgscpx\/]+})+)|—(.+?)$)")
+re_kw_cost = lazyre.compile(r"(?:((?:{[0-9wubrgscpx\/]+})+)|—(.+?)$)")
 
 # same as above but adds an additional optional cost preceded by 'and/or'
 # seen in some kicker keyword lines
-re_kw_cost2 = re.compile(
+re_kw_cost2 = lazyre.compile(
     r"^(?:((?:{[0-9wubrgscpx\/]+})+(?: and/or (?:{[0-9wubrgscpx\/]+})+)?)|—(.+?))$"
 )
 
 # special parameters for specific keywords
 
 # 702.6 Equip ([quality])? [cost] cost may be nonstandard
-re_kw_equip = re.compile(
+re_kw_equip = lazyre.compile(
     r"(ob<(?:¬?[\w\+\-/=¬∧∨⊕⋖⋗≤≥≡⇔→'\(\)]+?)"
      r"(?: [\w\+\-/=¬∧∨⊕⋖⋗≤≥≡⇔→'\('\)]+?)*>)? ?"
     r"(?:((?:{[0-9wubrgscpx\/]+})+)|—(.+?)$)"
@@ -250,7 +250,7 @@ re_kw_equip = re.compile(
 #  3. from quality a, from quality b and from quality c
 # NOTE: due to using this with Hexproof which may not have any qualities, all
 #  three qualities are captured as optional
-re_kw_from_qual = re.compile(
+re_kw_from_qual = lazyre.compile(
     r"(?:pr<from> "
     r"((?:ob|xr)<(?:¬?[\w\+\-/=¬∧∨⊕⋖⋗≤≥≡⇔→'\(\)]+?)"
      r"(?: [\w\+\-/=¬∧∨⊕⋖⋗≤≥≡⇔→'\('\)]+?)*>))?"
@@ -264,7 +264,7 @@ re_kw_from_qual = re.compile(
 
 # Partner (702.123) has no parameters but Partner with (702.123f) does
 # Partner with [NAME]
-re_kw_partner = re.compile(
+re_kw_partner = lazyre.compile(
     r"(?:pr<with> "
     r"(ob<(?:¬?[\w\+\-/=¬∧∨⊕⋖⋗≤≥≡⇔→'\(\)]+?)"
      r"(?: [\w\+\-/=¬∧∨⊕⋖⋗≤≥≡⇔→'\('\)]+?)*>)"
@@ -274,7 +274,7 @@ re_kw_partner = re.compile(
 # splice (702.46) splice onto [quality] [cost]
 # TODO: the trailing period is not passed as parmater on non-standard costs
 # TODO: cannot get rid of the 'hidden group' in the cost portion
-re_kw_splice = re.compile(
+re_kw_splice = lazyre.compile(
     r"pr<onto> "
     r"(ob<(?:¬?[\w\+\-/=¬∧∨⊕⋖⋗≤≥≡⇔→'\(\)]+?)"
      r"(?: [\w\+\-/=¬∧∨⊕⋖⋗≤≥≡⇔→'\('\)]+?)*>)"
@@ -283,10 +283,10 @@ re_kw_splice = re.compile(
 
 # forecast (702.56) forecast — [actiavated ability] and
 # companion (702.139) companion - condition
-re_kw_statement = re.compile(r" ?— (.+?)$")
+re_kw_statement = lazyre.compile(r" ?— (.+?)$")
 
 # suspend (702.61) suspend [N] — [cost] [optional inst]
-re_kw_suspend = re.compile(
+re_kw_suspend = lazyre.compile(
     r"nu<(\d+|x|y|z])>"
     r"—"
     r"((?:{[0-9wubrgscpx\/]+})+)"
@@ -531,14 +531,14 @@ kw_param_template = {
 # NOTE: for 1 and 2, we write two distinct regex due to mismatches caused by
 #  having an optional thing
 # TODO: this assumes that there will never be more than 4 conjoined action clauses
-re_conjoined_act_phrase_implied = re.compile(
+re_conjoined_act_phrase_implied = lazyre.compile(
     r"^(?:((?:xa|ka)<[^>]+>(?: [^,|^\.]+)?), )?"
     r"((?:xa|ka)<[^>]+>(?: [^,|^\.]+)?), "
     r"((?:xa|ka)<[^>]+>(?: [^,|^\.]+)?), "
     r"(and|or|and/or) "
     r"((?:xa|ka)<[^>]+>(?: [^,|^\.]+)?)\.?$"
 )
-re_conjoined_act_phrase_common = re.compile(
+re_conjoined_act_phrase_common = lazyre.compile(
     r"^(?:([^,|^\.]*?) )"
     r"(?:((?:xa|ka)<[^>]+>(?: [^,|^\.]+)?), )?"
     r"((?:xa|ka)<[^>]+>(?: [^,|^\.]+)?), "
@@ -546,7 +546,7 @@ re_conjoined_act_phrase_common = re.compile(
     r"(and|or|and/or) "
     r"((?:xa|ka)<[^>]+>(?: [^,|^\.]+)?)\.?$"
 )
-re_conjoined_act_phrase_distinct = re.compile(
+re_conjoined_act_phrase_distinct = lazyre.compile(
     r"^(?:([^,|^\.]*?(?:ob|xp|xo)<[^>]+>[^,|^\.]* (?:xa|ka)<[^>]+>(?: [^,|^\.]+)?), )?"
     r"([^,|^\.]*?(?:ob|xp|xo)<[^>]+>[^,|^\.]* (?:xa|ka)<[^>]+>(?: [^,|^\.]+)?), "
     r"([^,|^\.]*?(?:ob|xp|xo)<[^>]+>[^,|^\.]* (?:xa|ka)<[^>]+>(?: [^,|^\.]+)?), "
@@ -568,20 +568,20 @@ re_conjoined_act_phrase_distinct = re.compile(
 
 # duration/times/sequences
 #  [quantifier] [turn-structure] i.e Relentless Raptor
-re_quant_duration_clause = re.compile(r"^(xq<[^>]+> ts<\w+>)$")
+re_quant_duration_clause = lazyre.compile(r"^(xq<[^>]+> ts<\w+>)$")
 
 # a cost is one or more comma separated subcosts possibly either with a conjunction
 # operator or an implied and
 # each individual subcost may be a mana string (i.e. {2}), an mtg symbol (i.e. {T})
 # or a
-re_cost_delim = re.compile(r", ")
-re_cost_clause = re.compile(
+re_cost_delim = lazyre.compile(r", ")
+re_cost_clause = lazyre.compile(
     r"((?:[^,|^\.]+, )*)(?:([^,|^\.]+),? (and|or|and/or) )?([^,|^\.]+)$"
 )
 
 # keyword or lituus action clause
 # TODO: this is not a perfect check but will eliminate most none action clauses
-re_act_clause_check = re.compile(
+re_act_clause_check = lazyre.compile(
     r"((?:xa|ka|kw)<[^>]+>|xp<[^>]+> xc<(?:own|control)(?: suffix=s)?>)"
 )
 
@@ -592,7 +592,7 @@ re_act_clause_check = re.compile(
 # Note: the first two actions will begin with an action word the last will begin
 #  with an object
 # Only one:  Sen Triplets (after detains have been tagged)
-re_conjoined_act_or_and = re.compile(
+re_conjoined_act_or_and = lazyre.compile(
     r"([^,|^\.]+) ((?:ka|xa)<[^>]+>[^,|^\.]* (or|and) (?:ka|xa)<[^>]+>[^,|^\.]+) "
      r"(or|and) ((?:ka|xa)<[^>]+>[^,|^\.]+)\.?$"
 )
@@ -604,7 +604,7 @@ re_conjoined_act_or_and = re.compile(
 #  [thing] [predicate1] [not1]? and|or [predicate2] [not]? [parameters]?
 # NOTE: for now we are assuming that there will always be a subject but parameters
 #  may be empty
-re_conjoined_act_predicate = re.compile(
+re_conjoined_act_predicate = lazyre.compile(
     r"^([^,|^\.]+?) "
     r"((?:(?:xa|ka)<[^>]+>)(?: cn<not>)?){1} or ((?:(?:xa|ka)<[^>]+>)(?: cn<not>)?){1}"
     r"(?: ([^,|^\.]+))?\.?$"
@@ -616,7 +616,7 @@ re_conjoined_act_predicate = re.compile(
 #  1. this is a misnomer as both things could the same
 #  2. the first action clause may have an implied subject but we force the second
 #   action clause to have a subject
-re_conjoined_act_clause_unique = re.compile(
+re_conjoined_act_clause_unique = lazyre.compile(
     r"^([^,|^\.]*?(?:cn<not> )?(?:xa|ka|kw)<[^>]+>[^,|^\.]*)? (and|or|and/or) "
      r"([^,|^\.]*(?:ob|xp|xo)<[^>]+>[^,|^\.]*"
      r"(?:cn<not> )?(?:xa|ka|kw)<[^>]+>(?: [^,|^\.]+)?)\.?$"
@@ -626,7 +626,7 @@ re_conjoined_act_clause_unique = re.compile(
 # 1.c where the subject is the same and there are exactly two actions
 #  i.e. Lost Auramancers
 #    [thing] [action] and [action]
-re_conjoined_act_clause_common = re.compile(
+re_conjoined_act_clause_common = lazyre.compile(
     r"^(?:([^,|^\.]*?) )?((?:cn<not> )?(?:xa|ka|kw)<[^>]+>(?: [^,|^\.]+)?) "
     r"(and|or|and/or) ((?:cn<not> )?(?:xa|ka|kw)<[^>]+>(?: [^,|^\.]+)?)\.?$"
 )
@@ -637,14 +637,14 @@ re_conjoined_act_clause_common = re.compile(
 # [clause] can|do [not]? [action-clause]
 #  NOTE: In most cases, clause will be a Thing but in some i.e. Hushwing Gryff,
 #  it is an action
-re_action_cando_clause = re.compile(
+re_action_cando_clause = lazyre.compile(
     r"^(?:([^,|^\.]+?) )?xa<(can|do)[^>]*>(?: cn<(not)>)?(?: ([^,|^\.]+))?\.?$"
 )
 
 #  2. singular
 #   [thing]? [[action-word] [action-parameters]
 #  NOTE: have to make sure that the action(s) are not preceded by another action
-re_action_clause = re.compile(
+re_action_clause = lazyre.compile(
     r"^(?:([^,|^\.]*?(?:ob|xo|xp)<[^>]+>[^,|^\.]*?) )??"
      r"((?:cn<not> )?(?:xa|ka|kw)<[^>]+>)(?: ([^,|^\.]+))?\.?$"
 )
@@ -652,7 +652,7 @@ re_action_clause = re.compile(
 # 2.a do the same is another special phrasing i.e. Guild Fued (only 5 cards as
 # of IKO)
 # [player]? do the same [preposition] [thing]
-re_do_the_same_action_clause = re.compile(
+re_do_the_same_action_clause = lazyre.compile(
     r"^(?:([^,|^\.]*xp<[^>]+>) )?xa<do[^>]*> xq<the∧same> pr<([^>]+)> ([^,|^\.]+)\.?$"
 )
 
@@ -661,13 +661,13 @@ re_do_the_same_action_clause = re.compile(
 #  will also be treated as action clause. NOTE: IOT not match "you control" and
 #  the like, requires at least one character following the own/control tag
 # TODO: relook at this after changing own|control tagging
-re_action_ply_poss = re.compile(
+re_action_ply_poss = lazyre.compile(
     r"^((?:xq<[^>]+> )?(?:xs<[^>]+> )?xp<[^>]+>) "
      r"xc<(own|control)(?: suffix=s)?>(?: ([^\.]+))\.?$"
 )
 
 # action word can be a single action word or preceded by not
-re_action_word = re.compile(r"(?:cn<(not)> )?((?:xa|ka|kw)<[^>]+>)")
+re_action_word = lazyre.compile(r"(?:cn<(not)> )?((?:xa|ka|kw)<[^>]+>)")
 
 ####
 ## REPLACEMENT EFFECTS (614)
@@ -689,8 +689,8 @@ re_action_word = re.compile(r"(?:cn<(not)> )?((?:xa|ka|kw)<[^>]+>)")
 # replacement effects with bookend-ed sequences i.e. Forcefield have the form
 #  [the next time] [original] [this turn] [new] instead?
 # these can be conjoined
-re_repl_seq_bookend_check = re.compile(r"^[^,]+ sq<\w+>.+cn<would>.+ts<\w+>,")
-re_repl_seq_bookend = re.compile(
+re_repl_seq_bookend_check = lazyre.compile(r"^[^,]+ sq<\w+>.+cn<would>.+ts<\w+>,")
+re_repl_seq_bookend = lazyre.compile(
     r"^(xq<the∧next> sq<time>) ([^,|^\.]+) (xq<this> ts<turn>), "
     r"([^,|^\.]+)(?: (cn<instead>))?\.?$"
 )
@@ -703,13 +703,13 @@ re_repl_seq_bookend = re.compile(
 #  a. if [thing] would [action] or [thing] would [action], [action] instead i.e Anafenza
 #  b. if [thing] would [action], [action] instead i.e. Abandoned Sarcophagus
 #  c. if [thing] would [action], instead [action] i.e. Breathstealer's Crypt
-re_repl_if_would2_instead = re.compile(
+re_repl_if_would2_instead = lazyre.compile(
     r"^cn<if> (.+) cn<would> (.+) or (.+) cn<would> ([^,]+), (.+) cn<instead>\.?$"
 )
-re_repl_if_would_instead1 = re.compile(
+re_repl_if_would_instead1 = lazyre.compile(
     r"^cn<if> (.+) cn<would> ([^,]+), (.+) cn<instead>\.?$"
 )
-re_repl_if_would_instead2 = re.compile(
+re_repl_if_would_instead2 = lazyre.compile(
     r"^cn<if> (.+) cn<would> ([^,]+), cn<instead> ([^\.]+)\.?$"
 )
 
@@ -717,78 +717,78 @@ re_repl_if_would_instead2 = re.compile(
 #  [original] that would [(action) original] (action) [replacment] instead.
 # I cannot handle these by RegEx alone as the condition and replacement are
 # separated by an action word
-re_repl_that_would_instead = re.compile(
+re_repl_that_would_instead = lazyre.compile(
     r"^([^,|\.]+) xq<that> cn<would> (.+) cn<instead>\.?$"
 )
 
 # that would instead variant i.e. False Dawn
 # [sequence] [thing] [action (original)] instead [action (new)]
-re_repl_seq_that_would_instead = re.compile(
+re_repl_seq_that_would_instead = lazyre.compile(
     r"^([^,|\.]+), (.+) xq<that> cn<would> ([^\.]+) cn<instead> ([^\.]+)\.?$"
 )
 
 # may instead (limited replacement - have only seen 3 i.e. Abundance
 # if [player] would [action], [player] may instead [action]
-re_repl_if_may_instead = re.compile(
+re_repl_if_may_instead = lazyre.compile(
     r"^cn<if> (.+) cn<would> ([^,]+), (.+) cn<may> cn<instead> ([^\.]+)\.?$"
 )
 
 # if instead of i.e. Pale Moon
 #   if [action], [replacement] instead of [original]
-re_repl_if_instead_of = re.compile(
+re_repl_if_instead_of = lazyre.compile(
     r"^(cn<if> .+), (.+) cn<instead> pr<of> ([^\.]+)\.?$"
 )
 
 # instead of if i.e. Caravan Vigil
 #  [replacement] instead of [orginal] [conditional-phrase]
-re_repl_instead_of_if = re.compile(
+re_repl_instead_of_if = lazyre.compile(
     r"^([^,|\.]+) cn<instead> pr<of> (.+) (cn<if> [^\.]+)\.?$"
 )
 
 # instead of i.e. Feather, the Redeemed
 #  [replacement] instead of [original]
 # NOTE: these do not have a preceeding if/would
-re_repl_instead_of = re.compile(r"^([^,|\.]+) cn<instead> pr<of> ([^\.]+)\.?$")
+re_repl_instead_of = lazyre.compile(r"^([^,|\.]+) cn<instead> pr<of> ([^\.]+)\.?$")
 
 # if instead i.e. Cleansing Meditation
 #   if [event/condition] instead [replacement].
 # the instead comes between the condition and the replacement
-re_repl_if_instead = re.compile(r"^cn<if> (.+) cn<instead> ([^\.]+)\.?$")
+re_repl_if_instead = lazyre.compile(r"^cn<if> (.+) cn<instead> ([^\.]+)\.?$")
 
 # if instead fence i.e. Nyxbloom Ancient
 #   if [event/condition], [replacement] instead
-re_repl_if_instead_fence = re.compile(r"^cn<if> (.+), (.+) cn<instead>\.?$")
+re_repl_if_instead_fence = lazyre.compile(r"^cn<if> (.+), (.+) cn<instead>\.?$")
 
 # instead if i.e. Crown of Empires
 #  [replacement] instead if [condition]
 # the condition and replacement are switched
-re_repl_instead_if = re.compile(r"^([^,|\.]+) cn<instead> cn<if> ([^\.]+)\.?$")
+re_repl_instead_if = lazyre.compile(r"^([^,|\.]+) cn<instead> cn<if> ([^\.]+)\.?$")
 
 ## SKIP CLAUSES (614.1b)
 # skip clauses i.e. Stasis (Note as of IKO, I found 49) have the form
 #  [player]? skip(s) [phase/step]
 # where if player is not present there is an implied 'you'
 # Additionaly some cards (4 total as of IKO) i.e. Fasting include an optional 'may'
-re_repl_skip = re.compile(r"^(?:(.+?) )?(?:cn<(may)> )?xa<skip[^>]*> ([^\.]+)\.?$")
+re_repl_skip = lazyre.compile(r"^(?:(.+?) )?(?:cn<(may)> )?xa<skip[^>]*> ([^\.]+)\.?$")
 
 ## ENTERS THE BATTLEFIELD CLAUSES (614.1c)
 # Permanent enters the battlefield with ...
 # As Permanent enters the battlefield ...
 # Permanent enters the battlefield as ...
-re_repl_etb_check = re.compile(r"xa<etb(?: suffix=s)?>")
+re_repl_etb_check = lazyre.compile(r"xa<etb(?: suffix=s)?>")
 
 # Permanent enters the battlefield with ... i.e. Pentavus have the form
 #  [permanent] enters the battlefield with [counters]
 # these are all counters
-re_repl_etb_with = re.compile(r"^([^,|\.]+) xa<etb(?: suffix=s)?> pr<with> ([^\.]+)\.?$")
+re_repl_etb_with = lazyre.compile(r"^([^,|\.]+) xa<etb(?: suffix=s)?> pr<with> ([^\.]+)\.?$")
 
 # As permanent enters the battlefield ... i.e. Sewer Nemesis have the form
 #  as [thing] enters the battlefield, [event]
-re_repl_as_etb = re.compile(r"^pr<as> ([^,|\.]+) (xa<etb(?: suffix=s)?>), ([^\.]+)\.?$")
+re_repl_as_etb = lazyre.compile(r"^pr<as> ([^,|\.]+) (xa<etb(?: suffix=s)?>), ([^\.]+)\.?$")
 
 # Permanent enters the battlefield as ... i.e. Clone
 #  [Player may have]? [thing] enters the battlelfield as [thing]
-re_repl_etb_as = re.compile(
+re_repl_etb_as = lazyre.compile(
     r"^(?:([^,|\.]+) cn<may> xa<have> )?"
      r"([^,|\.]+) xa<etb(?: suffix=s)?> pr<as> ([^\.]+)\.?$"
 )
@@ -799,13 +799,13 @@ re_repl_etb_as = re.compile(
 #  Effect Gather Specimens
 # Objects enter the battlefield ...
 #  NOTE: have to assume that after above, all remaining ETB fit this
-re_repl_etb_status = re.compile(r"^([^,|\.]+) xa<etb(?: suffix=s)?> st<([^>]+)>\.?$")
-re_repl_etb_1d = re.compile(r"^([^,|\.]+ xa<etb(?: suffix=s)?>)(?: ([^\.]+))?\.?$")
+re_repl_etb_status = lazyre.compile(r"^([^,|\.]+) xa<etb(?: suffix=s)?> st<([^>]+)>\.?$")
+re_repl_etb_1d = lazyre.compile(r"^([^,|\.]+ xa<etb(?: suffix=s)?>)(?: ([^\.]+))?\.?$")
 
 ## TURNED FACE UP (614.1e)
 # As Permanent is turned face up i.e. Gift of Doom
-re_repl_turn_up_check = re.compile(r"xa<turn suffix=ed> xm<face amplifier=up>")
-re_repl_turn_up = re.compile(
+re_repl_turn_up_check = lazyre.compile(r"xa<turn suffix=ed> xm<face amplifier=up>")
+re_repl_turn_up = lazyre.compile(
     r"^pr<as> (.+ xa<is> xa<turn suffix=ed> xm<face amplifier=up>), ([^\.]+)\.?$"
 )
 
@@ -814,8 +814,8 @@ re_repl_turn_up = re.compile(
 # similar to 'instead' but is a replacement under 614.2 i.e. Sphere of Purity
 # this will catch regenerate i.e. Mossbridge Troll as well as prevention
 # if [source] would [old], [new]
-re_repl_dmg_check = re.compile(r"(?:ef<[^>]*damage[^>]*>|ka<regenerate>)")
-re_repl_dmg = re.compile(r"^cn<if> (.+) cn<would> (.+), (.+)\.?$")
+re_repl_dmg_check = lazyre.compile(r"(?:ef<[^>]*damage[^>]*>|ka<regenerate>)")
+re_repl_dmg = lazyre.compile(r"^cn<if> (.+) cn<would> (.+), (.+)\.?$")
 
 # and (615) Prevention Effects
 #  Prevention effects will start with 'prevent', contain damage and will have a
@@ -827,7 +827,7 @@ re_repl_dmg = re.compile(r"^cn<if> (.+) cn<would> (.+), (.+)\.?$")
 # only target Abuna Acolyte
 # neither target nor source see Revealing Wind
 # except by see Insprie Awe (this is the only one I've seen
-re_repl_prevent_dmg = re.compile(
+re_repl_prevent_dmg = lazyre.compile(
     r"^xa<prevent> ([^,|^\.]*ef<[^>]*damage[^>]*>)"
      r" xq<that> cn<would> xa<be> xa<deal[^>]*>"
      r"(?: pr<to> ([^,|^\.]+?))?"
@@ -837,7 +837,7 @@ re_repl_prevent_dmg = re.compile(
 
 # variation where target and source are the same i.e. Moonlight Geist has the form
 #  prevent [damage] that would be dealt to and dealt by [thing] [sequence]?
-re_repl_prevent_dmg2 = re.compile(
+re_repl_prevent_dmg2 = lazyre.compile(
     r"^xa<prevent> ([^,|^\.]*ef<[^>]*damage[^>]*>)"
      r" xq<that> cn<would> xa<be> xa<deal[^>]+> pr<to> and xa<deal[^>]+> pr<by>"
      r" ([^,|^\.]+?)(?: ((?:xq|sq)<[^>]+> ts<[^>]+>))?\.?$"
@@ -847,7 +847,7 @@ re_repl_prevent_dmg2 = re.compile(
 #  Refraction Trap has a target
 #  Guard Dogs does not
 #  prevent [damage] [source] would [action] [sequence]?
-re_repl_prevent_dmg3 = re.compile(
+re_repl_prevent_dmg3 = lazyre.compile(
     r"^xa<prevent> ([^,|^\.]*ef<[^>]*damage[^>]*>)(?: xq<that[^>]*>)? (.+)"
     r" cn<would> xa<deal[^>]*>(?: pr<to> (.+?))?"
     r"(?: ((?:xq|sq)<[^>]+> ts<[^>]+>))?\.?$"
@@ -855,14 +855,14 @@ re_repl_prevent_dmg3 = re.compile(
 
 # variation to prevent damage to target only, see Angel of Salvation has the form
 # prevent [damage] that would be dealt [sequence]? to [target]
-re_repl_prevent_dmg_tgt = re.compile(
+re_repl_prevent_dmg_tgt = lazyre.compile(
     r"^xa<prevent> ([^,|^\.]+?) xq<that> cn<would> xa<be> xa<deal[^>]*>"
      r"(?: ((?:xq|sq)<[^>]+> ts<[^>]+>))? pr<to> ([^,|^\.]+)\.?$"
 )
 
 # variation to prevent damage by source only, see Barbed Wire has the form
 # prevent [damage] that would be dealt by [source] [sequence]
-re_repl_prevent_dmg_src = re.compile(
+re_repl_prevent_dmg_src = lazyre.compile(
     r"^xa<prevent> ([^,|^\.]+?) xq<that> cn<would> xa<be> xa<deal[^>]*> "
      r"pr<by> ([^,|^\.]+) ((?:xq|sq)<[^>]+> ts<[^>]+>)\.?$"
 )
@@ -879,7 +879,7 @@ re_repl_prevent_dmg_src = re.compile(
 #  and Bringer of the Red Dawn for a conditionless
 # NOTE: the action may be an alternate/reduced mana payment i.e. Ricochet Trap or
 #  other i.e. Sivvi's Valoryu76
-re_apc_action = re.compile(
+re_apc_action = lazyre.compile(
     r"^(?:cn<if> (.+), )?([^,]+) cn<may> ([^,]+) cn<rather_than> (xa<pay> [^\.]+)\.$"
 )
 
@@ -887,19 +887,19 @@ re_apc_action = re.compile(
 # Invigorate).
 #  if [condition], rather than pay self's mana cost you may [action].
 # this is alternate phrasing of re_action_apc and always has a condition
-re_apc_alt_action = re.compile(
+re_apc_alt_action = lazyre.compile(
     r"^cn<if> (.+), cn<rather_than> (xa<pay> [^,]+), (xp<you>) cn<may> ([^\.]+)\.?$"
 )
 
 # two alternate phrasing that do not contain a conditional
 #  rather than pay [cost], [player] may [action] see Dream Halls
-re_apc_rather_than_may = re.compile(
+re_apc_rather_than_may = lazyre.compile(
     r"^cn<rather_than> (xa<pay> [^,]+), ([^\.]+) cn<may> ([^\.]+)\.?$"
 )
 
 # see i.e. Scourge of Nel Toth
 # [player] may [action] pr<by> [alt-cost] rather than [cost]
-re_apc_may_rather_than = re.compile(
+re_apc_may_rather_than = lazyre.compile(
     r"^([^,]+) cn<may> ([^,]+) pr<by> (xa<pay[^>]*> [^,]+) "
      r"cn<rather_than> (xa<pay[^>]*> [^,]+)\.?$"
 )
@@ -907,28 +907,28 @@ re_apc_may_rather_than = re.compile(
 # 3rd alternate phrasing found (so far only in Bolas's Citadel)
 #  if [player] [cond], [apc] rather than [cost]
 # These are not optional apcs
-re_apc_rather_than_mand = re.compile(
+re_apc_rather_than_mand = lazyre.compile(
     r"^cn<if> (.*xp<[^>]+>) (.+), "
      r"(xa<pay> [^,]+) cn<rather_than> (xa<pay> [^,]+)\.?$"
 )
 
 # if [condition], [you may cast object] without [paying its mana cost] i.e. Massacre
 # these are all condition based
-re_apc_cast_nocost = re.compile(
+re_apc_cast_nocost = lazyre.compile(
     r"^cn<if> ([^,]+), ([^,]+) cn<may> ([^,]+) pr<without> ([^.]+)\.?$"
 )
 
 ## ADDITIONAL COSTS
 # (mentioned throughout but phrased in 604.5 "As an additional cost to cast..."
 # As an additional cost to cast [thing], [add-cost] see Abjure
-re_add_cost_check = re.compile(r"xq<a∧additional> xo<cost>")
-re_add_cost = re.compile(
+re_add_cost_check = lazyre.compile(r"xq<a∧additional> xo<cost>")
+re_add_cost = lazyre.compile(
     r"^pr<as> xq<a∧additional> xo<cost> ka<cast prefix=to> ([^,]+), ([^\.]+)\.?$"
 )
 
 ## option delimiter
 # used in both modal and level up
-re_opt_delim = re.compile(r" ?•")
+re_opt_delim = lazyre.compile(r" ?•")
 
 ## MODAL PHRASES
 # (700.2) modal phrases i.e. Charming Prince have two or more options in a bulleted
@@ -942,9 +942,9 @@ re_opt_delim = re.compile(r" ?•")
 # includes an operator
 # NOTE: Some cards i.e. Arful Takedown have the form:
 #  choose [number] or both. [Instructions] (•[choice])+
-re_modal_check = re.compile(r"^xa<choose> nu<([^>]+)>.+•")
-re_modal_phrase = re.compile(r"^xa<choose> nu<([^>]+)>(?: or xq<(both)> )?—([^\.]+)\.?$")
-re_modal_phrase_instr = re.compile(r"^xa<choose> nu<([^>]+)>\. ([^•]+) ([^\.]+)\.?$")
+re_modal_check = lazyre.compile(r"^xa<choose> nu<([^>]+)>.+•")
+re_modal_phrase = lazyre.compile(r"^xa<choose> nu<([^>]+)>(?: or xq<(both)> )?—([^\.]+)\.?$")
+re_modal_phrase_instr = lazyre.compile(r"^xa<choose> nu<([^>]+)>\. ([^•]+) ([^\.]+)\.?$")
 
 ## LEVELER PHRASES
 # (710.2a) (NOTE: the form as specified in 710.2a has [Abilities] [P/T] whereas
@@ -952,16 +952,16 @@ re_modal_phrase_instr = re.compile(r"^xa<choose> nu<([^>]+)>\. ([^•]+) ([^\.]+
 # Level lines consist of one or more level clauses each having the form:
 #  •[level symbol] [P/T]? [Abilities]
 # see Enclave Cryptologist
-re_lvl_up_check = re.compile(r"^•xo<level>")
-re_lvl_up_lvl = re.compile(
+re_lvl_up_check = lazyre.compile(r"^•xo<level>")
+re_lvl_up_lvl = lazyre.compile(
     r"^xo<level> nu<([^>]+)>(\+|-)(?:nu<([^>]+)>)?"
      r"(?: xr<p/t val=(\d+/\d+)>)?(?: (.+))?$"
 )
 
 ## SAGA PHRASES
 # (714.2)
-re_saga_check = re.compile(r"^i.* — ") # there is a hanging newline
-re_chapter_delim = re.compile(r"(i[iv]*(?:, i[iv]+)*) — ")
+re_saga_check = lazyre.compile(r"^i.* — ") # there is a hanging newline
+re_chapter_delim = lazyre.compile(r"(i[iv]*(?:, i[iv]+)*) — ")
 
 ####
 ## LITUUS PHRASE TYPES
@@ -969,14 +969,14 @@ re_chapter_delim = re.compile(r"(i[iv]*(?:, i[iv]+)*) — ")
 
 # sequences
 #  Checks - any line with a sequence tag will be considered a sequence
-re_seq_check = re.compile(r"(?:ts|sq)<[^>]+>")
+re_seq_check = lazyre.compile(r"(?:ts|sq)<[^>]+>")
 
 # 'then' flow of actions has the forms
 # [action]?,? then [action] again?
 #  Roalesk, Apex Hybrid has a terminating 'again'
 #  Barishi is a action-then-action w/o comma, Entomb is a action-then-action w/ comma
 #  Endless Horizons does not have an initial action
-re_seq_then = re.compile(
+re_seq_then = lazyre.compile(
     r"^(?:([^,|^\.]+),? )?sq<then> ([^,|^\.]+?)(?: (sq<again>))?\.?$"
 )
 
@@ -985,7 +985,7 @@ re_seq_then = re.compile(
 #  1. there are no effects associated with these sequences
 #  2. these are generally of the form "during your turn, before attackers are
 #  declared" but we will generalize as much as possible (see Blaze of Glory)
-re_seq_dual = re.compile(
+re_seq_dual = lazyre.compile(
     r"^sq<(during|until|after|before)> ([^,]+),? "
     r"sq<(during|until|after|before)> ([^\.]+)\.?$"
 )
@@ -997,7 +997,7 @@ re_seq_dual = re.compile(
 # There are two cases:
 #  1. the turn-structures is the same i.e. Battlegate Mimic
 #  2. the turn-structures are different i.e. Veil of Secrecy
-re_conjoined_seq = re.compile(
+re_conjoined_seq = lazyre.compile(
     r"^([^,|^\.]+) ((?:xq|sq)<[^>]+> ts<[^>]+>),? and "
      r"([^,|^\.]+) ((?:xq|sq)<[^>]+> ts<[^>]+>)\.?$"
 )
@@ -1005,13 +1005,13 @@ re_conjoined_seq = re.compile(
 # for the first time each turn i.e. Vengeful Warchief has the form
 # [clause] for the first time each turn
 # TODO: do we need to changes this for Skull Storm "for each time"
-re_seq_first_time = re.compile(
+re_seq_first_time = lazyre.compile(
     r"^([^,|^\.]+) pr<for> xq<the∧first> sq<time> (xq<each> ts<turn>)\.?$"
 )
 
 # until phase, effect have the form i.e. Volrath, the Shapestealer
 # until [phase], [effect]
-re_seq_until_phase = re.compile(r"^sq<(until)> ([^,|^\.]*ts<[^>]+>), ([^,|^\.]+)\.?$")
+re_seq_until_phase = lazyre.compile(r"^sq<(until)> ([^,|^\.]*ts<[^>]+>), ([^,|^\.]+)\.?$")
 
 # during, as-long-as, until, after have the form
 # [effect] for? [seq-word] [condition]
@@ -1020,14 +1020,14 @@ re_seq_until_phase = re.compile(r"^sq<(until)> ([^,|^\.]*ts<[^>]+>), ([^,|^\.]+)
 # as-long-as: Angelic Field
 # until: Rage Weaver
 # after: Paradox Haze
-re_seq_effect_cond = re.compile(
+re_seq_effect_cond = lazyre.compile(
     r"^(?:([^,|^\.]+) )?(?:pr<for> )?"
     r"sq<(during|as_long_as|until|after|before)> ([^,|^\.]+)\.?$"
 )
 
 #
 # [turn-structure], [effect] i.e. Sen Triplets
-re_seq_ts_effect = re.compile(
+re_seq_ts_effect = lazyre.compile(
     r"((?:[^,|^\.]+)ts<[^>]+>), ([^,|^\.]+)\.?$"
 )
 
@@ -1037,29 +1037,29 @@ re_seq_ts_effect = re.compile(
 #  1. in some cases, there will be no effect see Interdict
 #  2. grabs everything that ends with a turn structure. have to a check for
 #   turn structure phrases that have beginning/end
-re_seq_phase_be_check = re.compile(r"sq<(?:beginning|end)>")
-re_seq_phase_end = re.compile(r"^(?:([^,|^\.]+) )?(xq<[^>]+> ts<[^>]+>)$")
+re_seq_phase_be_check = lazyre.compile(r"sq<(?:beginning|end)>")
+re_seq_phase_end = lazyre.compile(r"^(?:([^,|^\.]+) )?(xq<[^>]+> ts<[^>]+>)$")
 
 ##
 # optionals, conditions and restrictions
-re_optional_check = re.compile(r"cn<may>")
+re_optional_check = lazyre.compile(r"cn<may>")
 
 # conjoined optionals i.e. Hostage Taker
 #  [optional] and|or [optional]
-re_conjoined_opt_phrase = re.compile(
+re_conjoined_opt_phrase = lazyre.compile(
     r"^((?:[^,|\.]+)?xp<[^>]+>(?:[^,|\.]+)? cn<may> [^,|\.]+)"
     r", (and|or|and/or) "
     r"((?:[^,|\.]+)?xp<[^>]+>(?:[^,|\.]+)? cn<may> [^,|\.]+)\.?$"
 )
 
 # [player] may [action] as though [action] [if [condition]]? i.e. Lone Wolf
-re_opt_may_as_though = re.compile(
+re_opt_may_as_though = lazyre.compile(
     r"^((?:[^,|\.]+ )?xp<[^>]+>) cn<may> (.+) pr<as_though> ([^\.]+)\.?$"
 )
 
 # contains 'may' [player] may [action] i.e. Ad Nauseam
 #  NOTE: This also covers [player] may have [effect] such as Browbeat
-re_opt_player_may = re.compile(
+re_opt_player_may = lazyre.compile(
     r"^((?:[^,|\.]+)?xp<[^>]+>(?:[^,|\.]+)?) "
      r"cn<may> ([x|k]a<\w+>(?:[^\.]+))\.?$"
 )
@@ -1070,10 +1070,10 @@ re_opt_player_may = re.compile(
 #  1. for each [condition], [action] i.e. From the Ashes
 #  2. [action] for each [condition] i.e. Gnaw to the Bone
 # NOTE: we check the quantifier for chains
-re_cond_for_each_start = re.compile(
+re_cond_for_each_start = lazyre.compile(
     r"pr<for> xq<each(?:[∧∨⊕]([^>]+))?> ([^,|^\.]+), ([^\.]+)\.?$"
 )
-re_cond_for_each_mid = re.compile(
+re_cond_for_each_mid = lazyre.compile(
     r"^([^,|^\.]+) pr<for> xq<each(?:[∧∨⊕]([^>]+))?> ([^\.]+)\.?$"
 )
 
@@ -1082,37 +1082,37 @@ re_cond_for_each_mid = re.compile(
 #  is 'if able'
 #   [effect] if able
 # b.2 if able unless is in the middle i.e. Reckless Cohort
-re_cond_if_able_check = re.compile(r"cn<if> able")
-re_cond_if_able = re.compile(r"^([^,|^\.]+) cn<if> able\.?$")
-re_cond_if_able_unless = re.compile(
+re_cond_if_able_check = lazyre.compile(r"cn<if> able")
+re_cond_if_able = lazyre.compile(r"^([^,|^\.]+) cn<if> able\.?$")
+re_cond_if_able_unless = lazyre.compile(
     r"^([^,|^\.]+) cn<if> able cn<unless> ([^,|^\.]+)\.?$"
 )
 
 # b) if [condition] [phase]?, [action] i.e Ordeal of Thassa
 # Some cards like Kjeldoran Home Guard have a turn structure
 #  TODO: only grabbing simple turn-structure phrasing (quantifier phase)
-re_cond_if_cond_act = re.compile(
+re_cond_if_cond_act = lazyre.compile(
     r"^cn<if> ([^,|^\.]+?)(?: (xq<this> ts<[^>]+>))?, ([^\.]+)\.?$"
 )
 
 # c) if [condition], [action]. otherwise, [action] i.e Advice from the Fae
 #   NOTE: we need to catch this prior to lines being broken down into sentences
 #   so we catch previous sentences if present
-re_cond_if_otherwise = re.compile(
+re_cond_if_otherwise = lazyre.compile(
     r"^(?:(.+?\.) )?cn<if> ([^,|^\.]+), ([^\.]+)\. "
      r"cn<otherwise>, ([^\.]+)\.?(?: ([^\.]+)\.?)?$"
 )
 
 # d) [action] if [condition] i.e. Ghastly Demise
-re_cond_act_if_cond = re.compile(r"^([^,|^\.]+),? cn<if> ([^,|\.]+)\.?$")
+re_cond_act_if_cond = lazyre.compile(r"^([^,|^\.]+),? cn<if> ([^,|\.]+)\.?$")
 
 # e) hanging if would
-re_cond_if_would = re.compile(r"^cn<if> ([^,|^\.]+) cn<would> ([^,|^\.]+)\.?$")
+re_cond_if_would = lazyre.compile(r"^cn<if> ([^,|^\.]+) cn<would> ([^,|^\.]+)\.?$")
 
 # f) hanging if (fragmentary, that is, there is no effect) these are generally
 #  part of a higher level construct such as a triggered effect i.e. Nim Abomination
 #   if [condition]
-re_cond_if_hanging = re.compile(r"^cn<if> ([^\.]+)\.?$")
+re_cond_if_hanging = lazyre.compile(r"^cn<if> ([^\.]+)\.?$")
 
 # contains unless
 # The rules only mention unless in 722.6 "[A] unless [B]" However going through
@@ -1125,41 +1125,41 @@ re_cond_if_hanging = re.compile(r"^cn<if> ([^\.]+)\.?$")
 # NOTE: unless is generally part of a clause that is part of a phrase therefore
 #  we do not want to grab anything that extends to the left past a clause (",")
 #  or sentence (".") boundary
-re_cond_act_unless = re.compile(
+re_cond_act_unless = lazyre.compile(
     r"^((?:[^,|^\.]+ )?[kx]a<[^>]+>.+) cn<unless> ([^,|\.]+)\.?$"
 )
 
 # standalone otherwise i.e. primal empathy
-re_cond_otherwise = re.compile(r"^cn<otherwise>, ([^\.]+)\.?$")
+re_cond_otherwise = lazyre.compile(r"^cn<otherwise>, ([^\.]+)\.?$")
 
 # generic would/could phrases
 #  See Dimir Guildmange for a could, Rock Hydra for a would
 #  [thing] that? would|could not? [action]
-re_cond_generic = re.compile(
+re_cond_generic = lazyre.compile(
     r"^([^,|^\.]+?) (?:xq<(that)> )?cn<([wc]ould)> (?:cn<(not)> )?([^,|\.]+)\.?$"
 )
 
 # as-though i.e. Rout
 # [effect] as-though [cond]
 # we treat the as-though clause as a conditional
-re_cond_as_though = re.compile(r"^([^,|\.]+) pr<as_though> ([^,|\.]+)\.?$")
+re_cond_as_though = lazyre.compile(r"^([^,|\.]+) pr<as_though> ([^,|\.]+)\.?$")
 
 ## RESTRICTION PHRASES
 
 # but condition restrictions i.e. Haakon
 # [action],? but [condition-word] [restriction]
-re_rstr_but = re.compile(r"^(.+?),? but cn<(\w+)> ([^,|\.]+)\.?$")
+re_rstr_but = lazyre.compile(r"^(.+?),? but cn<(\w+)> ([^,|\.]+)\.?$")
 
 # can/do not
 # two forms
 #  1. [thing] can/do not [action] unless [condition] i.e. Howlpack Wolf
 # these are a restriction with a condition
 #  2. [thing] that would [action] can/do not [action] i.e. Questing Beast
-re_rstr_cando_check = re.compile(r"xa<(?:can|do)> cn<not>")
-re_rstr_cando_unless = re.compile(
+re_rstr_cando_check = lazyre.compile(r"xa<(?:can|do)> cn<not>")
+re_rstr_cando_unless = lazyre.compile(
     r"^([^,|^\.]+) xa<(can|do)> cn<not> ([kx]a<[^>]+>.*) cn<unless> ([^,|\.]+)\.?$"
 )
-re_rstr_would_cando = re.compile(
+re_rstr_would_cando = lazyre.compile(
     r"^([^,|^\.]+) xq<that> cn<would> ([^,|\.]+) xa<(can|do)> cn<not> ([^,|\.]+)\.?$"
 )
 
@@ -1172,14 +1172,14 @@ re_rstr_would_cando = re.compile(
 # TODO: Capricopian is an exception to the pattern and is of the form
 #  only [player] may [action] and only during [timing]
 # I think only ands are present but just case check for 'or' and 'and/or'
-re_conjoined_rstr_only = re.compile(
+re_conjoined_rstr_only = lazyre.compile(
     r"^([^,|\.]+) (cn<(?:only|only_if)> [^,|^\.]+) (and|or|and/or) "
      r"(cn<(?:only|only_if)> [^,|^\.]+)\.?"
 )
 
 # may-only see Mystic Barrier has the form
 # [thing] may [action] only [restriction]
-re_rstr_may_only = re.compile(
+re_rstr_may_only = lazyre.compile(
     r"^([^,|\.]+) cn<may> ([^,|\.]+) cn<only> ([^,|\.]+)\.?$"
 )
 
@@ -1188,18 +1188,18 @@ re_rstr_may_only = re.compile(
 # [action] only any time [timing]
 #  see Dimir Guildmage, see Teferi Mage of Zhalfir for a restriction on opponents
 # NOTE: the timing clause contains a 'could' which will be graphed as a conditional
-re_rstr_anytime = re.compile(
+re_rstr_anytime = lazyre.compile(
     r"^(?:([^,|\.]+) )?cn<only> xq<any> sq<time> ([^,|\.]+)\.?$"
 )
 
 # [action] only during [phase/step] i.e. Aven Auger
-re_rstr_phase = re.compile(
+re_rstr_phase = lazyre.compile(
     r"^(?:([^,|\.]+) )?cn<only> (sq<[^>]+> [^,|\.]*ts<[^>]+>)\.?$"
 )
 
 # [action] only [number] times [phase/step]? i.e. Phyrexian Battleflies
 # Variant does not have a phase/step i.e. Stalking Leonin
-re_rstr_number = re.compile(
+re_rstr_number = lazyre.compile(
     "^(?:([^,|\.]+) )?cn<only> nu<([^>]+)> sq<time(?:[^>]+)?>"
      "(?: ((?:[^,|\.]+ )?ts<[^>]+>))?\.?$"
 )
@@ -1208,48 +1208,48 @@ re_rstr_number = re.compile(
 #  additional phrases, clauses etc
 #  [action] only [condition]
 #  NOTE: as in Temple Elder, we do not want to break on commas
-re_rstr_only = re.compile(r"^([^\.]+) cn<only> ([^\.]+)\.?$")
+re_rstr_only = lazyre.compile(r"^([^\.]+) cn<only> ([^\.]+)\.?$")
 
 # condition restrictions only_if i.e. Tainted Isle
 #  [action] only_if [condition]
-re_rstr_only_if = re.compile(r"^(?:([^,|\.]+) )?cn<only_if> ([^,|\.]+)\.?$")
+re_rstr_only_if = lazyre.compile(r"^(?:([^,|\.]+) )?cn<only_if> ([^,|\.]+)\.?$")
 
 # Exception: contains except - the opposite of a restriction, it provides
 # additional abilities, characteristics or exclusions from an action
 # Two variations
 #  [action], except [exception] i.e. Lazav, the Multifarious
 #  [action], except for [exception] i.e. Season of the Witch
-re_excp_check = re.compile(r"cn<except>")
-re_excp_exception_phrase = re.compile(r"(.+?), cn<except> ([^\.]+)\.?$")
-re_excp_exclusion_phrase = re.compile(r"(?:([^,|^\.]+),? )?cn<except> pr<for> ([^\.]+)\.?$")
+re_excp_check = lazyre.compile(r"cn<except>")
+re_excp_exception_phrase = lazyre.compile(r"(.+?), cn<except> ([^\.]+)\.?$")
+re_excp_exclusion_phrase = lazyre.compile(r"(?:([^,|^\.]+),? )?cn<except> pr<for> ([^\.]+)\.?$")
 
 ####
 ## CLAUSES
 ####
 
 # a 'when' clause i.e. 'before', 'after', 'during', 'until' condition
-re_seq_when_clause = re.compile(r"^sq<(before|after|during|until)> ([^,|^\.]+)\.?$")
+re_seq_when_clause = lazyre.compile(r"^sq<(before|after|during|until)> ([^,|^\.]+)\.?$")
 
 # turn structure - similar to graphing of things
 # [player's]? [turn-structure]
 #  i.e eot, target player's turn, your turn
-re_ts_check = re.compile(r"ts<[^>]+>$") # ends with a turn structure
+re_ts_check = lazyre.compile(r"ts<[^>]+>$") # ends with a turn structure
 
 # each-of (only 3 at time of IKO) Ertai's Meddling, Carpet of Flowers, Storm Cauldron
 # has the form: each of [phase]
 # NOTE: considered combining 'each of' as a single quantifier ("xq<each-of>") but
 #  the each applies to turns not to the player
-re_ts_each_of = re.compile(r"^(xq<each> pr<of>) ([^,|^\.]*ts<[^>]+>)\.?$")
+re_ts_each_of = lazyre.compile(r"^(xq<each> pr<of>) ([^,|^\.]*ts<[^>]+>)\.?$")
 
 # complex turn structure two variations:
 # 1. have the form i.e. Forcefield [quantifier] time [phase]
 #  NOTE: this phrasing is generated by the grapher in higher level graphing and
 #   does not exist as is in the oracle text
-re_ts_complex = re.compile(r"^xq<([^>]+)> sq<time> xq<([^>]+)> (ts<[^>]+>)$")
+re_ts_complex = lazyre.compile(r"^xq<([^>]+)> sq<time> xq<([^>]+)> (ts<[^>]+>)$")
 
 # terminal phases i.e. beginning of phase or end of phase i.e. Contamination
 # the? [beginning|end] of [phase]
-re_ts_terminal_phase = re.compile(
+re_ts_terminal_phase = lazyre.compile(
     r"^(?:(xq<this> ts<turn suffix='s>) xq<next> )?(?:xq<the> )?"
      r"sq<(beginning|end)> pr<of> ([^,|^\.]*ts<[^>]+>)$"
 )
@@ -1260,18 +1260,18 @@ re_ts_terminal_phase = re.compile(
 #  Eater of Days has a quanitifier and number
 # NOTE: assuming player is basic - at most a quanitifier or status and then a
 #  possessive player
-re_ts_basic = re.compile(
+re_ts_basic = lazyre.compile(
     r"^(?:((?:(?:xq|xs|xo)<[^>]+> )?xp<[^>]+>) )?"
      r"(?:xq<([^>]+)> )?(?:nu<([^>]+)> )?(ts<[^>]+>)$"
 )
 
 # possessive consecutive phases have the form
 # [quantifier] turns [step] i.e. Scarab of the Unseen
-re_ts_step = re.compile(r"^(xq<[^>]+> ts<turn suffix='s>) (ts<[^>]+>)$")
+re_ts_step = lazyre.compile(r"^(xq<[^>]+> ts<turn suffix='s>) (ts<[^>]+>)$")
 
 # player's step has the form
 # [step] on [player's] [phase] i.e. Battering Ram
-re_ts_player_step = re.compile(
+re_ts_player_step = lazyre.compile(
     r"^((?:xq<[^>]+> )?ts<[^>]+>) pr<on> ([^,|^\.]*xp<[^>]+>) ([^,|^\.]*ts<[^>]+>)$"
 )
 
@@ -1285,14 +1285,14 @@ re_ts_player_step = re.compile(
 #  2. [time] [phase]
 #  3. [thing]? [phase/step] i.e Apathy
 #   NOTE: have to make sure that a Thing is present in the first match
-re_phase_clause_check = re.compile(r"ts<([^>]+)>$")
-re_num_times_phase = re.compile(
+re_phase_clause_check = lazyre.compile(r"ts<([^>]+)>$")
+re_num_times_phase = lazyre.compile(
     r"^nu<([^>]+)> sq<(time[^>]*)> (?:xq<([^>]+)> )?ts<([^>]+)>$"
 )
-re_time_phase_clause = re.compile(
+re_time_phase_clause = lazyre.compile(
     r"^xq<([^>]+)> sq<([^>]+)> (?:xq<([^>]+)> )?ts<([^>]+)>$"
 )
-re_thing_phase_clause = re.compile(
+re_thing_phase_clause = lazyre.compile(
     r"(?:(.*?(?:ob|xp|xo|zn|ef)<[^>]+>.*?) )?(?:xq<([^>]+)> )?ts<([^>]+)>$"
 )
 
@@ -1303,7 +1303,7 @@ re_thing_phase_clause = re.compile(
 # find phrases of the form: i.e. Wintermoor Commander
 #  [quanitifier]? [status]? [thing's] [attribute]
 # in this case, the attribute is the 'subject' or the thing
-re_reified_attribute = re.compile(
+re_reified_attribute = lazyre.compile(
     r"^(?:(xq<[^>]+>) )?(?:(xs<[^>]+>) )?"
      r"((?:xo|ob)<[^>]+ (?:[^>]*suffix=(?:'s)[^>]*)>) xr<([^>]+)>\.?$"
 )
@@ -1314,7 +1314,7 @@ re_reified_attribute = re.compile(
 #  quantifier should always be the
 #  thing will always be card
 # quanitifier may be after the number see Scarab Feast
-re_qtz = re.compile(
+re_qtz = lazyre.compile(
     r"^xq<([^>]+)> (?:pr<(\w+)> )?(?:nu<([^>]+)> )?"
      r"(ob<[^>]+>) pr<(\w+)> ([^,|^\.]+zn<[^>]+>)(?: xm<face amplifier=(up|down)>)?$"
 )
@@ -1332,7 +1332,7 @@ re_qtz = re.compile(
 # NOTE: if possession-clause and/or preposition-clause are present, the whole is
 #  returned & must further be parsed w/ re_possesson_clause, re_qualifying_clause
 #  or re_dual_qualifying_clause
-re_qst = re.compile(
+re_qst = lazyre.compile(
     r"^(?:nu<([^>]+)> )?(?:xq<([^>]+)> )?(?:(?:xs|st)<([^>]+)> )?"
     r"((?:[^\.]*?)?(?:ob|xp|xo|zn|ef)<[^>]+>)"
     r"(?: ((?:xq<[^>]+> )?(?:(?:st|xs)<[^>]+> )?"
@@ -1343,11 +1343,11 @@ re_qst = re.compile(
      r"xp<[^>]+> (?:xa<do[^>]*> cn<not> )?xc<[^>]+>))?"
     r"\.?$"
 )
-re_qst1 = re.compile(
+re_qst1 = lazyre.compile(
     r"^(?:nu<([^>]+)> )?(?:xq<([^>]+)> )?(?:(?:xs|st)<([^>]+)> )?"
     r"((?:[^\.]*?)?(?:ob|xp|xo|zn|ef)<[^>]+>)(?! (?:or|and|and/or))(?: ([^\.]+))?\.?$"
 )
-re_qst2 = re.compile(
+re_qst2 = lazyre.compile(
     r"^(?:nu<([^>]+)> )?"
     r"(?:xq<([^>]+)> )?"
     r"(?:(?:xs|st)<([^>]+)> )?"
@@ -1356,7 +1356,7 @@ re_qst2 = re.compile(
 )
 
 # handles 1 to 3 things # TODO: not strict enough
-re_thing_clause = re.compile(
+re_thing_clause = lazyre.compile(
     r"^(?:((?:nu<[^>]+> )?(?:xq<[^>]+> )?(?:(?:xs|st)<[^>]+> )?"
      r"(?:ob|xp|xo|zn|ef)<[^>]+>(?: [^\.]+?)?), )?"
     r"(?:((?:nu<[^>]+> )?(?:xq<[^>]+> )?(?:(?:xs|st)<[^>]+> )?"
@@ -1371,7 +1371,7 @@ re_thing_clause = re.compile(
 #   in the first thing(s)
 #  NOTE: in some cases we have three consecutive things (see Trial of Ambition)
 #   it's owner's hand so check for three with first being optional and ignored
-re_consecutive_things = re.compile(
+re_consecutive_things = lazyre.compile(
     r"^(?:xq<(\w+?)> )?(?:((?:ob|xp|xo|zn|ef)<[^>]+>) )?"
      r"((?:ob|xp|xo|zn|ef)<[^>]+>) ((?:ob|xp|xo|zn|ef)<[^>]+>)$"
 )
@@ -1410,16 +1410,16 @@ re_consecutive_things = re.compile(
 #  2. objects i.e. Heartstone (have to check for preceding quantifiers, status)
 #  3. possesive i.e. Pilgrim of Virtue
 #  4. possessive i.e. Biomancer's Familiar
-re_qual_of_attribute = re.compile(
+re_qual_of_attribute = lazyre.compile(
     r"^xq<([^>]+)> (?:xr<([^>]+)>|xo<(life_total|life|mana_cost|mana|value)>)$"
 )
-re_qual_of_object = re.compile(
+re_qual_of_object = lazyre.compile(
     r"^^((?:xq<\w+> )?(?:(?:xs|st)<\w+> )?(?:ob|zn|xp|xo)<[^>]+>)$"
 )
-re_qual_of_possessive = re.compile(
+re_qual_of_possessive = lazyre.compile(
     r"^((?:xq<[^>]+> )?xp<\w+ suffix=(?:'s)> (?:(?:ob|zn|xp|xo)<[^>]+>))$"
 )
-re_qual_of_possessive2 = re.compile(
+re_qual_of_possessive2 = lazyre.compile(
     r"^((?:xq<[^>]+> )?ob<[^>]+> (?:.+? )?xp<[^>]+> xc<[^>]+>)$"
 )
 
@@ -1436,19 +1436,19 @@ re_qual_of_possessive2 = re.compile(
 
 # other_than - should be an object primarily self i.e. Wormfang Drake but could
 #  be other i.e. Haunting Echos
-re_qual_otherthan_thing = re.compile(r"^(ob<[^>]+>)$")
+re_qual_otherthan_thing = lazyre.compile(r"^(ob<[^>]+>)$")
 
 # attribute clauses - two forms (NOTE: we consider life-total in some cases to
 # be an attribute of a player
-re_attr_clause_check = re.compile(r"(xo<life_total>|xr<[^>]+>)")
+re_attr_clause_check = lazyre.compile(r"(xo<life_total>|xr<[^>]+>)")
 
 # [thing]'s [attribute] i.e. Okaun, Eye of Chaos
-re_things_attr = re.compile(
+re_things_attr = lazyre.compile(
     r"^(.*(?:ob|xp|xo)<[^>]+>) (?:(?:xr|xo)<([^>]+)> (and|or) )?(?:xr|xo)<([^>]+)>$"
 )
 
 # [attribute] of [thing] i.e. God-Eternal Rhonas
-re_attr_of_thing = re.compile(
+re_attr_of_thing = lazyre.compile(
     r"^(?:.*)?(?:(?:xr|xo)<([^>]+)> (and|or) )?((?:xr|xo)<[^>]+>) pr<of> ([^\.]+)\.?$"
 )
 
@@ -1457,14 +1457,14 @@ re_attr_of_thing = re.compile(
 ####
 
 # numbers
-re_number = re.compile(r"^nu<([^>]+)>$")
-re_number_vanilla = re.compile(r"^nu<([0-9xyz]+)>$")
+re_number = lazyre.compile(r"^nu<([^>]+)>$")
+re_number_vanilla = lazyre.compile(r"^nu<([0-9xyz]+)>$")
 
 # attach 701.3 attach [object] to [object] where the first object is self
-re_attach_clause = re.compile(r"^([^\.]+) pr<to> ([^\.]+)$")
+re_attach_clause = lazyre.compile(r"^([^\.]+) pr<to> ([^\.]+)$")
 
 # create 701.6 sometimes has a trailing clause named ...
-re_create_clause = re.compile(
+re_create_clause = lazyre.compile(
     r"^([^\.]+?)(?: xa<name suffix=ed> ob<token ref=(\w+)>)?\.?$"
 )
 
@@ -1472,22 +1472,22 @@ re_create_clause = re.compile(
 # attribute of a thing (to include life_total) is handled by re_attr_clause
 
 # the number of [counters] on [thing], see Primordial Hydra, Gilder Bairn
-re_double_ctr_clause = re.compile(
+re_double_ctr_clause = lazyre.compile(
     r"^xq<the> xo<number> pr<of> (xq<each>.*? )?(xo<ctr[^>]*>) pr<on> ([^,|^\.]+)$"
 )
 
 # mana - the [amount|value] of [mana-clause] see Unbound Flourishing
-re_double_mana_clause = re.compile(
+re_double_mana_clause = lazyre.compile(
     r"^xq<the> xo<(amount|value)> pr<of> ([^,|^\.]+)$"
 )
 
 # exchange 701.10
 # 1. exchange control of [thing] (and [thing])? i.e. Spawnbroker
 # 2. exchange life total [Thing]? life_total (with [Thing])? i.e. Magus of the Mirror
-re_exchange_ctrl_clause = re.compile(
+re_exchange_ctrl_clause = lazyre.compile(
     r"^xc<control> pr<of> ([^,|^\.]+?)(?: and ([^,|^\.]+))?$"
 )
-re_exchange_lt_clause = re.compile(
+re_exchange_lt_clause = lazyre.compile(
     r"^(?:(.*?) )?(?:xo<life_total(?: suffix=s)?>)(?: pr<with> (.+))?\.?$"
 )
 
@@ -1499,40 +1499,40 @@ re_exchange_lt_clause = re.compile(
 
 # search 701.18
 # has the form [zone] for [thing]
-re_search_clause = re.compile(r"^((?:[^\.]+ )?zn<[^>]+>) pr<for> ([^\.]+)\.?$")
+re_search_clause = lazyre.compile(r"^((?:[^\.]+ )?zn<[^>]+>) pr<for> ([^\.]+)\.?$")
 
 # tap 701.20
 # has the form [thing] (for thing)?
-re_tap_clause = re.compile(r"^(?:(.*?) ?)?(?:pr<for> ([^\.]+))?\.?$")
+re_tap_clause = lazyre.compile(r"^(?:(.*?) ?)?(?:pr<for> ([^\.]+))?\.?$")
 
 # clash 701.22 has the form with [player] (always an opponennt)
-re_clash_clause = re.compile(r"^pr<with> ([^\.]+)$")
+re_clash_clause = lazyre.compile(r"^pr<with> ([^\.]+)$")
 
 # vote 701.31 has three forms
 #  1. vote forki attribute (the votes are in the val attribute) i.e. Council Guardian
 #  2. vote for token1 or token2 (one or both of the tokens may have been inadverntly
 #   tagged. see Lieutenants of the Guard)
 #  3. vote for Thing i.e. Custodi Squire
-re_vote_attribute_clause = re.compile(r"^pr<for> xr<(\w+) val=([^>]+)>$")
-re_vote_tokens_clause = re.compile(r"^pr<for> (.+?) or (.+?)$")
-re_vote_thing_clause = re.compile(r"^pr<for> ([^\.]+)$")
+re_vote_attribute_clause = lazyre.compile(r"^pr<for> xr<(\w+) val=([^>]+)>$")
+re_vote_tokens_clause = lazyre.compile(r"^pr<for> (.+?) or (.+?)$")
+re_vote_thing_clause = lazyre.compile(r"^pr<for> ([^\.]+)$")
 
 # meld 701.36 has two forms
 #  1. meld them into [object] i.e. Midnight Scavengers
 #  2. melds with [object] i.e. Graf Rats
-re_meld_clause1 = re.compile(r"^xo<them> pr<into> (ob<[^>]+>)$")
-re_meld_clause2 = re.compile(r"^pr<with> (ob<[^>]+>)$")
+re_meld_clause1 = lazyre.compile(r"^xo<them> pr<into> (ob<[^>]+>)$")
+re_meld_clause2 = lazyre.compile(r"^pr<with> (ob<[^>]+>)$")
 
 # exert 701.38
 #  exert ob [as it attacks]?
-re_exert_clause = re.compile(r"^(.+?)(?: pr<as> ([^\.]+))?$")
+re_exert_clause = lazyre.compile(r"^(.+?)(?: pr<as> ([^\.]+))?$")
 
 # related to 'add' mana
 
 # same as chains but for mana (for add)
 # matches forms of {X} (and {X}{Y}), {X} or {Y} and {X}, {Y}, or {Z}
-re_mana_check = re.compile(r"{[^t|^e|^]+}$")
-re_mana_chain = re.compile(
+re_mana_check = lazyre.compile(r"{[^t|^e|^]+}$")
+re_mana_chain = lazyre.compile(
     r"^(?:(xq<[^>]+>) )?"
      r"(?:({[^t|^e|^]+}), )?(?:({[^t|^e|^}]+}),? (or|and/or) )?({[^t|^e|^]+}+)$"
 )
@@ -1541,14 +1541,14 @@ re_mana_chain = re.compile(
 # 1. [quanitifer]? [number] mana [qualifying info]
 # 2. [mana] [specifying-clause] - always for each
 # 3. an amount of [mana] [clause]
-re_nadditional_mana = re.compile(
+re_nadditional_mana = lazyre.compile(
     r"^(?:(xq<[^>]+>) )?nu<([^>]+)> xo<mana> (pr<(?:of|in)> [^,|\.]+)$"
 )
-re_mana_trailing = re.compile(r"^((?:xq<[^>]+> )?{[^t|^e|^]+}+) ([^\.]+)\.?$")
-re_amount_of_mana = re.compile(
+re_mana_trailing = lazyre.compile(r"^((?:xq<[^>]+> )?{[^t|^e|^]+}+) ([^\.]+)\.?$")
+re_amount_of_mana = lazyre.compile(
     r"^xq<a> xo<amount_of> ({[^t|^e|^]+}+) ([^\.]+)\.?$"
 )
-re_that_much_mana = re.compile(
+re_that_much_mana = lazyre.compile(
     # TODO: Grand Warlord Radha is very similar
     r"^xq<that> xl<much> ({[^t|^e|^]+}+)(?: ([^\.]+))?\.?$"
 )
@@ -1556,11 +1556,13 @@ re_that_much_mana = re.compile(
 # related to 'attack'
 
 # standalone qualifier
-re_qual_standalone = re.compile(r"^xl<([^>]+)>$")
+re_qual_standalone = lazyre.compile(r"^xl<([^>]+)>$")
 
 # object preceded by 'with' i.e. Gallia of the Endless Dance
-re_qual_with_object = re.compile(r"^pr<with> ([^,|^\.]+)$")
+re_qual_with_object = lazyre.compile(r"^pr<with> ([^,|^\.]+)$")
 
 ####
 ## TEST SPACE
 ####
+
+lazyre.register(__name__)
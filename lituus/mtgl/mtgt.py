@@ -19,8 +19,14 @@ __maintainer__ = 'Temporal Inept'
 __email__ = 'temporalinept@mail.com'
 __status__ = 'Development'
 
+import gc
+import sys
+import threading
+from array import array
+from types import MappingProxyType
+import regex as re
 import networkx as nx
-from networkx.classes.ordered import OrderedDiGraph as Tree
+from networkx import DiGraph as Tree # plain dicts keep insertion order
 import lituus as lts
 
 #### PRINT SYMBOLS
@@ -33,9 +39,22 @@ SYM_BRANCH     = '─'
 """ returns the node type based on given node-id"""
 def node_type(nid): return nid.split(':')[0]
 
+# version of the compact tree encoding (see MTGTree.encode)
+ENC_VERSION = 1
+
+# serializes decoding lazily loaded trees (see MTGTree.__getattr__ and
+# FrozenMTGTree.__getattr__)
+_lazy_lock_ = threading.RLock()
+
+# references to (rootless) nodes in tagged text i.e. nd<enclosed-quote num=0>
+# and the variable value of a variable (nu<x node-num=0>)
+re_nd_ref = re.compile(r"nd<([\w-]+) num=(\d+)>")
+re_node_num_ref = re.compile(r"node-num=(\d+)")
+
 class MTGTree:
     """
-     A ordered, rooted directed acyclic graph (DAG) via networkx's OrderedDiGraph
+     A ordered, rooted directed acyclic graph (DAG) via networkx's DiGraph
+     (whose plain dicts keep the insertion order of nodes and children).
      The ParseTree has one and only one root node identified as 'root' which has
      no attributes and 0 or more subnodes. Each subnode in the tree is identified
      by a one-up serial identifier of the form node-type:n and uses networkx's
@@ -58,7 +77,7 @@ class MTGTree:
         """
          Creates an empty null tree unless tree is definied
         :param cname: the name of the card (for printing purposees
-        :param tree: a networkx.OrderedDiGraph
+        :param tree: a networkx.DiGraph
         """
         self._name = cname
         if tree is None:
@@ -83,6 +102,88 @@ class MTGTree:
                             lts.ENODE,'Invalid node-id: {}'.format(node)
                         )
 
+    def __getstate__(self):
+        """ pickle the compact encoding (see encode) """
+        return self.encode()
+
+    def __setstate__(self,enc):
+        """ keeps the encoding, decoding it on first use (see __getattr__) """
+        try:
+            self._name = enc[1]
+        except (TypeError,IndexError,KeyError): # KeyError: a legacy (dict) state
+            raise lts.LituusException(lts.ETREE,"Invalid tree encoding")
+        self._enc = enc
+
+    def __getattr__(self,attr):
+        """
+         decodes a lazily loaded tree when its graph is first accessed. Threads
+         first accessing the same tree wait on the one decoding it (the
+         encoding is dropped once the tree is set)
+        """
+        if attr not in ('_t','_ns'): raise AttributeError(attr)
+        d = self.__dict__
+        with _lazy_lock_:
+            if attr not in d:
+                if '_enc' not in d: raise AttributeError(attr)
+                self._decode_(d['_enc'])
+                del d['_enc']
+        return d[attr]
+
+    def encode(self):
+        """
+         encodes the tree compactly as a tuple (version 1):
+          (ENC_VERSION,name,node types,next serial of each node type,number of
+           roots,node type codes,node serials,child counts,attribute table,
+           attribute indexes)
+         where the nodes are in preorder from the root ('root' has code -1)
+         followed by any rootless subtrees. Identical (hashable) attribute sets
+         are stored once in the attribute table
+        :return: the encoded tree
+        """
+        types = list(self._ns)
+        ti = {k:i for i,k in enumerate(types)}
+        ns = [self._ns[k] for k in types]
+        codes,nums,nkids,ais = [],[],[],[]
+        attrs,ai = [],{}
+
+        succ = self._t._succ
+        roots = ['root'] + [
+            n for n in self._t._node if n != 'root' and not self._t._pred[n]
+        ]
+        for r in roots:
+            stack = [r]
+            while stack:
+                nid = stack.pop()
+                if nid == 'root': k,v = -1,0
+                else:
+                    k,v = nid.split(':')
+                    if k not in ti:
+                        ti[k] = len(types)
+                        types.append(k)
+                        ns.append(int(v)+1)
+                    k,v = ti[k],int(v)
+                codes.append(k)
+                nums.append(v)
+                nkids.append(len(succ[nid]))
+                items = tuple(self._t._node[nid].items())
+                try:
+                    i = ai.get(items)
+                    if i is None: i = ai[items] = len(attrs)
+                    else: items = None
+                except TypeError: # unhashable value, don't share
+                    i = len(attrs)
+                if items is not None: attrs.append(items)
+                ais.append(i)
+                stack.extend(reversed(succ[nid]))
+        return (
+            ENC_VERSION,self._name,tuple(types),tuple(ns),len(roots),
+            tuple(codes),tuple(nums),tuple(nkids),tuple(attrs),tuple(ais)
+        )
+
+    def freeze(self):
+        """ returns the read-only FrozenMTGTree of the tree """
+        return FrozenMTGTree(self.encode())
+
     def print(self,show_attr=False):
         """
          prints the tree with each branch indented 3 spaces from parent
@@ -110,7 +211,7 @@ class MTGTree:
 
         lbl = nid
         if show_attr:
-            ps = ["{}={}".format(k,v) for k,v in self._t.node[nid].items()]
+            ps = ["{}={}".format(k,v) for k,v in self.node(nid).items()]
             if ps: lbl = "{} ({})".format(nid," ".join(ps))
         print(lbl)
 
@@ -257,6 +358,91 @@ class MTGTree:
             raise lts.LituusException(lts.ENODE,"{} is not rootless".format(cid))
         self._t.add_edge(pid,cid)
 
+    def copy_subtree(self,src,sid,pid=None,root=True,ids=None,refs=True):
+        """
+         copies the subtree at node sid of tree src (which may be this tree) in
+         one preorder pass, giving the copied nodes new node-ids in this tree
+        :param src: the MTGTree to copy from
+        :param sid: the node-id of the subtree in src
+        :param pid: the node-id to copy the subtree under or None to copy it as
+         a rootless subtree
+        :param root: if not set, the children of sid are copied under pid but
+         not sid itself (i.e. to copy the root of a tree)
+        :param ids: dict to add the src node-id -> new node-id mapping to
+        :param refs: if set, rewrites node references (nd<...>, node-num=) in
+         the copied attributes that point to copied nodes
+        :return: dict src node-id -> new node-id of the copied nodes
+        """
+        if sid not in src._t._node:
+            raise lts.LituusException(lts.ENODE,"No such node {}".format(sid))
+        if pid is not None and pid not in self._t._node:
+            raise lts.LituusException(lts.ENODE,"No such node {}".format(pid))
+        if root and sid == 'root':
+            raise lts.LituusException(lts.ETREE,"Cannot copy the root as a node")
+        if not root and pid is None:
+            raise lts.LituusException(lts.ETREE,"Copying children requires a parent")
+        ids = {} if ids is None else ids
+
+        # walk the subtree first so that copying within a tree is not affected
+        # by the copies
+        succ = src._t._succ
+        ws = []
+        stack = [(sid,None)] if root else [(c,sid) for c in reversed(succ[sid])]
+        while stack:
+            n,p = stack.pop()
+            ws.append((n,p))
+            stack.extend((c,n) for c in reversed(succ[n]))
+
+        # & copy the nodes and edges
+        nd,nsucc,npred = self._t._node,self._t._succ,self._t._pred
+        snd = src._t._node
+        cids = {}
+        for n,p in ws:
+            nid = cids[n] = self._node_id_(node_type(n))
+            nd[nid] = dict(snd[n])
+            nsucc[nid] = {}
+            q = pid if p is None or p == sid and not root else cids[p]
+            if q is None: npred[nid] = {}
+            else:
+                nsucc[q][nid] = e = {}
+                npred[nid] = {q:e}
+        ids.update(cids)
+        if refs: self._remap_refs_(cids.values(),ids)
+        return cids
+
+    def graft(self,nid,pid):
+        """
+         attaches the rootless subtree at nid (i.e. from add_ur_node, detach or
+         copy_subtree) as the last child of node pid
+        :param nid: node-id of the rootless subtree
+        :param pid: the new parent's node-id
+        """
+        for x in (nid,pid):
+            if x not in self._t._node:
+                raise lts.LituusException(lts.ENODE,"No such node {}".format(x))
+        if nid == 'root' or self._t._pred[nid]:
+            raise lts.LituusException(lts.ENODE,"{} is not rootless".format(nid))
+        x = pid
+        while x is not None: # pid cannot be in the subtree
+            if x == nid:
+                raise lts.LituusException(
+                    lts.ETREE,"{} is in the subtree of {}".format(pid,nid)
+                )
+            x = next(iter(self._t._pred[x]),None)
+        self._t.add_edge(pid,nid)
+
+    def detach(self,nid):
+        """
+         detaches the subtree at nid from its parent leaving it rootless
+        :param nid: the node-id
+        :return: the node-id of the former parent (None if already rootless)
+        """
+        if nid == 'root':
+            raise lts.LituusException(lts.ETREE,"Cannot detach the root")
+        pid = self.parent(nid)
+        if pid is not None: self._t.remove_edge(pid,nid)
+        return pid
+
     """ removes node nid, edges into nid and the subtree at node nid """
     def del_node(self,nid): self._t.remove_nodes_from(self.descendants(nid) + [nid])
 
@@ -304,6 +490,69 @@ class MTGTree:
 
 #### PRIVATE FCTS ####
 
+    def _remap_refs_(self,nids,ids):
+        """
+         rewrites the node references in the string attributes of nodes nids
+         using the node-id mapping ids
+        :param nids: the node-ids to rewrite
+        :param ids: dict old node-id -> new node-id
+        """
+        def nd(m):
+            nid = ids.get("{}:{}".format(m.group(1),m.group(2)))
+            return "nd<{} num={}>".format(*nid.split(':')) if nid else m.group()
+        def num(m):
+            nid = ids.get("variable-value:{}".format(m.group(1)))
+            return "node-num={}".format(nid.split(':')[1]) if nid else m.group()
+
+        for nid in nids:
+            attrs = self._t._node[nid]
+            for k,v in attrs.items():
+                if not isinstance(v,str): continue
+                if 'nd<' in v: v = re_nd_ref.sub(nd,v)
+                if 'node-num=' in v: v = re_node_num_ref.sub(num,v)
+                attrs[k] = v
+
+    def _decode_(self,enc):
+        """
+         sets the tree to the encoded tree enc (see encode) filling the
+         networkx graph's node & adjacency dicts directly (w/o add_node/add_edge)
+        :param enc: the encoded tree
+        """
+        try:
+            ver,name,types,ns,_,codes,nums,nkids,attrs,ais = enc
+        except (TypeError,ValueError):
+            raise lts.LituusException(lts.ETREE,"Invalid tree encoding")
+        if ver != ENC_VERSION:
+            raise lts.LituusException(
+                lts.ETREE,"Unsupported tree encoding version {}".format(ver)
+            )
+        # one pass over the nodes in preorder, linking each node to the open
+        # parent on top of the stack
+        tns = [k + ':' for k in types]
+        ads = [dict(a) for a in attrs]
+        node,succ,pred = {},{},{}
+        ps = [] # [successors,node-id,children left to add] of the open parents
+        for k,v,n,a in zip(codes,nums,nkids,ais):
+            nid = 'root' if k < 0 else tns[k] + str(v)
+            node[nid] = ads[a].copy()
+            succ[nid] = s = {}
+            if ps:
+                p = ps[-1]
+                p[0][nid] = e = {}
+                pred[nid] = {p[1]:e}
+                p[2] -= 1
+                if not p[2]: ps.pop()
+            else: pred[nid] = {}
+            if n: ps.append([s,nid,n])
+
+        t = Tree()
+        t._node = node
+        t._succ = t._adj = succ
+        t._pred = pred
+        self._name = name
+        self._ns = dict(zip(types,ns))
+        self._t = t
+
     def _node_id_(self,ntype):
         """
          returns the next one-up serial number of node type ntype
@@ -318,9 +567,352 @@ class MTGTree:
             self._ns[ntype] = 1
         return nid
 
-def fuse_tree(a,b):
+class FrozenMTGTree:
+    """
+     A read-only MTGTree (see MTGTree.freeze) for querying graphed trees. The
+     nodes are numbered in preorder (the root's tree followed by any rootless
+     subtrees) and each node stores the preorder number of its last descendant,
+     its postorder number and its depth so that ancestry, subtree membership,
+     depth and descendant ranges are O(1) w/o searching the graph. Node-ids and
+     node types are interned and identical attribute sets (of hashable values)
+     are shared by all frozen trees as read-only mappings. Functions that modify
+     the tree raise a LituusException (ETREE), thaw the tree to modify it. Cards
+     (see mtgcard.MTGCard) store their trees frozen
+    """
+    __slots__ = (
+        '_name','_ns','_ids','_idx','_par','_end','_post','_dep','_attrs','_enc'
+    )
+
+    def __init__(self,enc):
+        """
+         creates the frozen tree from the encoded tree enc
+        :param enc: the encoded tree (see MTGTree.encode)
+        """
+        self._build_(enc)
+
+    def __getstate__(self):
+        """ pickle the compact encoding (see encode) """
+        try:
+            return self._enc # not built yet
+        except AttributeError:
+            return self.encode()
+
+    def __setstate__(self,enc):
+        """
+         keeps the encoding, building the tree (re-sharing the string & attribute
+         tables) on first use (see __getattr__)
+        """
+        if not isinstance(enc,(tuple,list)) or not enc or enc[0] != ENC_VERSION:
+            raise lts.LituusException(lts.ETREE,"Invalid tree encoding")
+        self._enc = enc
+
+    def __getattr__(self,attr):
+        """
+         builds a lazily loaded tree when it is first queried. Threads first
+         querying the same tree wait on the one building it (the encoding is
+         dropped once the slots are filled)
+        """
+        if attr == '_enc' or attr not in FrozenMTGTree.__slots__:
+            raise AttributeError(attr)
+        with _lazy_lock_:
+            try:
+                return object.__getattribute__(self,attr) # built while waiting
+            except AttributeError:
+                pass
+            try:
+                enc = self._enc
+            except AttributeError:
+                raise AttributeError(attr)
+            self._build_(enc)
+            del self._enc
+        return object.__getattribute__(self,attr)
+
+    def __len__(self): return len(self._ids)
+
+    @property # return the root node-id
+    def root(self): return 'root'
+
+    @property # return a networkx tree of the (thawed) tree
+    def tree(self): return self.thaw().tree
+
+    def thaw(self):
+        """ returns a modifiable MTGTree of the tree """
+        return decode(self.encode())
+
+    def encode(self):
+        """ returns the encoded tree (see MTGTree.encode) """
+        types,ti = [],{}
+        codes,nums,nkids = [],[],[0]*len(self._ids)
+        attrs,ai,ais = [],{},[]
+        for i,nid in enumerate(self._ids):
+            if nid == 'root': k,v = -1,0
+            else:
+                k,v = nid.split(':')
+                if k not in ti:
+                    ti[k] = len(types)
+                    types.append(k)
+                k,v = ti[k],int(v)
+            codes.append(k)
+            nums.append(v)
+            if self._par[i] >= 0: nkids[self._par[i]] += 1
+            a = self._attrs[i]
+            if id(a) not in ai:
+                ai[id(a)] = len(attrs)
+                attrs.append(tuple(a.items()))
+            ais.append(ai[id(a)])
+        for k in self._ns:
+            if k not in ti: types.append(k)
+        return (
+            ENC_VERSION,self._name,tuple(types),tuple(self._ns.get(k,0) for k in types),
+            sum(1 for p in self._par if p < 0),tuple(codes),tuple(nums),
+            tuple(nkids),tuple(attrs),tuple(ais)
+        )
+
+    def print(self,show_attr=False):
+        """
+         prints the tree with each branch indented 3 spaces from parent
+        :param show_attr: if set, shows the attributes of the nodes
+        """
+        print('<{}>'.format(self._name))
+        for cid in self.children('root'): self._print_node_(cid," ",show_attr)
+
+    _print_node_ = MTGTree._print_node_
+
+    """ returns whether tree has node with id nid """
+    def has_node(self,nid): return nid in self._idx
+
+    """ returns whether node has attribute """
+    def has_attr(self,nid,attr): return attr in self.node(nid)
+
+    """ returns the (read-only) data dict of the node with id nid """
+    def node(self,nid): return self._attrs[self._i_(nid)]
+
+    """ returns a list of all node ids in depth-first order """
+    def nodes(self): return list(self._ids[:self._end[0]+1])
+
+    """ returns the value of the attribute attr of the node with id nid"""
+    def attr(self,nid,attr):
+        try:
+            return self.node(nid)[attr]
+        except KeyError:
+            raise lts.LituusException(
+                lts.ENODE,"{} has attribute {}".format(nid,attr)
+            )
+
+    """ returns whether the node with id nid is a leaf """
+    def is_leaf(self,nid):
+        i = self._i_(nid)
+        return self._end[i] == i
+
+    """ returns the parent id of the node with id nid """
+    def parent(self,nid):
+        p = self._par[self._i_(nid)]
+        return self._ids[p] if p >= 0 else None
+
+    """ returns a list of ancestors of node nid from the parent to the root """
+    def ancestors(self,nid):
+        ps,p = [],self._par[self._i_(nid)]
+        while p >= 0:
+            ps.append(self._ids[p])
+            p = self._par[p]
+        return ps
+
+    """ returns a list of all descendants of node nid in preorder """
+    def descendants(self,nid):
+        i = self._i_(nid)
+        return list(self._ids[i+1:self._end[i]+1])
+
+    """ returns the children of the node with id nid """
+    def children(self,nid):
+        i = self._i_(nid)
+        cs,j,end = [],i+1,self._end[i]
+        while j <= end:
+            cs.append(self._ids[j])
+            j = self._end[j] + 1
+        return cs
+
+    """ returns the siblings of the node with id nid """
+    def siblings(self,nid):
+        p = self.parent(nid)
+        return [c for c in self.children(p) if c != nid] if p else []
+
+    """ returns the immediate 'left' sibling """
+    def left_sibling(self,nid):
+        i = self._i_(nid)
+        p = self._par[i]
+        if p < 0 or p == i-1: return None
+        j = p + 1
+        while self._end[j] + 1 != i: j = self._end[j] + 1
+        return self._ids[j]
+
+    """ returns the immediate 'right' sibling """
+    def right_sibling(self,nid):
+        i = self._i_(nid)
+        p = self._par[i]
+        j = self._end[i] + 1
+        return self._ids[j] if p >= 0 and j <= self._end[p] else None
+
+    """ returns whether node a is a (proper) ancestor of node d """
+    def is_ancestor(self,a,d):
+        i,j = self._i_(a),self._i_(d)
+        return i < j <= self._end[i]
+
+    """ returns whether node nid is in the subtree at node sid """
+    def in_subtree(self,nid,sid):
+        i,j = self._i_(sid),self._i_(nid)
+        return i <= j <= self._end[i]
+
+    """ returns the depth of node nid (the root and rootless nodes are 0) """
+    def depth(self,nid): return self._dep[self._i_(nid)]
+
+    """ returns the preorder number of node nid """
+    def preorder(self,nid): return self._i_(nid)
+
+    """ returns the postorder number of node nid """
+    def postorder(self,nid): return self._post[self._i_(nid)]
+
+    """ returns the preorder numbers (first,last) of the descendants of nid """
+    def descendant_range(self,nid):
+        i = self._i_(nid)
+        return i+1,self._end[i]
+
+    def findall(self,ntype,source='root',attr=None,val=None):
+        """
+         finds all nodes in the tree of the type ntype starting at source with
+         attribute attr (if set) having value val (if set)
+        :param ntype: node type to find
+        :param source: the source to start the search from
+        :param attr: the attribute key the node will have
+        :param val: the val that the given attribute key will have
+        :return: a list of node ids
+        """
+        if val and not attr: raise lts.LituusException(lts.ETREE,"attr required with val")
+        i = self._i_(source)
+        pre = ntype + ':'
+        found = []
+        for j in range(i+1,self._end[i]+1):
+            nid = self._ids[j]
+            if not nid.startswith(pre): continue
+            if attr:
+                if attr not in self._attrs[j]: continue
+                if val and self._attrs[j][attr] != val: continue
+            found.append(nid)
+        return found
+
+    def add_node(self,*args,**kwargs): _frozen_()
+    def add_ur_node(self,*args,**kwargs): _frozen_()
+    def add_edge(self,*args): _frozen_()
+    def add_attr(self,*args): _frozen_()
+    def del_node(self,*args): _frozen_()
+    def copy_subtree(self,*args,**kwargs): _frozen_()
+    def graft(self,*args): _frozen_()
+    def detach(self,*args): _frozen_()
+
+#### PRIVATE FCTS ####
+
+    def _i_(self,nid):
+        """ returns the preorder number of node nid """
+        try:
+            return self._idx[nid]
+        except KeyError:
+            raise lts.LituusException(lts.ENODE,"No such node {}".format(nid))
+
+    def _build_(self,enc):
+        """
+         builds the frozen tree from the encoded tree enc
+        :param enc: the encoded tree (see MTGTree.encode)
+        """
+        try:
+            ver,name,types,ns,_,codes,nums,nkids,attrs,ais = enc
+        except (TypeError,ValueError):
+            raise lts.LituusException(lts.ETREE,"Invalid tree encoding")
+        if ver != ENC_VERSION:
+            raise lts.LituusException(
+                lts.ETREE,"Unsupported tree encoding version {}".format(ver)
+            )
+        n = len(codes)
+        ids = tuple(
+            sys.intern('root' if k < 0 else types[k] + ':' + str(v))
+            for k,v in zip(codes,nums)
+        )
+
+        # parents & depths from the child counts
+        par,dep = array('l',[-1]*n),array('l',[0]*n)
+        ps = [] # [index,children left] of the open parents
+        for i,c in enumerate(nkids):
+            if ps:
+                p = ps[-1]
+                par[i],dep[i] = p[0],dep[p[0]] + 1
+                p[1] -= 1
+                if not p[1]: ps.pop()
+            if c: ps.append([i,c])
+
+        # subtree sizes give the last descendant & the postorder number
+        size = [1]*n
+        for i in range(n-1,-1,-1):
+            if par[i] >= 0: size[par[i]] += size[i]
+        end = array('l',[i+size[i]-1 for i in range(n)])
+        post = array('l',[end[i]-dep[i] for i in range(n)])
+
+        # share the attribute sets
+        tbl = []
+        for a in attrs:
+            if not isinstance(a,tuple): a = tuple(tuple(kv) for kv in a) # i.e. json
+            try:
+                m = _shared_attrs_.get(a)
+                if m is None:
+                    m = _shared_attrs_[a] = MappingProxyType(
+                        {sys.intern(k):v for k,v in a}
+                    )
+            except TypeError: # unhashable value, don't share
+                m = MappingProxyType(dict(a))
+            tbl.append(m)
+
+        self._name = name
+        self._ns = {sys.intern(k):v for k,v in zip(types,ns)}
+        self._ids = ids
+        self._idx = {nid:i for i,nid in enumerate(ids)}
+        self._par = par
+        self._end = end
+        self._post = post
+        self._dep = dep
+        self._attrs = tuple(tbl[a] for a in ais)
+
+# the attribute sets shared by all frozen trees
+_shared_attrs_ = {}
+
+def _frozen_():
+    raise lts.LituusException(lts.ETREE,"Tree is frozen")
+
+def decode(enc):
+    """
+     returns the MTGTree of the encoded tree enc (see MTGTree.encode)
+    :param enc: the encoded tree
+    :return: MTGTree
+    """
+    t = MTGTree.__new__(MTGTree)
+    t._decode_(enc)
+    return t
+
+def decode_many(encs):
+    """
+     returns the MTGTrees of the encoded trees encs (see decode) pausing the
+     cyclic garbage collector while decoding. The decoded dicts hold no cycles
+     but the collections triggered by allocating them traverse every tree
+     decoded so far and are the bulk of decoding thousands of trees
+    :param encs: iterable of encoded trees
+    :return: list of MTGTree
     """
-     fuses two networkx trees a and b under a single root. Meant for 'merging' two
+    on = gc.isenabled()
+    gc.disable()
+    try:
+        return [decode(enc) for enc in encs]
+    finally:
+        if on: gc.enable()
+
+def fuse_tree(a,b,cname=None):
+    """
+     fuses two MTGTrees a and b under a single root. Meant for 'merging' two
      trees from two sides of the same card.
       Let A be a subtree of a such that
        root
@@ -335,35 +927,19 @@ def fuse_tree(a,b):
           A
         card-half (side=b)
           B
-    :param a: netwokx tree a
+      The rootless subtrees of a and b (i.e. enclosed quotes) are copied as
+      rootless subtrees and the references to them are rewritten
+    :param a: MTGTree a
     :param b: MTGTree b
-    :return: a fused networkx tree
+    :param cname: name of the fused card (default is 'a // b')
+    :return: the fused MTGTree
     """
-    # initialize the MTGTrees
-    tree = MTGTree()
-    pid = tree.root
-
-    apid = tree.add_node(pid,'card-half',side='a')
-    _fuse_copy_(tree,apid,a,'root')
-    bpid = tree.add_node(pid,'card-half',side='b')
-    _fuse_copy_(tree,bpid,b,'root')
-
+    tree = MTGTree(cname if cname else "{} // {}".format(a._name,b._name))
+    for side,src in [('a',a),('b',b)]:
+        ids = {}
+        hid = tree.add_node('root','card-half',side=side)
+        tree.copy_subtree(src,'root',hid,root=False,ids=ids,refs=False)
+        for nid in [n for n in src._t._node if n != 'root' and not src._t._pred[n]]:
+            tree.copy_subtree(src,nid,ids=ids,refs=False)
+        tree._remap_refs_(ids.values(),ids)
     return tree
-
-def _fuse_copy_(nt,nid,ot,oid):
-    """
-     recursive walk and copy of old tree at node-id oid to new tree nt at
-     node-id nid
-    :param nt: the MTGTree object new tree
-    :param nid: current node-id in nt
-    :param ot: the MTGTree object old tree
-    :param oid: current node-id in ot
-    """
-    # NOTE that oid itself is not copied. This is done intentionally so that
-    # root node (in the first call to _fuse_copy_) is not copied
-    if not ot.is_leaf(oid):
-        for cid in ot.children(oid): # BFS
-            lbl = cid.split(':')[0]
-            cid1 = nt.add_node(nid,lbl)
-            for k,v in ot.node(cid).items(): nt.add_attr(cid1,k,v)
-            _fuse_copy_(nt,cid1,ot,cid)
\ No newline at end of file
@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+""" tagcheck.py
+Copyright (C) 2019  Temporal Inept (temporalinept@mail.com)
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+Differential checks of optimized tagger stages against their reference
+implementations, of batched tagging (tag_many) and of threads sharing a
+TaggerContext against per card tagging (tag) over the multiverse
+(AllCards.json). Run as
+ python -m lituus.mtgl.tagcheck [path to AllCards.json]
+or
+ python -m lituus.mtgl.tagcheck fuzz [n]
+to check the single scan first pass (vocab) against the sequential first pass
+over n random phrases of word list terms, numbers, p/t and counters (does not
+need AllCards.json)
+"""
+
+#__name__ = 'tagcheck'
+__license__ = 'GPLv3'
+__version__ = '0.0.1'
+__date__ = 'August 2020'
+__author__ = 'Temporal Inept'
+__maintainer__ = 'Temporal Inept'
+__email__ = 'temporalinept@mail.com'
+__status__ = 'Development'
+
+import sys
+import json
+import time
+import random
+from hashlib import md5
+import lituus as lts
+import lituus.mtgl.tagger as tagger
+
+# stage -> (input fct, reference fct, optimized fct) where input fct prepares
+# the oracle text for the stage
+checks = {
+    'first-pass':(lambda txt: txt,tagger.first_pass_lb,tagger.first_pass_mt),
+    'vocab':(lambda txt: txt,tagger.first_pass_mt,tagger.first_pass),
+}
+
+def oracles(f=None):
+    """
+     returns the oracle text of each legal card in AllCards.json and the
+     tagger context of the legal cards
+    :param f: path to AllCards.json (defaults to the one in resources)
+    :return: tuple t = (dict name -> oracle text,tagger.TaggerContext)
+    """
+    import lituus.multiverse as multiverse
+    fin = None
+    try:
+        fin = open(f if f else multiverse.jpath,'r')
+        mverse = multiverse._hack_cards_(json.load(fin))
+        fin.close()
+    except IOError:
+        raise lts.LituusException(lts.EIOIN,"Error reading AllCards.json")
+    finally:
+        if fin: fin.close()
+
+    n2r = {}
+    for cname in mverse:
+        try:
+            if mverse[cname]['legalities']['commander'] != 'Legal': continue
+            n2r[cname] = md5(cname.encode()).hexdigest()
+        except KeyError:
+            continue
+    return (
+        {cname:mverse[cname].get('text',"") for cname in n2r},
+        tagger.TaggerContext(n2r)
+    )
+
+def diff(txts,ref,opt):
+    """
+     runs the reference and optimized functions over txts
+    :param txts: dict name -> input text
+    :param ref: reference function
+    :param opt: optimized function
+    :return: tuple t = (mismatches,ref time,opt time) where mismatches is a list
+     of tuples (name,reference output,optimized output)
+    """
+    rs,ps = {},{}
+    start = time.perf_counter()
+    for cname in txts: rs[cname] = ref(txts[cname])
+    rt = time.perf_counter() - start
+    start = time.perf_counter()
+    for cname in txts: ps[cname] = opt(txts[cname])
+    ot = time.perf_counter() - start
+    return [(c,rs[c],ps[c]) for c in txts if rs[c] != ps[c]],rt,ot
+
+def diff_batch(txts,ctx,n=256):
+    """
+     tags txts per card (tag) and in batches (tag_many)
+    :param txts: dict name -> oracle text
+    :param ctx: the tagger.TaggerContext
+    :param n: cards per batch
+    :return: tuple t = (mismatches,tag time,tag_many time) (see diff)
+    """
+    rs,fails = {},set()
+    start = time.perf_counter()
+    for cname in txts:
+        try:
+            rs[cname] = tagger.tag(cname,txts[cname],ctx)
+        except lts.LituusException as e:
+            rs[cname] = str(e)
+            fails.add(cname)
+    rt = time.perf_counter() - start
+    start = time.perf_counter()
+    try:
+        ps = tagger.tag_many(txts,n,ctx=ctx)
+    except lts.LituusException: # a card failing per card fails the batch
+        ps = tagger.tag_many(
+            {c:txts[c] for c in txts if c not in fails},n,ctx=ctx
+        )
+    ot = time.perf_counter() - start
+    return [(c,rs[c],ps[c]) for c in ps if rs[c] != ps[c]],rt,ot
+
+def diff_threads(txts,ctx,workers=4):
+    """
+     tags txts per card sequentially and by workers threads sharing ctx
+    :param txts: dict name -> oracle text
+    :param ctx: the tagger.TaggerContext
+    :param workers: number of threads
+    :return: tuple t = (mismatches,sequential time,threaded time) (see diff)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    cnames = list(txts)
+    start = time.perf_counter()
+    rs = [_tag_(c,txts[c],ctx) for c in cnames]
+    rt = time.perf_counter() - start
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        ps = list(pool.map(lambda c: _tag_(c,txts[c],ctx),cnames))
+    ot = time.perf_counter() - start
+    return [(c,r,p) for c,r,p in zip(cnames,rs,ps) if r != p],rt,ot
+
+# filler tokens of the fuzzed phrases & phrases that have failed before
+_fuzz_tkns_ = [
+    '1/1','0/1','2/2','+1/+1','-1/-1','x/x','counter','counters','a','two','x',
+    'base','power','and','toughness','it','on','with','until',',','.','\n'
+]
+fuzz_cases = [
+    'put a 1/1 counter on it',
+    'with base power and toughness 0/1 counters',
+    'until 2/2 counters',
+]
+
+def fuzz(n=8000,seed=0,k=8):
+    """
+     generates n random phrases (after the known failing cases) of up to k
+     tokens of the first pass word list terms and filler tokens
+    :param n: number of phrases
+    :param seed: random seed
+    :param k: maximum number of tokens per phrase
+    :return: dict name -> phrase
+    """
+    rnd = random.Random(seed)
+    tkns = tagger.first_pass_vocab().terms + _fuzz_tkns_*20
+    txts = {"case {}".format(i):txt for i,txt in enumerate(fuzz_cases)}
+    for i in range(n):
+        txts["fuzz {}".format(i)] = " ".join(
+            rnd.choice(tkns) for _ in range(rnd.randint(1,k))
+        ).replace(' ,',',').replace(' .','.')
+    return txts
+
+def main(argv):
+    """ runs each check, printing mismatches and timings """
+    if len(argv) > 1 and argv[1] == 'fuzz':
+        txts = fuzz(int(argv[2]) if len(argv) > 2 else 8000)
+        ms,rt,ot = diff(txts,tagger.first_pass_mt,tagger.first_pass)
+        print(
+            "vocab fuzz: {} phrases, {} mismatches, reference {:.2f}s, optimized {:.2f}s".format(
+                len(txts),len(ms),rt,ot
+            )
+        )
+        for cname,r,o in ms[:10]:
+            print(" {}\n  ref: {!r}\n  opt: {!r}".format(cname,r,o))
+        return 1 if ms else 0
+
+    txts,ctx = oracles(argv[1] if len(argv) > 1 else None)
+    ret = 0
+    for check,fct in [('batch',diff_batch),('threads',diff_threads)]:
+        ms,rt,ot = fct(txts,ctx)
+        print(
+            "{}: {} cards, {} mismatches, reference {:.2f}s, optimized {:.2f}s".format(
+                check,len(txts),len(ms),rt,ot
+            )
+        )
+        for cname,r,o in ms[:10]:
+            print(" {}\n  ref: {!r}\n  opt: {!r}".format(cname,r,o))
+        if ms: ret = 1
+
+    txts = {c:tagger.preprocess(c,txts[c],ctx) for c in txts}
+    for stage in checks:
+        prep,ref,opt = checks[stage]
+        ms,rt,ot = diff({c:prep(txts[c]) for c in txts},ref,opt)
+        print(
+            "{}: {} cards, {} mismatches, reference {:.2f}s, optimized {:.2f}s".format(
+                stage,len(txts),len(ms),rt,ot
+            )
+        )
+        for cname,r,o in ms[:10]:
+            print(" {}\n  ref: {!r}\n  opt: {!r}".format(cname,r,o))
+        if ms: ret = 1
+    return ret
+
+####
+# PRIVATE FCTS
+####
+
+def _tag_(cname,txt,ctx):
+    """ tags txt returning the tagged text or the error """
+    try:
+        return tagger.tag(cname,txt,ctx)
+    except lts.LituusException as e:
+        return str(e)
+
+if __name__ == '__main__': sys.exit(main(sys.argv))
@@ -19,26 +19,67 @@ __maintainer__ = 'Temporal Inept'
 __email__ = 'temporalinept@mail.com'
 __status__ = 'Development'
 
+import threading
 import regex as re
 import lituus as lts
 import lituus.mtgl.mtgl as mtgl
+import lituus.mtgl.lazyre as lazyre
 import lituus.mtgl.lexer as lexer
 import lituus.mtgl.mtgltag as mtgltag
-
-def tag(name,txt):
+import lituus.mtgl.vocab as vocab
+
+class TaggerContext(object):
+    """
+     the name to ref-id index of the multiverse and the pattern matching
+     references to other cards. Tagging does not modify the context, a context
+     can be shared by threads and pickled to processes (the pattern is compiled
+     on first use in each process)
+    """
+    def __init__(self,n2r):
+        """
+        :param n2r: dict card name -> ref-id
+        """
+        self._n2r = dict(n2r)
+        self._re_ref = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self): return {'n2r':self._n2r}
+    def __setstate__(self,state): self.__init__(state['n2r'])
+
+    @property
+    def n2r(self): return self._n2r
+
+    @property
+    def re_ref(self):
+        """ the pattern matching references to other cards (see tag_ref) """
+        # only names preceded by 'named', 'Partner with' or 'Melds with' are
+        # references, avoiding cards like Sacrifice (an action and a card name)
+        if self._re_ref is None:
+            with self._lock:
+                if self._re_ref is None:
+                    self._re_ref = re.compile(
+                        r"(named|Partner with|Melds with) ({})\b".format(
+                            '|'.join(list(self._n2r.keys()))
+                        )
+                    )
+        return self._re_ref
+
+def tag(name,txt,ctx=None):
     """
      tags the mtgl oracle
     :param name: name of card
     :param txt: the mtgl text
+    :param ctx: the TaggerContext (if None uses the one set by mtgl.set_n2r)
     :return: tagged mtgl text
     """
     try:
-        ntxt = preprocess(name,txt)
-        ntxt = first_pass(ntxt)
-        ntxt = midprocess(ntxt)
-        ntxt = second_pass(ntxt)
-        ntxt = postprocess(ntxt)
-        ntxt = third_pass(ntxt)
+        with lazyre.watching(name):
+            ntxt = preprocess(name,txt,ctx)
+            ntxt = first_pass(ntxt)
+            ntxt = midprocess(ntxt)
+            ntxt = second_pass(ntxt)
+            ntxt = postprocess(ntxt)
+            ntxt = third_pass(ntxt)
     except (lts.LituusException,re.error) as e:
         raise lts.LituusException(
             lts.ETAGGING,"Tagging {} failed due to {}".format(name,e)
@@ -49,11 +90,56 @@ def tag(name,txt):
         )
     return ntxt
 
+def tag_many(cards,n=256,progress=None,ctx=None,errs=None):
+    """
+     tags the oracle text of many cards. Preprocessing (card name references)
+     and the first pass are done per card. The remaining passes are run once
+     over batches of n cards joined by mtgl.CRD and split back. Where a batch
+     fails, its cards are tagged individually (reporting the failing card)
+    :param cards: dict card name -> mtgl text
+    :param n: number of cards per batch
+    :param progress: function of (cards tagged,total cards) called after each
+     batch
+    :param ctx: the TaggerContext (if None uses the one set by mtgl.set_n2r)
+    :param errs: if a dict, the error of each card failing to tag is added
+     (card name -> LituusException) and the card's tagged text is None
+     otherwise the error is raised
+    :return: dict card name -> tagged mtgl text
+    """
+    cnames = list(cards)
+    ttl = len(cnames)
+    tagged = {}
+    for i in range(0,ttl,n):
+        batch = cnames[i:i+n]
+        try:
+            subj = "{} (batch of {})".format(batch[0],len(batch))
+            with lazyre.watching(subj,len(batch)):
+                txts = [
+                    first_pass(preprocess(cname,cards[cname],ctx)) for cname in batch
+                ]
+                ntxt = midprocess(mtgl.CRD.join(txts))
+                ntxt = second_pass(ntxt)
+                ntxt = postprocess(ntxt)
+                ntxt = third_pass(ntxt)
+            txts = ntxt.split(mtgl.CRD)
+            if len(txts) != len(batch): raise ValueError
+            for cname,txt in zip(batch,txts): tagged[cname] = txt
+        except Exception:
+            for cname in batch:
+                try:
+                    tagged[cname] = tag(cname,cards[cname],ctx)
+                except lts.LituusException as e:
+                    if errs is None: raise
+                    errs[cname] = e
+                    tagged[cname] = None
+        if progress: progress(min(i+n,ttl),ttl)
+    return tagged
+
 ####
 ## PREPROCESSING
 ####
 
-def preprocess(name,txt):
+def preprocess(name,txt,ctx=None):
     """
      conducts an initial scrub of the oracle text. Then:
        1. replaces card name references with ref-id or self as necessary
@@ -74,10 +160,11 @@ def preprocess(name,txt):
       11. Fix sagas removing newlines inside of the chapter descriptions
     :param name: name of this card
     :param txt: the mtgl text
+    :param ctx: the TaggerContext (if None uses the one set by mtgl.set_n2r)
     :return: preprocessed oracle text
     """
     # a keyword
-    ntxt = tag_ref(name,txt).lower()                                         # 1 & 2
+    ntxt = tag_ref(name,txt,ctx).lower()                                      # 1 & 2
     ntxt = mtgl.re_cycling_pre.sub(r"\1 cycling",ntxt)                       # 3
     ntxt = mtgl.re_landwalk_pre.sub(r"\1 landwalk",ntxt)                     # 3
     ntxt = mtgl.re_word_hack.sub(lambda m: mtgl.word_hacks[m.group(1)],ntxt) # 4
@@ -94,12 +181,13 @@ def preprocess(name,txt):
     ntxt = mtgl.re_saga_chapter.sub(r"\1 — ",ntxt)                           # 11
     return ntxt
 
-def tag_ref(name,txt):
+def tag_ref(name,txt,ctx=None):
     """
      replace occurrences of words in txt that refer to "this card" and names of
      other cards with the ref-id
     :param name: name of card
     :param txt: oracle text
+    :param ctx: the TaggerContext (if None uses the one set by mtgl.set_n2r)
     :return: reference tagged oracle text
     NOTE: this does not handle words like "it" that require contextual understanding
      to determine if "it" referes to this card or something else
@@ -122,8 +210,12 @@ def tag_ref(name,txt):
     # This does not catch cases where there is an 'and' i.e. Throne of Empires
     #  "... named Crown of Empires and Scepter of Empires. For now, have to hack
     #  it using mtgl.re_oth_ref2
-    ntxt = mtgl.re_oth_ref.sub(
-        lambda m: r"{} ob<card ref={}>".format(m.group(1),mtgl.N2R[m.group(2)]),ntxt
+    if ctx: n2r,re_ref = ctx.n2r,ctx.re_ref
+    else: n2r,re_ref = mtgl.N2R,mtgl.re_oth_ref
+    if re_ref is None:
+        raise lts.LituusException(lts.EPARAM,"No name references have been set")
+    ntxt = re_ref.sub(
+        lambda m: r"{} ob<card ref={}>".format(m.group(1),n2r[m.group(2)]),ntxt
     )
     ntxt = mtgl.re_oth_ref2.sub(
         lambda m: r"ob<token ref={}>".format(mtgl.NC2R[m.group(1)]),ntxt
@@ -160,6 +252,81 @@ def first_pass(txt):
      NOTE: many (but not all) of the below require certain replacements/tagging
       to be carried out prior to their execution, rearranging the order of the
       below will negatively effect the results
+     NOTE: the word lists following the counters are tagged in a single scan
+      (see first_pass_vocab) falling back to first_pass_mt. first_pass_lb is
+      the equivalent (slower) lookbehind implementation
+    """
+    ntxt = mtgl.re_quantifier.sub(r"xq<\1>",txt) # tag quantifiers
+    ntxt = mtgl.re_number.sub(r"nu<\1>",ntxt)    # then numbers
+    ntxt = tag_counters(ntxt)                    # markers
+    vtxt = first_pass_vocab().tag(ntxt)          # word lists
+    return vtxt if vtxt is not None else _first_pass_words_(ntxt)
+
+def first_pass_mt(txt):
+    """
+     the sequential implementation of first_pass where word lists are tagged on
+     the untagged spans only (see MaskedText)
+    :param txt: preprocessed oracle txt (lowered case)
+    :return: tagged oracle text
+    """
+    ntxt = mtgl.re_quantifier.sub(r"xq<\1>",txt) # tag quantifiers
+    ntxt = mtgl.re_number.sub(r"nu<\1>",ntxt)    # then numbers
+    ntxt = tag_counters(ntxt)                    # markers
+    return _first_pass_words_(ntxt)
+
+def _first_pass_words_(ntxt):
+    """ tags the word lists of first_pass_mt in ntxt """
+    mt = MaskedText(ntxt)
+
+    # entities
+    mt.tag(mtgl.re_obj_ut,'ob')
+    mt.tag(mtgl.re_lituus_obj_ut,'xo')
+    mt.tag(mtgl.re_lituus_ply_ut,'xp')
+
+    # phases & steps
+    mt.sub_all(mtgl.re_phase,r"ts<\1>")
+    mt.sub(mtgl.re_combat_phase_ut,r"ts<combat>")
+    mt.sub_all(mtgl.re_step1,r"ts<\1>")
+    mt.sub_all(mtgl.re_step2,r"ts<\1>")
+    mt.sub_all(mtgl.re_generic_turn,r"ts<\1>")
+
+    # operators
+    mt.sub(mtgl.re_op,lambda m: "op<{}>".format(mtgl.op[m.group(1)]))
+    mt.sub_all(mtgl.re_num_op,lambda m: _transpose_num_op_(m))
+
+    # english words
+    mt.tag(mtgl.re_prep_ut,'pr')
+    mt.tag(mtgl.re_cond,'cn')
+    mt.tag(mtgl.re_seq_ut,'sq')
+
+    # trigger preambles
+    mt.sub_all(mtgl.re_trigger,r"tp<\1>")
+
+    # ability words, keywords & actions
+    mt.tag(mtgl.re_aw_ut,'aw')
+    mt.tag(mtgl.re_kw_ut,'kw')
+    mt.tag(mtgl.re_kw_act_ut,'ka')
+    mt.tag(mtgl.re_lituus_act_ut,'xa')
+    mt.sub_all(mtgl.re_lituus_target_verb,r"xa<target>\1")
+
+    # effects
+    mt.tag(mtgl.re_effect_ut,'ef')
+
+    # characteristics - done after #s
+    mt.tag(mtgl.re_ch_ut,'ch')
+    mt.sub_all(mtgl.re_ch_pt,r"ch<p/t val=\1\2/\3\4>")
+    mt.tag(mtgl.re_lituus_ch_ut,'xc')
+
+    # zones & qualifiers
+    mt.tag(mtgl.re_zone_ut,'zn')
+    mt.sub_all(mtgl.re_qualifier,r"xl<\1>")
+    return mt.txt
+
+def first_pass_lb(txt):
+    """
+     the lookbehind implementation of first_pass (retained as reference)
+    :param txt: preprocessed oracle txt (lowered case)
+    :return: tagged oracle text
     """
     ntxt = mtgl.re_quantifier.sub(r"xq<\1>",txt) # tag quantifiers
     ntxt = mtgl.re_number.sub(r"nu<\1>",ntxt)    # then numbers
@@ -176,6 +343,184 @@ def first_pass(txt):
     ntxt = mtgl.re_qualifier.sub(r"xl<\1>",ntxt) # qualifiers
     return ntxt
 
+# the first pass word lists (in order) as compiled by first_pass_vocab
+_fp_vocab_ = None
+
+def first_pass_vocab():
+    """
+     returns the Vocab of the first pass word lists (& the substitutions run
+     between them) following the counters, compiling it on first use
+    """
+    global _fp_vocab_
+    if _fp_vocab_ is None:
+        def wl(tid,ts,rule,**kws): return vocab.WordList(tid,ts,rule,**kws)
+        sfx = vocab.LB_SFX
+        s2 = [t for s in mtgl.steps2 for t in (s + " step",s)]
+        _fp_vocab_ = vocab.Vocab([
+            # entities
+            wl('ob',mtgl.obj_tkns.split('|'),sfx),
+            wl('xo',mtgl.lobj_tkns.split('|'),sfx),
+            wl('xp',mtgl.ply_tkns.split('|'),sfx),
+
+            # phases & steps
+            wl('ts',[p + " phase" for p in mtgl.phases],vocab.PFX,vals=mtgl.phases),
+            wl('ts',['combat'],vocab.LB_PFX,neg=" damage"),
+            wl('ts',[s + " step" for s in mtgl.steps1],vocab.PFX,vals=mtgl.steps1),
+            wl('ts',s2,vocab.PFX,vals=[t.replace(" step","") for t in s2]),
+            wl('ts',mtgl.generic_turns,vocab.PFX),
+
+            # operators
+            wl('op',mtgl.op_keys,vocab.WD,vals=[mtgl.op[k] for k in mtgl.op_keys]),
+            vocab.Sub(lazyre.lazy(mtgl.re_num_op),lambda m: _transpose_num_op_(m)),
+
+            # english words
+            wl('pr',mtgl.prepositions,vocab.LB_WD),
+            wl('cn',mtgl.conditionals,vocab.WD),
+            wl('sq',mtgl.seq_tkns.split('|'),sfx),
+
+            # trigger preambles
+            wl('tp',mtgl.triggers,vocab.WD),
+
+            # ability words, keywords & actions
+            wl('aw',mtgl.aw_tkns.split('|'),sfx),
+            wl('kw',mtgl.kw_tkns.split('|'),sfx),
+            wl('ka',mtgl.kwa_tkns.split('|'),sfx),
+            wl('xa',mtgl.la_tkns.split('|'),sfx),
+            wl(
+                'xa',['targets','targeting','targeted'],vocab.WD,
+                vals=['target']*3,sfxs=['s','ing','ed']
+            ),
+
+            # effects
+            wl('ef',mtgl.eff_tkns.split('|'),sfx),
+
+            # characteristics - done after #s
+            wl('ch',mtgl.char_tkns.split('|'),sfx),
+            vocab.Sub(lazyre.lazy(mtgl.re_ch_pt),r"ch<p/t val=\1\2/\3\4>"),
+            wl('xc',mtgl.lch_tkns.split('|'),sfx),
+
+            # zones & qualifiers
+            wl('zn',mtgl.zn_tkns.split('|'),sfx),
+            wl('xl',mtgl.qualifier_tkns.split('|'),vocab.WD),
+        ])
+    return _fp_vocab_
+
+# tag values are replaced with MASK in the masked text. MASK must be a non-word
+# character that does not occur in any of the word list patterns
+MASK = '\x1f'
+MASK_IN = MASK + '<' # preceding characters of a position inside a tag
+
+def mask_tags(txt):
+    """
+     returns txt with the values of all tags replaced with MASK character(s)
+     i.e. 'xq<a> ob<card>' becomes 'xq<\x1f> ob<\x1f\x1f\x1f\x1f>'
+    :param txt: tagged text
+    :return: masked text (same length as txt)
+    """
+    return mtgl.re_tag_value.sub(lambda m: '<' + MASK*(len(m.group())-1),txt)
+
+def _mask_tag_(tkn):
+    """ masks the single tag tkn i.e. 'ob<card>' (falls back to mask_tags) """
+    i = tkn.find('<')
+    if i < 0: return tkn
+    if tkn.find('>') != len(tkn)-1 or tkn.find('<',i+1) > 0: return mask_tags(tkn)
+    return tkn[:i+1] + MASK*(len(tkn)-i-2) + '>'
+
+class MaskedText(object):
+    """
+     a tagged text and its masked copy (see mask_tags). Only words outside of
+     tags can match a word list pattern run against the masked text, and since
+     the masked text is identical to the text outside of tags, the match is
+     identical to one on the text. This removes the need for the costly
+     lookbehind (?<!<[^>]*) and the masked copy is updated in place as tags are
+     added vice re-splitting the text after every substitution
+    """
+    __slots__ = ('txt','_mask')
+
+    def __init__(self,txt):
+        self.txt = txt
+        self._mask = None
+
+    @property
+    def mask(self):
+        if self._mask is None: self._mask = mask_tags(self.txt)
+        return self._mask
+
+    def tag(self,ptrn,tid):
+        """
+         tags matches of ptrn on the untagged spans of the text as tid<group 1>
+        :param ptrn: compiled regex with one group (should not match across a tag)
+        :param tid: the tag id i.e. 'ob'
+        """
+        mask = self.mask
+        txt = self.txt
+        pre = tid + '<'
+        ts,ms,i = [],[],0
+        for m in ptrn.finditer(mask):
+            j,k = m.span()
+            v = m.group(1)
+            ts += [txt[i:j],pre,v,'>']
+            ms += [mask[i:j],pre,MASK*len(v),'>']
+            i = k
+        if i:
+            ts.append(txt[i:])
+            ms.append(mask[i:])
+            self.txt = "".join(ts)
+            self._mask = "".join(ms)
+
+    def sub(self,ptrn,repl):
+        """
+         substitutes matches of ptrn on the untagged spans of the text
+        :param ptrn: compiled regex (should not match across a tag)
+        :param repl: the replacement template or function of the match
+        """
+        mask = self.mask
+        txt = self.txt
+        expand = not callable(repl)
+        ts,ms,i = [],[],0
+        for m in ptrn.finditer(mask):
+            j,k = m.span()
+            r = m.expand(repl) if expand else repl(m)
+            ts += [txt[i:j],r]
+            ms += [mask[i:j],_mask_tag_(r)]
+            i = k
+        if i:
+            ts.append(txt[i:])
+            ms.append(mask[i:])
+            self.txt = "".join(ts)
+            self._mask = "".join(ms)
+
+    def sub_all(self,ptrn,repl):
+        """
+         substitutes matches of ptrn on the entire text (including tag values)
+        :param ptrn: compiled regex
+        :param repl: the replacement template or function of the match
+        """
+        if self._mask is None:
+            self.txt = ptrn.sub(repl,self.txt)
+            return
+
+        # the masked copy can be spliced unless a match starts or ends inside a tag
+        mask = self._mask
+        txt = self.txt
+        expand = not callable(repl)
+        ts,ms,i = [],[],0
+        for m in ptrn.finditer(txt):
+            j,k = m.span()
+            r = m.expand(repl) if expand else repl(m)
+            ts += [txt[i:j],r]
+            if ms is not None:
+                if (j and mask[j-1] in MASK_IN) or mask[k-1] in MASK_IN: ms = None
+                else: ms += [mask[i:j],mask_tags(r)]
+            i = k
+        if i:
+            ts.append(txt[i:])
+            self.txt = "".join(ts)
+            if ms is None: self._mask = None
+            else:
+                ms.append(mask[i:])
+                self._mask = "".join(ms)
+
 def tag_entities(txt):
     """ tags entities (players & objects returntning tagged txt """
     ntxt = mtgl.re_obj.sub(r"ob<\1>",txt)          # tag mtg objects
@@ -0,0 +1,262 @@
+#!/usr/bin/env python
+""" vocab.py
+Copyright (C) 2019  Temporal Inept (temporalinept@mail.com)
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+Defines a single scan tagger of fixed vocabularies (the first pass word lists).
+All terms of all word lists are compiled into one character trie which is
+walked once from each word start of the text, collecting every term of every
+word list that occurs there. The candidates are then resolved in the same order
+the word list regexes would have been run, giving the result of running those
+regexes one after another
+"""
+
+#__name__ = 'vocab'
+__license__ = 'GPLv3'
+__version__ = '0.0.1'
+__date__ = 'August 2020'
+__author__ = 'Temporal Inept'
+__maintainer__ = 'Temporal Inept'
+__email__ = 'temporalinept@mail.com'
+__status__ = 'Development'
+
+import regex as re
+import lituus as lts
+
+# boundary rules of the word list regexes where LB is the lookbehind (?<!<[^>]*)
+#  LB_SFX \bLB(...)(?=(?:s|ing|ed|ion|'s|s'|:|\.|,|\n|"|'| |—|$))
+#  LB_WD  \bLB(...)\b(?!>)
+#  WD     \b(...)\b
+#  PFX    \b(...)
+#  LB_PFX \bLB(...)
+LB_SFX = 0
+LB_WD  = 1
+WD     = 2
+PFX    = 3
+LB_PFX = 4
+SFX = ('s','ing','ed','ion',"'",':','.',',','\n','"',' ','—') # LB_SFX lookahead
+
+class WordList(object):
+    """
+     a word list i.e. mtgl.prepositions and how it is tagged. Terms are matched
+     as the regex alternation would, the first listed term that matches at a
+     position wins
+    """
+    __slots__ = ('terms','rule','reps','vlens','neg')
+
+    def __init__(self,tid,terms,rule,vals=None,sfxs=None,neg=None):
+        """
+         defines the word list
+        :param tid: the tag id i.e. 'pr'
+        :param terms: ordered list of terms
+        :param rule: boundary rule one of LB_SFX,LB_WD,WD,PFX,LB_PFX
+        :param vals: list of tag values of each term (default is the term)
+        :param sfxs: list of text following the tag of each term (default none)
+        :param neg: text that may not follow a term (LB_PFX only)
+        """
+        if rule not in (LB_SFX,LB_WD,WD,PFX,LB_PFX):
+            raise lts.LituusException(lts.EPARAM,"Invalid rule {}".format(rule))
+        vals = vals if vals else terms
+        sfxs = sfxs if sfxs else ['']*len(terms)
+        self.terms = terms
+        self.rule = rule
+        self.reps = ["{}<{}>{}".format(tid,v,s) for v,s in zip(vals,sfxs)]
+
+        # length of the part of the term kept verbatim as the tag value
+        self.vlens = [len(v) if t.startswith(v) else 0 for t,v in zip(terms,vals)]
+        self.neg = neg
+
+    @property
+    def lb(self): return self.rule in (LB_SFX,LB_WD,LB_PFX)
+
+class Sub(object):
+    """ a regex substitution over the entire text run between word lists """
+    __slots__ = ('ptrn','repl')
+
+    def __init__(self,ptrn,repl):
+        """
+        :param ptrn: compiled regex
+        :param repl: the replacement template or function of the match
+        """
+        self.ptrn = ptrn
+        self.repl = repl
+
+class Vocab(object):
+    """
+     a compiled sequence of WordLists and Subs. tag returns the text resulting
+     from tagging the word lists and running the substitutions in order or None
+     where a term of a word list without the tag lookbehind occurs inside a tag
+     (where the sequential regexes would nest tags) and the caller must run the
+     sequential version
+    """
+    __slots__ = ('_steps','_trie','_ws')
+
+    def __init__(self,steps):
+        """
+         compiles the steps
+        :param steps: ordered list of WordList and Sub
+        """
+        self._steps = steps
+        self._trie = {}
+        for i,step in enumerate(steps):
+            if not isinstance(step,WordList): continue
+            for j,t in enumerate(step.terms):
+                node = self._trie
+                for c in t: node = node.setdefault(c,{})
+                node.setdefault(None,[]).append((i,j))
+
+        # a word start that can begin a term
+        fs = sorted({c for c in self._trie if c is not None})
+        self._ws = re.compile(r"\b[{}]".format(re.escape("".join(fs))))
+
+    @property
+    def terms(self):
+        """ the terms of all word lists (in step order) """
+        return [
+            t for step in self._steps if isinstance(step,WordList) for t in step.terms
+        ]
+
+    def tag(self,txt):
+        """
+         tags txt
+        :param txt: text
+        :return: tagged text or None
+        """
+        i = 0
+        while i < len(self._steps):
+            ntxt,i = self._run_(txt,i)
+            if ntxt is None: return None
+            txt = ntxt
+        return txt
+
+    ####
+    # PRIVATE FCTS
+    ####
+
+    def _run_(self,txt,i):
+        """
+         runs the steps from i on until a Sub changes the text
+        :param txt: the text
+        :param i: index of the first step
+        :return: tuple t = (text,index of the next step) (text is None on fallback)
+        """
+        n = len(txt)
+        cands = self._scan_(txt,i)
+
+        # occupied characters (1 inside a tag, 2 inside a verbatim tag value)
+        occ = bytearray(n)
+        for m in _re_tag_.finditer(txt):
+            j,k = m.span()
+            occ[j:k] = b'\x01'*(k-j)
+            v = txt.find('<',j)+1
+            occ[v:k-1] = b'\x02'*(k-1-v)
+
+        claims = {}        # start -> (end,replacement) of tagged terms
+        ends = set()       # ends of tagged terms
+        for si in range(i,len(self._steps)):
+            step = self._steps[si]
+            if isinstance(step,Sub):
+                # the sub runs on the text w/ the terms tagged so far (i.e. a
+                # negative lookahead on a term is only satisfied once tagged)
+                cur = _stitch_(txt,claims)
+                if not step.ptrn.search(cur): continue
+                ntxt = step.ptrn.sub(step.repl,cur)
+                if ntxt != cur: return ntxt,si+1
+                continue
+
+            lb,rule,reps,vlens = step.lb,step.rule,step.reps,step.vlens
+            new = []
+            last = 0
+            for p,j,e in sorted(cands.get(si,())):
+                if p < last: continue
+                if p and not p in ends and _isw_(txt[p-1]): continue
+
+                # the term must not overlap a tag
+                if any(occ[p:e]):
+                    if not lb and _nested_(occ,p,e): return None,0
+                    continue
+
+                # and must satisfy its following boundary
+                nxt = claims[e][1] if e in claims else txt[e:e+3]
+                if rule == LB_SFX:
+                    if nxt and not nxt.startswith(SFX): continue
+                elif rule == LB_WD or rule == WD:
+                    if nxt and (_isw_(nxt[0]) or (rule == LB_WD and nxt[0] == '>')):
+                        continue
+                elif step.neg:
+                    if _follow_(txt,claims,e,len(step.neg)).startswith(step.neg):
+                        continue
+
+                new.append((p,e,reps[j],vlens[j]))
+                last = e
+
+            # tag the terms
+            for p,e,rep,vl in new:
+                claims[p] = (e,rep)
+                ends.add(e)
+                occ[p:e] = b'\x01'*(e-p)
+                if vl: occ[p:p+vl] = b'\x02'*vl
+                if e < n and _isw_(txt[e]): self._walk_(txt,e,si+1,cands)
+        return _stitch_(txt,claims),len(self._steps)
+
+    def _scan_(self,txt,i):
+        """
+         collects the terms of steps i on occurring at each word start of txt
+        :return: dict step index -> list of (start,term index,end)
+        """
+        cands = {}
+        for m in self._ws.finditer(txt): self._walk_(txt,m.start(),i,cands)
+        return cands
+
+    def _walk_(self,txt,p,i,cands):
+        """ adds the terms of steps i on beginning at position p of txt to cands """
+        node = self._trie
+        n = len(txt)
+        k = p
+        while True:
+            ts = node.get(None)
+            if ts:
+                for si,j in ts:
+                    if si >= i: cands.setdefault(si,[]).append((p,j,k))
+            if k == n: break
+            node = node.get(txt[k])
+            if node is None: break
+            k += 1
+
+_re_tag_ = re.compile(r"\w+<[^>]*>")
+
+def _isw_(c): return c.isalnum() or c == '_'
+
+def _nested_(occ,p,e):
+    """
+     determines if a term without lookbehind at p,e overlapping a tag could be
+     matched inside the tag's value by the sequential regex
+    """
+    return occ.find(1,p,e) == -1 and occ.find(0,p,e) == -1
+
+def _follow_(txt,claims,e,k):
+    """ returns (at least) k characters of the tagged text following e """
+    ts,i = [],e
+    while i < len(txt) and sum(len(t) for t in ts) < k:
+        if i in claims:
+            ts.append(claims[i][1])
+            i = claims[i][0]
+        else:
+            ts.append(txt[i])
+            i += 1
+    return "".join(ts)
+
+def _stitch_(txt,claims):
+    """ returns txt with the claimed terms replaced by their tags """
+    if not claims: return txt
+    ts,i = [],0
+    for p in sorted(claims):
+        e,rep = claims[p]
+        ts += [txt[i:p],rep]
+        i = e
+    ts.append(txt[i:])
+    return "".join(ts)
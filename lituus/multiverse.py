@@ -23,16 +23,14 @@ import os
 import sys
 import pickle
 import json
-import requests
 import time
 from hashlib import md5
 import regex as re
 import lituus as lts
 import lituus.mtg as mtg
 import lituus.pack as pack
+import lituus.bundle as bundle
 import lituus.mtgl.mtgl as mtgl
-import lituus.mtgl.tagger as tagger
-import lituus.mtgl.grapher as grapher
 import lituus.mtgcard as mtgcard
 
 # file paths and urls
@@ -41,14 +39,28 @@ jpath     = os.path.join(mtg.pth_resources,'AllCards.json')
 mvpath    = os.path.join(mtg.pth_sto,'multiverse.pkl')
 tcpath    = os.path.join(mtg.pth_sto,'transformed.pkl')
 n2rpath   = os.path.join(mtg.pth_sto,'n2r.pkl')
+bndlpath  = os.path.join(mtg.pth_sto,'multiverse.bundle')
 
-def multiverse(update=0):
+# bundle section names of the multiverse, transformed & name reference dicts
+sections = ['multiverse','transformed','n2r']
+
+# seconds a tagger pattern may take per call and the tagger's patterns may take
+# in total per card while importing cards (cards whose tagging times out are
+# imported without tags, see lazyre.set_timeout)
+re_timeout = 2.0
+re_budget = 10.0
+
+def multiverse(update=0,debug=True,profile=False):
     """
      :param update: one of
         0 = load saved multiverse
         1 = reparse json file and create new multiverse
         2 = download json file and create new multiverse
       https://mtgjson.com/json/AllSets.json 
+     :param debug: if False, cards do not store debugging artifacts (tagged and
+      raw oracle text)
+     :param profile: if set, profiles per card tagging and graphing latencies
+      saving them with the multiverse (see latency)
      :returns multiverse dict
     """
     # files to create
@@ -56,38 +68,18 @@ def multiverse(update=0):
     tc = {}          # transformed cards
     n2r = {}         # name to reference dict
 
-    if update == 0:
-        fin = None
-        try:
-            fin = open(mvpath,'rb')
-            mv = pickle.load(fin)
-            fin.close()
-            return mv
-        except FileNotFoundError:
-            raise lts.LituusException(lts.EIOIN,"Multiverse file does not exist")
-        except pickle.PickleError:
-            raise lts.LituusException(lts.EIOIN,"Error loading multiverse")
-        finally:
-            if fin: fin.close()
-
-    # there is no version checking. on update, downloads AllCards.json & reparses
-    # TODO: Downloading allcards disabled until debugging is complete
-    if update == 2 and False:
-        fout = None
-        try:
-            print("Requesting AllCards.json")
-            jurl = requests.get(url_cards)
-            if jurl.status_code != 200: raise RuntimeError
-            fout = open(jpath,'w')
-            fout.write(jurl.json())
-            fout.close()
-            print("AllCards.json updated")
-        except RuntimeError:
-            raise lts.LituusException(lts.ENET,"Failed to download AllCards.json")
-        except OSError:
-            raise lts.LituusException(lts.EIOOUT,"Failed to save AllCards.json")
-        finally:
-            if fout: fout.close()
+    if update == 0: return load()
+
+    # on update, downloads AllCards.json if it changed & reparses. When the
+    # content is unchanged, loads the saved multiverse instead of rebuilding
+    if update == 2:
+        import lituus.download as download
+        print("Requesting AllCards.json")
+        res = download.fetch(url_cards,jpath,checksum_url=url_cards + '.sha256')
+        if res != download.UPDATED and os.path.exists(bndlpath):
+            print("AllCards.json unchanged")
+            return load()
+        print("AllCards.json updated")
 
     # read in AllCards.json
     fin = None
@@ -97,14 +89,14 @@ def multiverse(update=0):
         mverse = _hack_cards_(json.load(fin)) # fix errors in cards
         fin.close()
     except IOError:
-        raise lts.LituusException(lts.ERRIOIN,"Error reading AllCards.json")
+        raise lts.LituusException(lts.EIOIN,"Error reading AllCards.json")
     finally:
         if fin: fin.close()
 
     # parse the mverse
     print('Tagging the Multiverse')
     start = time.time()
-    import_cards(mv,tc,n2r,mverse)
+    import_cards(mv,tc,n2r,mverse,debug)
     end = time.time()
     print(
         "Imported {} cards and {} transformed cards in {:.2f}s.".format(
@@ -113,129 +105,185 @@ def multiverse(update=0):
     )
     #TODO: add graphing here and do the progress bar
     print('Graphing the Multiverse')
+    if profile: profile_cards(n2r,mverse)
 
-    # pickle the multiverse
-    fout = None
-    try:
-        print("Writing multiverse file")
-        fout = open(mvpath,'wb')
-        pickle.dump(mv,fout)
-        fout.close()
-    except pickle.PickleError:
-        raise lts.LituusException(lts.EIOOUT,"Failed pickling multiverse")
-    except IOError as e:
-        raise lts.LituusException(lts.EIOOUT,"Failed saving multiverse")
-    finally:
-        if fout: fout.close()
+    # bundle the multiverse, transformed & n2r
+    print("Writing multiverse bundle")
+    start = time.time()
+    bundle.write(bndlpath,{'multiverse':mv,'transformed':tc,'n2r':n2r})
+    print("Wrote bundle in {:.2f}s".format(time.time()-start))
 
-    # & then transformed
-    fout = None
-    try:
-        print("Writing transformed file")
-        fout = open(tcpath,'wb')
-        pickle.dump(tc, fout)
-        fout.close()
-    except pickle.PickleError as e:
-        raise lts.LituusException(lts.EIOOUT,"Failed pickling transformed")
-    except IOError as e:
-        raise lts.LituusException(lts.EIOOUT,"Failed saving transformed")
-    finally:
-        if fout: fout.close()
+    return mv
 
-    # & then the n2r dict
-    fout = None
+def load(section='multiverse'):
+    """
+     loads a saved section reading only that section of the bundle (falls back
+     to the pickle files of builds before the bundle)
+    :param section: one of sections
+    :returns the multiverse (a Pack), transformed dict or name reference dict
+    """
+    if section not in sections:
+        raise lts.LituusException(lts.EPARAM,"Unknown section {}".format(section))
+    if os.path.exists(bndlpath): return bundle.read(bndlpath,[section])[section]
+    fin = None
     try:
-        print("Writing Name Reference file")
-        fout = open(n2rpath,'wb')
-        pickle.dump(n2r,fout)
-        fout.close()
-    except pickle.PickleError as e:
-        raise lts.LituusException(lts.EIOOUT,"Failed pickling name reference")
-    except IOError as e:
-        raise lts.LituusException(lts.EIOOUT,"Failed saving name reference")
+        fin = open(dict(zip(sections,[mvpath,tcpath,n2rpath]))[section],'rb')
+        return pickle.load(fin)
+    except FileNotFoundError:
+        raise lts.LituusException(lts.EIOIN,"Multiverse file does not exist")
+    except pickle.PickleError:
+        raise lts.LituusException(lts.EIOIN,"Error loading {}".format(section))
     finally:
-        if fout: fout.close()
-
-    return mv
+        if fin: fin.close()
 
-def import_cards(mv,tc,n2r,mverse):
+def import_cards(mv,tc,n2r,mverse,debug=True):
     """
      imports cards into multiverse mv and transformed cards tc from json mverse
      :param mv: multiverse dict
      :param tc: transformed dict
      :param n2r: the name to reference hash
      :param mverse: json multiverse
+     :param debug: if False, drops debugging artifacts from the cards
     """
-    # calculate the name to ref-id dict and initialize it, skipping banned cards
+    import lituus.mtgl.tagger as tagger
+
+    # calculate the name to ref-id dict and the tagger's context, skipping
+    # banned cards
     for cname in mverse:
-        try:
-            if mverse[cname]['legalities']['commander'] != 'Legal': continue
-            n2r[cname] = md5(cname.encode()).hexdigest()
-        except KeyError:
-            continue
-    mtgl.set_n2r(n2r)
+        if _legal_(mverse[cname]): n2r[cname] = md5(cname.encode()).hexdigest()
+    ctx = tagger.TaggerContext(n2r)
 
-    temp = {}   # tempory dict for cards until splits are combined
-    splits = []
-    i = 0
-    ttl = len(n2r)
+    # harvest the json card dicts then tag the oracle texts in batches
+    dcards = {}
     for cname in n2r: # only enumerate legal names
-        # get the parameters and parse the oracle
-        # TODO: once debugging is done, dont store intermidiate parsing artifacts
-        jcard = dcard = None
         try:
-            # harvest the json card dict and parse the oracle text
-            jcard = mverse[cname]
-            dcard = harvest(cname,jcard)
-            dcard['tag'] = tagger.tag(cname,dcard['oracle'])
+            dcards[cname] = harvest(cname,mverse[cname])
         except KeyError as e: # shouldn't get this
             print("Multiververse error, lost card {}".format(e))
+    tags = _tag_cards_({cname:dcards[cname]['oracle'] for cname in dcards},ctx)
+    for cname in dcards: dcards[cname]['tag'] = tags[cname]
+    _add_cards_(mv,tc,dcards,mverse,debug)
 
-        # determine if the card goes in the multiverse dict or transformed
-        if jcard['layout'] == 'transform' and jcard['side'] == 'b':
-            tc[cname] = mtgcard.MTGCard(dcard)
-        elif jcard['layout'] == 'meld' and jcard['side'] == 'c':
-            tc[cname] = mtgcard.MTGCard(dcard)
-        else: temp[cname] = dcard
+def ingest(fs,debug=True,save=True):
+    """
+     merges the new or changed card records of per-set or per-card mtgjson
+     files into the saved multiverse, updating the name references and tagging
+     only the ingested cards and the saved cards that reference (named,
+     Partner with, Melds with) a newly added or removed name. Saved cards are
+     only retagged if they store their oracle text (built w/ debug)
+     :param fs: list of paths to mtgjson files, each one of a set file
+      ({'data':{..,'cards':[..]}} or {'cards':[..]}), a dict of name -> card
+      (optionally under 'data') or a single card
+     :param debug: if False, ingested cards do not store debugging artifacts
+     :param save: if set, writes the updated bundle
+     :returns dict with the lists of card names 'new', 'changed', 'removed'
+      (no longer legal) and 'retagged' (saved cards referencing new or removed
+      names)
+    """
+    import lituus.mtgl.tagger as tagger
 
-        # save split cards for combining later
-        if jcard['layout'] in ['split','aftermath','adventure']:
-            if not jcard['names'] in splits: splits.append(jcard['names'])
+    mv,tc,n2r = [load(section) for section in sections]
 
-        # update progress
-        i += 1
-        progress_bar(i,ttl)
+    # read the records, keeping only those that are new or changed
+    mverse = {}
+    for f in fs:
+        try:
+            with open(f,'r') as fin: mverse.update(_records_(json.load(fin)))
+        except (OSError,ValueError) as e:
+            raise lts.LituusException(lts.EIOIN,"Error reading {} ({})".format(f,e))
+    mverse = _hack_cards_(mverse)
+    ret = {'new':[],'changed':[],'removed':[],'retagged':[]}
+    dcards = {}
+    for cname in mverse:
+        jcard = mverse[cname]
+        if not _legal_(jcard):
+            if cname in n2r:
+                del n2r[cname]
+                for name in (cname," // ".join(jcard.get('names',[]))):
+                    if mv.has_card(name): mv.del_card(name)
+                    tc.pop(name,None)
+                ret['removed'].append(cname)
+            continue
+        dcard = harvest(cname,jcard)
+        if cname not in n2r: ret['new'].append(cname)
+        elif _changed_(dcard,mv,tc): ret['changed'].append(cname)
+        else: continue
+        dcards[cname] = dcard
+        n2r[cname] = dcard['rid']
 
-    # combine split cards & add to multiverse deleting the original halves
-    for split in splits:
-        name = " // ".join(split)
-        a,b = split[0],split[1]
-        dcard = {
-            'rid': "{} // {}".format(temp[a]['rid'],temp[b]['rid']),
-            'name':name,
-            'mana-cost':"{} // {}".format(temp[a]['mana-cost'],temp[b]['mana-cost']),
-            'oracle':"{} // {}".format(temp[a]['oracle'],temp[b]['oracle']),
-            'tag':"{} // {}".format(temp[a]['tag'],temp[b]['tag']),
-            'super-type':list(set(temp[a]['super-type']+temp[b]['super-type'])),
-            'type':list(set(temp[a]['type'] + temp[b]['type'])),
-            'sub-type':list(set(temp[a]['sub-type'] + temp[b]['sub-type'])),
-            'face-cmc':(temp[a]['face-cmc'],temp[b]['face-cmc']),
-            'cmc':temp[a]['cmc'], # same for both cards
-            'colors':list(set(temp[a]['colors']+temp[b]['colors'])),
-            'color-ident':temp[a]['color-ident'],
-            'sets':temp[a]['sets'],
-            'P/T':None,
-            'loyalty':None
-        }
-        del temp[a]
-        del temp[b]
-        temp[name] = dcard
+    # saved cards w/ an oracle that references a new or removed name (their
+    # references are now tagged or untagged)
+    retag = {}
+    if ret['new'] or ret['removed']:
+        re_chg = re.compile(
+            r"(named|Partner with|Melds with) ({})\b".format(
+                '|'.join(re.escape(cname) for cname in ret['new'] + ret['removed'])
+            )
+        )
+        for card in [mv[cname] for cname in mv] + list(tc.values()):
+            if card.name in dcards: continue
+            try:
+                if re_chg.search(card.oracle): retag[card.name] = card.oracle
+            except lts.LituusException: # oracle text not stored
+                continue
 
-    # release the global n2r in mtgl
-    mtgl.release_n2r()
+    # tag the ingested cards and retag the referencing cards (split cards are
+    # tagged by half)
+    txts = {cname:dcards[cname]['oracle'] for cname in dcards}
+    for cname in retag:
+        if ' // ' in cname: txts.update(zip(cname.split(' // '),retag[cname].split(' // ')))
+        else: txts[cname] = retag[cname]
+    tags = _tag_cards_(txts,tagger.TaggerContext(n2r))
+    for cname in dcards: dcards[cname]['tag'] = tags[cname]
+    for cname in retag:
+        hs = [tags[h] for h in cname.split(' // ')]
+        tag = " // ".join(hs) if None not in hs else None
+        if mv.has_card(cname): mv.add_card(mv[cname].retag(tag))
+        else: tc[cname] = tc[cname].retag(tag)
+        ret['retagged'].append(cname)
 
-    # create the multiverse
-    for cname in temp: mv.add_card(mtgcard.MTGCard(temp[cname]))
+    # split halves are combined from the ingested halves only
+    for cname in list(dcards):
+        jcard = mverse[cname]
+        if jcard['layout'] in ['split','aftermath','adventure']:
+            if not all(name in dcards for name in jcard['names']):
+                print("Incomplete split card {}, skipping".format(cname))
+                del dcards[cname]
+    _add_cards_(mv,tc,dcards,mverse,debug)
+
+    if save:
+        print("Writing multiverse bundle")
+        bundle.write(bndlpath,{'multiverse':mv,'transformed':tc,'n2r':n2r})
+    return ret
+
+def profile_cards(n2r,mverse,n=10):
+    """
+     profiles the tagging and graphing latencies of the legal cards, reporting
+     the change from the previous build and saving the profile
+     :param n2r: the name to reference hash (the legal cards)
+     :param mverse: json multiverse
+     :param n: number of slowest cards to report
+    """
+    import lituus.mtgl.tagger as tagger
+    import lituus.mtgl.lazyre as lazyre
+    import lituus.mtgl.latency as latency
+
+    print('Profiling the Multiverse')
+    dcards = {}
+    for cname in n2r:
+        try:
+            dcards[cname] = harvest(cname,mverse[cname])
+        except KeyError:
+            continue
+    prev = latency.load()
+    to,bgt = lazyre.TIMEOUT,lazyre.BUDGET
+    if to is None: lazyre.set_timeout(re_timeout,re_budget)
+    try:
+        prof = latency.profile(dcards,tagger.TaggerContext(n2r),max(n,20))
+    finally:
+        lazyre.set_timeout(to,bgt)
+    print(latency.report(prof,n,prev))
+    latency.save(prof)
 
 def harvest(name,jcard):
     """
@@ -277,6 +325,130 @@ def harvest(name,jcard):
 
     return dcard
 
+def _legal_(jcard):
+    """ returns True if the json card is legal in commander """
+    try:
+        return jcard['legalities']['commander'] == 'Legal'
+    except KeyError:
+        return False
+
+def _tag_cards_(txts,ctx):
+    """
+     tags the oracle texts in batches w/ the import's pattern timeout & per
+     card budget
+    :param txts: dict card name -> oracle text
+    :param ctx: the TaggerContext
+    :return: dict card name -> tagged text (None if tagging failed)
+    """
+    import lituus.mtgl.tagger as tagger
+    import lituus.mtgl.lazyre as lazyre
+    to,bgt = lazyre.TIMEOUT,lazyre.BUDGET
+    if to is None: lazyre.set_timeout(re_timeout,re_budget)
+    errs = {}
+    try:
+        tags = tagger.tag_many(txts,progress=progress_bar,ctx=ctx,errs=errs)
+    finally:
+        lazyre.set_timeout(to,bgt)
+    if errs:
+        print("\nFailed tagging {} cards".format(len(errs)))
+        for cname in errs: print(" {}".format(errs[cname]))
+    return tags
+
+def _add_cards_(mv,tc,dcards,mverse,debug):
+    """
+     adds the tagged card dicts to multiverse mv or transformed tc combining
+     split cards
+    :param mv: multiverse dict
+    :param tc: transformed dict
+    :param dcards: dict card name -> tagged card dict (see harvest)
+    :param mverse: json multiverse
+    :param debug: if False, drops debugging artifacts from the cards
+    """
+    temp = {}   # tempory dict for cards until splits are combined
+    splits = []
+    for cname in dcards:
+        jcard = mverse[cname]
+        dcard = dcards[cname]
+
+        # determine if the card goes in the multiverse dict or transformed
+        if jcard['layout'] == 'transform' and jcard['side'] == 'b':
+            tc[cname] = mtgcard.MTGCard(dcard,debug)
+        elif jcard['layout'] == 'meld' and jcard['side'] == 'c':
+            tc[cname] = mtgcard.MTGCard(dcard,debug)
+        else: temp[cname] = dcard
+
+        # save split cards for combining later
+        if jcard['layout'] in ['split','aftermath','adventure']:
+            if not jcard['names'] in splits: splits.append(jcard['names'])
+
+    # combine split cards & add to multiverse deleting the original halves
+    for split in splits:
+        name = " // ".join(split)
+        a,b = split[0],split[1]
+        dcard = {
+            'rid': "{} // {}".format(temp[a]['rid'],temp[b]['rid']),
+            'name':name,
+            'layout':temp[a]['layout'],
+            'mana-cost':"{} // {}".format(temp[a]['mana-cost'],temp[b]['mana-cost']),
+            'oracle':"{} // {}".format(temp[a]['oracle'],temp[b]['oracle']),
+            'tag':"{} // {}".format(temp[a]['tag'],temp[b]['tag'])
+                if temp[a]['tag'] is not None and temp[b]['tag'] is not None else None,
+            'super-type':list(set(temp[a]['super-type']+temp[b]['super-type'])),
+            'type':list(set(temp[a]['type'] + temp[b]['type'])),
+            'sub-type':list(set(temp[a]['sub-type'] + temp[b]['sub-type'])),
+            'face-cmc':(temp[a]['face-cmc'],temp[b]['face-cmc']),
+            'cmc':temp[a]['cmc'], # same for both cards
+            'colors':list(set(temp[a]['colors']+temp[b]['colors'])),
+            'color-ident':temp[a]['color-ident'],
+            'sets':temp[a]['sets'],
+            'P/T':None,
+            'loyalty':None
+        }
+        del temp[a]
+        del temp[b]
+        temp[name] = dcard
+
+    # create the multiverse
+    for cname in temp: mv.add_card(mtgcard.MTGCard(temp[cname],debug))
+
+def _records_(js):
+    """
+     returns the card records of the mtgjson js
+    :param js: a set file, dict of name -> card (optionally under 'data') or a
+     single card
+    :return: dict name -> json card
+    """
+    if 'data' in js: js = js['data']
+    if 'cards' in js: return {jcard['name']:jcard for jcard in js['cards']}
+    if 'name' in js and 'layout' in js: return {js['name']:js}
+    return js
+
+# the card dict keys compared & the equivalent MTGCard attributes
+_cmp_ = [
+    ('layout','_layout'),('super-type','_super_type'),('type','_type'),
+    ('sub-type','_sub_type'),('cmc','_cmc'),('mana-cost','_mana_cost'),
+    ('P/T','_pt'),('loyalty','_loyalty'),('sets','_sets')
+]
+def _changed_(dcard,mv,tc):
+    """
+     determines if the card dict differs from the saved card. Split halves are
+     always changed (the saved card is the combined card) as are cards that do
+     not store their oracle text
+    :param dcard: the harvested card dict
+    :param mv: multiverse dict
+    :param tc: transformed dict
+    :return: True if the card changed
+    """
+    cname = dcard['name']
+    card = mv[cname] if mv.has_card(cname) else tc.get(cname)
+    if card is None or card._oracle is None: return True
+    if card._oracle != dcard['oracle']: return True
+    for k,attr in _cmp_:
+        v = getattr(card,attr)
+        if (tuple(dcard[k]) if isinstance(dcard[k],list) else dcard[k]) != v: return True
+    return sorted(dcard['color-ident']) != sorted(card._color_ident) or\
+        sorted(dcard['colors']) != sorted(card._color)
+
 re_draft = re.compile(r"[Dd]raft(?:ing|ed)?")
 def _hack_cards_(jv):
     """
@@ -12,7 +12,7 @@ Defines a set of cards. Can be used for a multiverse or a deck.
 
 #__name__ = 'pack'
 __license__ = 'GPLv3'
-__version__ = '0.0.2'
+__version__ = '0.0.3'
 __date__ = 'March 2020'
 __author__ = 'Temporal Inept'
 __maintainer__ = 'Temporal Inept'
@@ -149,29 +149,7 @@ class Pack(object):
             # get the card object and skip if a land
             card = self._mb[cname]
             if card.is_land(): continue
-
-            # find mana symbols in the casting cost
-            try:
-                mcs = mtg.re_mana_sym.findall(card.mana_cost)
-            except TypeError as e:
-                # cards with no casting cost i.e. suspend will end up here
-                if mv[card].cmc == 0: continue
-                else: raise lts.LituusException(lts.UNDEF,"Unexpected {}".format(e))
-
-            # for ease, recreate manacost list removing extra symbols could be snow,
-            # phyrexian or hybrid and numeral symbols
-            mcs2 = []
-            for mc in mcs:
-                if '/' in mc:
-                    for s in mc.split('/'):
-                        if s in mtg.mana_colors: mcs2.append(s)
-                elif mc in mtg.mana_colors: mcs2.append(mc)
-
-            # iterate the modified list of mana symbols
-            for mc in mcs2:
-                if mcs2.count(mc) > 1:
-                    dbl.append(cname)
-                    break
+            if card.mana.is_double(): dbl.append(cname)
         return dbl
 
     ####
@@ -280,25 +258,9 @@ class Pack(object):
             card = self._mb[cname]
             if card.is_land(): continue
 
-            # get the mana symbols in the cards cost
-            try:
-                mcs = mtg.re_mana_sym.findall(card.mana_cost)
-            except TypeError:
-                # cards with no casting cost i.e. suspend will end up here
-                if mv[card].cmc == 0: continue
-                else: raise lts.LituusException(lts.UNDEF,"Unexpected {}".format(e))
-            mcs2 = []
-
-            # for ease, recreate manacost list removing could be snow, phyrexian
-            # or hybrid and numeral symbols
-            for mc in mcs:
-                if '/' in mc:
-                    for s in mc.split('/'):
-                        if s in mtg.mana_colors: mcs2.append(s)
-                elif mc in mtg.mana_colors: mcs2.append(mc)
-
+            # count the number of different colors in the cost
             try:
-                mch[len(set(mcs2))] += 1
+                mch[len(card.mana.colors)] += 1
             except KeyError:
                 pass
         return mch
@@ -313,8 +275,6 @@ class Pack(object):
         :param cname: name of card in pack to update chist with
         :param chist: the current color histogram
         """
-        for ms in mtg.re_clr_mana_sym.findall(self._mb[cname].mana_cost):
-            if ms in mtg.mana_colors: chist[ms] += self._qty[cname]
-            elif '/' in ms:
-                for s in ms.split('/'):
-                    if s in mtg.mana_colors: chist[s] += self._qty[cname]
\ No newline at end of file
+        qty = self._qty[cname]
+        for i,n in enumerate(self._mb[cname].mana.pips):
+            if n: chist[mtg.mana_colors[i]] += n * qty
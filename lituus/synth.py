@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+""" synth.py
+Copyright (C) 2019  Temporal Inept (temporalinept@mail.com)
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+Synthesizes card corpora at a multiple of a real corpus (i.e. every printing or
+custom cube cards) by recombining the oracle lines of the real cards into new
+cards and measures how importing (tagging & name references), graphing and Pack
+analytics scale. Run as
+ python -m lituus.synth [scale factors] [line type=weight] [path to corpus]
+i.e. python -m lituus.synth 1 10 100 triggered=3 spell=1 (the default corpus is
+the benchmark seed cards and the default mix is the mix of the corpus)
+"""
+
+#__name__ = 'synth'
+__license__ = 'GPLv3'
+__version__ = '0.0.1'
+__date__ = 'August 2020'
+__author__ = 'Temporal Inept'
+__maintainer__ = 'Temporal Inept'
+__email__ = 'temporalinept@mail.com'
+__status__ = 'Development'
+
+import sys
+import time
+import random
+import tracemalloc
+import lituus as lts
+
+# oracle line types
+line_types = ['keyword','activated','triggered','modal','spell']
+_tgr_wds_ = ('When ','Whenever ','At ')
+
+def classify(line):
+    """
+     returns the type of the oracle line
+    :param line: an oracle line (modal lines include their bullets)
+    :return: one of line_types
+    """
+    if '•' in line: return 'modal'
+    if line.startswith(_tgr_wds_): return 'triggered'
+    if ':' in line.split('"')[0]: return 'activated'
+    if not line.endswith(('.','"',')')): return 'keyword'
+    return 'spell'
+
+def fragments(jv):
+    """
+     splits the oracle text of the cards in jv into lines by type
+    :param jv: dict name -> json card
+    :return: tuple t = (dict line type -> list of (line,card name),list of the
+     number of lines of each card)
+    """
+    frags = {lt:[] for lt in line_types}
+    nlines = []
+    for cname in jv:
+        ls = []
+        for l in jv[cname].get('text',"").split('\n'):
+            if not l: continue
+            if l.startswith('•') and ls: ls[-1] += '\n' + l # keep modes together
+            else: ls.append(l)
+        for l in ls: frags[classify(l)].append((l,cname))
+        if ls: nlines.append(len(ls))
+    return frags,nlines
+
+def synthesize(jv,n,mix=None,seed=0):
+    """
+     synthesizes n cards from the cards in jv. Each synthetic card takes the
+     characteristics of a random real card and a random number of lines (as
+     distributed in jv) where line types are drawn from mix. References to the
+     line's card name are replaced by the synthetic name
+    :param jv: dict name -> json card
+    :param n: number of cards to synthesize
+    :param mix: dict line type -> weight (default is the mix of jv)
+    :param seed: random seed
+    :return: dict name -> json card
+    """
+    frags,nlines = fragments(jv)
+    if mix is None: mix = {lt:len(frags[lt]) for lt in line_types}
+    lts_ = [lt for lt in line_types if mix.get(lt) and frags[lt]]
+    if not lts_ or not nlines:
+        raise lts.LituusException(lts.EPARAM,"No lines to synthesize from")
+    ws = [mix[lt] for lt in lts_]
+
+    rnd = random.Random(seed)
+    bases = [c for c in jv if jv[c].get('layout','normal') == 'normal']
+    synth = {}
+    for i in range(n):
+        base = jv[rnd.choice(bases)]
+        name = "Synthetic {} {:06d}".format(base['name'],i)
+        ls = []
+        for lt in rnd.choices(lts_,ws,k=rnd.choice(nlines)):
+            l,src = rnd.choice(frags[lt])
+            ls.append(l.replace(src,name))
+        card = dict(base)
+        card['name'] = name
+        card['text'] = "\n".join(ls)
+        card['legalities'] = {'commander':'Legal'}
+        synth[name] = card
+    return synth
+
+def scale(jv,factors=(1,10,100),mix=None,graph=True,mem=True):
+    """
+     measures importing, graphing and Pack analytics of synthetic corpora of
+     len(jv) * factor cards
+    :param jv: dict name -> json card
+    :param factors: the scale factors
+    :param mix: dict line type -> weight (see synthesize)
+    :param graph: if set graphs the imported cards
+    :param mem: if set, measures the peak memory of the import (a second import
+     run under tracemalloc)
+    :return: list of dicts one per factor with keys factor, cards, import (s),
+     ref (s to compile the name reference matcher), graph (s), hist (s),
+     peak (MB)
+    """
+    import lituus.pack as pack
+    import lituus.multiverse as multiverse
+    import lituus.mtgl.tagger as tagger
+    import lituus.mtgl.grapher as grapher
+    rs = []
+    for f in factors:
+        mverse = multiverse._hack_cards_(synthesize(jv,len(jv)*f,mix))
+        r = {'factor':f,'cards':len(mverse)}
+
+        # the name reference matcher alone, then the full import
+        start = time.perf_counter()
+        _ = tagger.TaggerContext({c:c for c in mverse}).re_ref
+        r['ref'] = time.perf_counter() - start
+        mv = pack.Pack()
+        start = time.perf_counter()
+        multiverse.import_cards(mv,{},{},mverse)
+        r['import'] = time.perf_counter() - start
+
+        r['graph'] = None
+        if graph:
+            start = time.perf_counter()
+            for cname in mv:
+                try:
+                    grapher.graph(
+                        {'name':cname,'tag':mv[cname].tag,'type':mv[cname].type}
+                    )
+                except lts.LituusException:
+                    pass
+            r['graph'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        mv.color_hist(),mv.type_hist(),mv.cmc_hist(),mv.mana_sym_hist()
+        mv.basic_hist(),mv.gold_hist(),mv.cumulative_cmc_hist(),mv.avg_cmc()
+        r['hist'] = time.perf_counter() - start
+
+        r['peak'] = None
+        if mem:
+            tracemalloc.start()
+            try:
+                multiverse.import_cards(pack.Pack(),{},{},mverse)
+                r['peak'] = tracemalloc.get_traced_memory()[1] / 2**20
+            finally:
+                tracemalloc.stop()
+        rs.append(r)
+    return rs
+
+def main(argv):
+    """ prints the scaling curves of the corpus (see module docstring) """
+    import lituus.benchmark as benchmark
+    fs = [int(a) for a in argv[1:] if a.isdigit()]
+    mix = dict(a.split('=') for a in argv[1:] if '=' in a)
+    ps = [a for a in argv[1:] if not a.isdigit() and '=' not in a]
+    for lt in mix:
+        if lt not in line_types:
+            raise lts.LituusException(lts.EPARAM,"Unknown line type {}".format(lt))
+        mix[lt] = float(mix[lt])
+    jv = benchmark.load_corpus(ps[0] if ps else benchmark.pth_seed)
+    rs = scale(jv,fs if fs else [1,10],mix if mix else None)
+    print(
+        "\n{:>6} {:>8} {:>10} {:>8} {:>10} {:>8} {:>9} {:>9}".format(
+            'factor','cards','import s','ref s','graph s','hist s','us/card','peak MB'
+        )
+    )
+    for r in rs:
+        print(
+            "{:>6} {:>8} {:>10.2f} {:>8.3f} {:>10} {:>8.3f} {:>9.0f} {:>9}".format(
+                r['factor'],r['cards'],r['import'],r['ref'],
+                "{:.2f}".format(r['graph']) if r['graph'] is not None else '-',
+                r['hist'],r['import']/r['cards']*1e6,
+                "{:.1f}".format(r['peak']) if r['peak'] is not None else '-'
+            )
+        )
+    return 0
+
+if __name__ == '__main__': sys.exit(main(sys.argv))